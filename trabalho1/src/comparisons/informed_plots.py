@@ -176,7 +176,12 @@ def plot_informed_time_memory(metrics: dict, out_dir: str | Path | None = None):
 
         ('Greedy-Manhattan', metrics.get('Greedy-Manhattan avg time (ms)', 0), metrics.get('Greedy-Manhattan avg peak (KB)', 0)),
         ('Greedy-Euclidean', metrics.get('Greedy-Euclidean avg time (ms)', 0), metrics.get('Greedy-Euclidean avg peak (KB)', 0)),
-        ('Greedy-Inadmissible', metrics.get('Greedy-Inadmissible avg time (ms)', 0), metrics.get('Greedy-Inadmissible avg peak (KB)', 0))
+        ('Greedy-Inadmissible', metrics.get('Greedy-Inadmissible avg time (ms)', 0), metrics.get('Greedy-Inadmissible avg peak (KB)', 0)),
+
+        ('JPS-Manhattan', metrics.get('JPS-Manhattan avg time (ms)', 0), metrics.get('JPS-Manhattan avg peak (KB)', 0)),
+        ('JPS-Euclidean', metrics.get('JPS-Euclidean avg time (ms)', 0), metrics.get('JPS-Euclidean avg peak (KB)', 0)),
+
+        ('ARA*-Manhattan', metrics.get('ARA*-Manhattan avg time (ms)', 0), metrics.get('ARA*-Manhattan avg peak (KB)', 0))
     ]
 
     # PREPARE PLOT
@@ -0,0 +1,115 @@
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+
+Pos = Tuple[int, int]
+
+# MAZES UP TO THIS MANY CELLS ARE FASTER AS ONE BITBOARD THAN AS NUMPY WAVEFRONTS: EVERY LEVEL COSTS
+# A FEW BIG-INT OPERATIONS OVER THE WHOLE BOARD, WHICH BEATS NUMPY'S PER-CALL OVERHEAD ONLY WHILE
+# THE BOARD IS SMALL (ROUGHLY 256 x 256)
+BITBOARD_MAX_CELLS = 1 << 16
+
+
+# THE OPEN CELLS OF A MAZE AS ONE PYTHON INT: CELL (R, C) IS BIT R * STRIDE + C, WITH STRIDE = W + 1
+# THE EXTRA COLUMN IS ALWAYS 0, SO SHIFTING BY 1 NEVER WRAPS A ROW INTO THE NEXT ONE; SHIFTING BY
+# STRIDE MOVES A WHOLE SET OF CELLS ONE ROW; A SET OF CELLS (FRONTIER, REACHED) IS ANOTHER INT
+class MazeBitboard:
+    def __init__(self, maze):
+        self.H, self.W = maze.H, maze.W
+        self.stride = self.W + 1
+        padded = np.zeros((self.H, self.stride), dtype=bool)
+        padded[:, :self.W] = maze.open_mask()
+        self.open = int.from_bytes(np.packbits(padded.reshape(-1), bitorder='little').tobytes(), 'little')
+
+    # BIT OF A SINGLE CELL
+    def bit(self, p: Pos) -> int:
+        return 1 << (p[0] * self.stride + p[1])
+
+    # TRUE WHEN CELL P IS IN THE SET
+    def has(self, bits: int, p: Pos) -> bool:
+        return bits >> (p[0] * self.stride + p[1]) & 1 == 1
+
+    # CELLS OF A SET IN ROW-MAJOR ORDER (COST GROWS WITH THE BOARD, MEANT FOR RESULTS, NOT INNER LOOPS)
+    def cells(self, bits: int) -> List[Pos]:
+        rows, cols = np.divmod(np.flatnonzero(self._unpack(bits)), self.stride)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    # ONE BOOL PER BIT POSITION (H * STRIDE OF THEM)
+    def _unpack(self, bits: int) -> np.ndarray:
+        n = self.H * self.stride
+        raw = np.frombuffer(bits.to_bytes((n + 7) // 8, 'little'), dtype=np.uint8)
+        return np.unpackbits(raw, count=n, bitorder='little').view(bool)
+
+    # BFS LEVELS FROM SOURCE: YIELDS THE CELLS AT DISTANCE 0, 1, 2, ... AS INTS, STOPPING AFTER THE
+    # LEVEL THAT CONTAINS TARGET (WHEN GIVEN) OR WHEN THE COMPONENT IS EXHAUSTED
+    def layers(self, source: Pos, target: Optional[Pos] = None) -> Iterator[int]:
+        s = self.stride
+        frontier = self.bit(source) & self.open
+        goal = self.bit(target) if target is not None else 0
+        unvisited = self.open & ~frontier
+        while frontier:
+            yield frontier
+            if frontier & goal:
+                return
+            frontier = ((frontier << 1) | (frontier >> 1) | (frontier << s) | (frontier >> s)) & unvisited
+            unvisited ^= frontier
+
+    # EVERY CELL REACHABLE FROM SOURCE, AS ONE INT (STOPS EARLY ONCE TARGET IS IN IT)
+    # EACH ROUND FILLS WHOLE RUNS OF OPEN CELLS IN THE FOUR DIRECTIONS WITH LOG-STEP (KOGGE-STONE)
+    # SHIFTS, SO THE ROUNDS FOLLOW THE TURNS OF THE PATHS, NOT THEIR LENGTH
+    def reachable(self, source: Pos, target: Optional[Pos] = None) -> int:
+        goal = self.bit(target) if target is not None else 0
+        reached = self.bit(source) & self.open
+        while reached:
+            before = reached
+            for step in (1, self.stride):
+                reached = _fill_up(reached, self.open, step)
+                reached = _fill_down(reached, self.open, step)
+            if reached == before or reached & goal:
+                break
+        return reached
+
+    # TRUE WHEN P AND Q ARE OPEN AND CONNECTED (ONE FLOOD FILL, NO COMPONENT LABELS)
+    def connected(self, p: Pos, q: Pos) -> bool:
+        if not (0 <= p[0] < self.H and 0 <= p[1] < self.W and 0 <= q[0] < self.H and 0 <= q[1] < self.W):
+            return False
+        return self.has(self.reachable(p, q), q)
+
+    # BFS DISTANCES FROM SOURCE AS AN (H, W) INT32 ARRAY (-1 WHERE NOT REACHED) AND THE NUMBER OF
+    # CELLS REACHED; THE DISTANCES ARE KEPT BIT-SLICED WHILE SEARCHING (PLANE K HOLDS BIT K OF EVERY
+    # DISTANCE), SO A LEVEL COSTS ONE OR AT MOST A FEW ORS INSTEAD OF A WRITE PER CELL
+    def distances(self, source: Pos, target: Optional[Pos] = None) -> Tuple[np.ndarray, int]:
+        planes: List[int] = []
+        reached = 0
+        for d, layer in enumerate(self.layers(source, target)):
+            reached |= layer
+            for k in range(d.bit_length()):
+                if d >> k & 1:
+                    if k == len(planes):
+                        planes.append(0)
+                    planes[k] |= layer
+        dist = np.zeros(self.H * self.stride, dtype=np.int32)
+        for k, plane in enumerate(planes):
+            dist[self._unpack(plane)] |= 1 << k
+        dist[~self._unpack(reached)] = -1
+        field = dist.reshape(self.H, self.stride)[:, :self.W]
+        return np.ascontiguousarray(field), reached.bit_count()
+
+
+# GROWS SET G ALONG RUNS OF OPEN CELLS P TOWARDS HIGHER BITS (STEP 1: EAST, STEP STRIDE: SOUTH)
+# EACH ROUND DOUBLES THE DISTANCE COVERED AND P KEEPS ONLY CELLS WITH THAT MANY OPEN CELLS BEHIND
+# THEM, SO THE LOOP ENDS AFTER LOG2 OF THE LONGEST RUN
+def _fill_up(g: int, p: int, step: int) -> int:
+    while p:
+        g |= p & (g << step)
+        p &= p << step
+        step <<= 1
+    return g
+
+
+# SAME AS _FILL_UP TOWARDS LOWER BITS (WEST, NORTH)
+def _fill_down(g: int, p: int, step: int) -> int:
+    while p:
+        g |= p & (g >> step)
+        p &= p >> step
+        step <<= 1
+    return g
@@ -0,0 +1,214 @@
+from typing import Dict, Iterable, List, Set, Tuple
+import numpy as np
+
+Pos = Tuple[int, int]
+BorderKey = Tuple[str, int, int]
+
+# OPEN RUNS ALONG A BORDER AT LEAST THIS LONG GET TWO ENTRANCES (ONE AT EACH END) INSTEAD OF ONE
+LONG_ENTRANCE = 6
+
+
+# HPA* ABSTRACTION: THE GRID IS SPLIT INTO SIZE x SIZE CLUSTERS; EVERY OPEN RUN ACROSS A CLUSTER
+# BORDER BECOMES AN ENTRANCE (A PAIR OF CELLS, ONE ON EACH SIDE, JOINED BY A COST-1 EDGE) AND THE
+# ENTRANCE CELLS OF A CLUSTER ARE JOINED BY THEIR SHORTEST DISTANCE INSIDE THAT CLUSTER
+# NODES ARE ROW-MAJOR CELL IDS; BORDERS ARE KEYED ('v', CLUSTER ROW, LEFT CLUSTER COL) AND
+# ('h', UPPER CLUSTER ROW, CLUSTER COL)
+class ClusterAbstraction:
+    def __init__(self, maze, size: int = 32):
+        if size < 2:
+            raise ValueError("Cluster size must be at least 2")
+        self.maze = maze
+        self.size = size
+        self.H, self.W = maze.H, maze.W
+        self.rows = -(-self.H // size)
+        self.cols = -(-self.W // size)
+        self.borders: Dict[BorderKey, List[Tuple[int, int]]] = {}
+        self.nodes: Dict[int, List[int]] = {}
+        self.edges: Dict[int, Dict[int, float]] = {}
+        self._build()
+
+    # CLUSTER INDEX (ROW-MAJOR OVER THE CLUSTER GRID) OF A CELL ID
+    def cluster_of(self, i: int) -> int:
+        r, c = divmod(i, self.W)
+        return (r // self.size) * self.cols + c // self.size
+
+    # CELL BOUNDS (R0, R1, C0, C1), END-EXCLUSIVE, OF A CLUSTER
+    def cluster_bounds(self, cid: int) -> Tuple[int, int, int, int]:
+        cr, cc = divmod(cid, self.cols)
+        C = self.size
+        return cr * C, min(self.H, (cr + 1) * C), cc * C, min(self.W, (cc + 1) * C)
+
+    # KEYS OF THE (UP TO FOUR) BORDERS OF A CLUSTER
+    def cluster_borders(self, cid: int) -> List[BorderKey]:
+        cr, cc = divmod(cid, self.cols)
+        keys = []
+        if cc > 0:
+            keys.append(('v', cr, cc - 1))
+        if cc < self.cols - 1:
+            keys.append(('v', cr, cc))
+        if cr > 0:
+            keys.append(('h', cr - 1, cc))
+        if cr < self.rows - 1:
+            keys.append(('h', cr, cc))
+        return keys
+
+    # BUILDS EVERY ENTRANCE AND EVERY INTRA-CLUSTER EDGE
+    def _build(self):
+        mask = self.maze.open_mask()
+        C = self.size
+        if self.cols > 1:
+            self._add_transitions(mask, 'v', np.arange(self.cols - 1), 0, self.H)
+        if self.rows > 1:
+            self._add_transitions(mask, 'h', np.arange(self.rows - 1), 0, self.W)
+        for key, pairs in self.borders.items():
+            for a, b in pairs:
+                self._link(a, b, 1.0)
+        self.nodes = self._collect_nodes(range(self.rows * self.cols))
+        self._intra_edges(list(self.nodes))
+
+    # FINDS THE ENTRANCES OF THE GIVEN BORDER LINES BETWEEN POSITIONS LO AND HI (VECTORIZED)
+    # KIND 'v': LINE b SEPARATES CLUSTER COLUMNS b AND b + 1, POSITIONS ARE ROWS
+    # KIND 'h': LINE b SEPARATES CLUSTER ROWS b AND b + 1, POSITIONS ARE COLUMNS
+    def _add_transitions(self, mask: np.ndarray, kind: str, lines: np.ndarray, lo: int, hi: int):
+        C, W = self.size, self.W
+        edge = (lines + 1) * C - 1
+        if kind == 'v':
+            pair = mask[lo:hi][:, edge] & mask[lo:hi][:, edge + 1]
+        else:
+            pair = (mask[edge, lo:hi] & mask[edge + 1, lo:hi]).T
+        pos = np.arange(lo, hi)
+        prev = np.zeros_like(pair)
+        prev[1:] = pair[:-1]
+        nxt = np.zeros_like(pair)
+        nxt[:-1] = pair[1:]
+        # RUNS ARE ALSO CUT WHERE THE LINE CROSSES INTO ANOTHER CLUSTER
+        first = (pos % C == 0)[:, None]
+        last = ((pos + 1) % C == 0)[:, None]
+        line_s, at_s = np.nonzero((pair & (~prev | first)).T)
+        line_e, at_e = np.nonzero((pair & (~nxt | last)).T)
+        length = at_e - at_s + 1
+        short = length < LONG_ENTRANCE
+        at = np.concatenate([((at_s + at_e) // 2)[short], at_s[~short], at_e[~short]])
+        line = np.concatenate([line_s[short], line_s[~short], line_s[~short]])
+        p = pos[at]
+        b = lines[line]
+        if kind == 'v':
+            a = p * W + edge[line]
+            other = a + 1
+        else:
+            a = edge[line] * W + p
+            other = a + W
+        for k, (pk, bk, ak, ok) in enumerate(zip((p // C).tolist(), b.tolist(), a.tolist(), other.tolist())):
+            key = (kind, pk, bk) if kind == 'v' else (kind, bk, pk)
+            self.borders.setdefault(key, []).append((ak, ok))
+
+    # RECOMPUTES THE ENTRANCES OF ONE BORDER
+    def _rebuild_border(self, mask: np.ndarray, key: BorderKey):
+        kind, i, j = key
+        self.borders.pop(key, None)
+        C = self.size
+        if kind == 'v':
+            self._add_transitions(mask, 'v', np.array([j]), i * C, min(self.H, (i + 1) * C))
+        else:
+            self._add_transitions(mask, 'h', np.array([i]), j * C, min(self.W, (j + 1) * C))
+
+    # ENTRANCE CELLS OF EACH CLUSTER, TAKEN FROM THE BORDERS
+    def _collect_nodes(self, cids: Iterable[int]) -> Dict[int, List[int]]:
+        wanted = set(cids)
+        found: Dict[int, Set[int]] = {}
+        for cid in wanted:
+            for key in self.cluster_borders(cid):
+                for a, b in self.borders.get(key, ()):
+                    for cell in (a, b):
+                        if self.cluster_of(cell) == cid:
+                            found.setdefault(cid, set()).add(cell)
+        return {cid: sorted(cells) for cid, cells in found.items()}
+
+    # ADDS AN UNDIRECTED EDGE TO THE ABSTRACT GRAPH
+    def _link(self, a: int, b: int, cost: float):
+        self.edges.setdefault(a, {})[b] = cost
+        self.edges.setdefault(b, {})[a] = cost
+
+    # WAVEFRONT BFS FROM ONE SEED PER CLUSTER AT ONCE; MOVES NEVER LEAVE THE SEED'S CLUSTER
+    # FILLS DIST FOR EVERY REACHED CELL AND RETURNS THEIR IDS (SO THE CALLER CAN RESET THEM)
+    def _cluster_bfs(self, seeds: np.ndarray, open_flat: np.ndarray, dist: np.ndarray) -> np.ndarray:
+        H, W, C = self.H, self.W, self.size
+        dist[seeds] = 0
+        frontier = seeds
+        visited = [seeds]
+        d = 0
+        while frontier.size:
+            d += 1
+            r, c = np.divmod(frontier, W)
+            nxt = np.concatenate([
+                frontier[r % C != 0] - W,
+                frontier[((r + 1) % C != 0) & (r + 1 < H)] + W,
+                frontier[c % C != 0] - 1,
+                frontier[((c + 1) % C != 0) & (c + 1 < W)] + 1,
+            ])
+            nxt = nxt[open_flat[nxt] & (dist[nxt] < 0)]
+            # DEDUPLICATE WITHOUT SORTING: THE LAST WRITE TO A CELL PICKS ITS ONE SURVIVOR
+            dist[nxt] = np.arange(-2, -2 - nxt.size, -1, dtype=np.int32)
+            nxt = nxt[dist[nxt] == np.arange(-2, -2 - nxt.size, -1, dtype=np.int32)]
+            dist[nxt] = d
+            visited.append(nxt)
+            frontier = nxt
+        return np.concatenate(visited)
+
+    # ALL-PAIRS ENTRANCE DISTANCES INSIDE THE GIVEN CLUSTERS: ROUND K RUNS ONE BFS PER CLUSTER
+    # (FROM ITS K-TH ENTRANCE) FOR ALL CLUSTERS TOGETHER
+    def _intra_edges(self, cids: List[int]):
+        lists = [self.nodes[cid] for cid in cids if len(self.nodes.get(cid, ())) > 1]
+        if not lists:
+            return
+        k_max = max(len(nodes) for nodes in lists)
+        pad = np.full((len(lists), k_max), -1, dtype=np.int64)
+        for row, nodes in enumerate(lists):
+            pad[row, :len(nodes)] = nodes
+        open_flat = self.maze.open_mask().reshape(-1)
+        dist = np.full(self.H * self.W, -1, dtype=np.int32)
+        for k in range(k_max - 1):
+            rows = np.flatnonzero(pad[:, k + 1] >= 0)
+            seeds = pad[rows, k]
+            visited = self._cluster_bfs(seeds, open_flat, dist)
+            targets = pad[rows, k + 1:]
+            d = np.where(targets >= 0, dist[np.maximum(targets, 0)], -1)
+            hit_row, hit_col = np.nonzero(d >= 0)
+            for a, b, cost in zip(seeds[hit_row].tolist(), targets[hit_row, hit_col].tolist(),
+                                  d[hit_row, hit_col].tolist()):
+                self._link(a, b, float(cost))
+            dist[visited] = -1
+
+    # PATCHES THE ABSTRACTION AFTER THE GIVEN CELLS CHANGED IN THE MAZE
+    # ONLY THE CLUSTERS CONTAINING THEM AND THEIR NEIGHBORS ACROSS A REBUILT BORDER ARE RECOMPUTED
+    def update(self, cells: Iterable[Pos]):
+        dirty = {(r // self.size) * self.cols + c // self.size for r, c in cells}
+        if not dirty:
+            return
+        mask = self.maze.open_mask()
+        keys = {key for cid in dirty for key in self.cluster_borders(cid)}
+        affected = set(dirty)
+        for kind, i, j in keys:
+            if kind == 'v':
+                affected.update((i * self.cols + j, i * self.cols + j + 1))
+            else:
+                affected.update((i * self.cols + j, (i + 1) * self.cols + j))
+
+        # DROP EVERY EDGE TOUCHING AN ENTRANCE OF AN AFFECTED CLUSTER
+        for cid in affected:
+            for node in self.nodes.pop(cid, ()):
+                for other in self.edges.pop(node, {}):
+                    neighbors = self.edges.get(other)
+                    if neighbors is not None:
+                        neighbors.pop(node, None)
+                        if not neighbors:
+                            del self.edges[other]
+
+        for key in keys:
+            self._rebuild_border(mask, key)
+        # INTER EDGES OF EVERY BORDER OF THE AFFECTED CLUSTERS (UNCHANGED ONES INCLUDED)
+        for key in {key for cid in affected for key in self.cluster_borders(cid)}:
+            for a, b in self.borders.get(key, ()):
+                self._link(a, b, 1.0)
+        self.nodes.update(self._collect_nodes(affected))
+        self._intra_edges([cid for cid in affected if cid in self.nodes])
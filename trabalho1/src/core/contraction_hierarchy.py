@@ -0,0 +1,180 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+Pos = Tuple[int, int]
+
+# WITNESS SEARCHES GIVE UP AFTER SETTLING THIS MANY NODES (A MISSED WITNESS ONLY ADDS A SHORTCUT)
+WITNESS_SETTLE_LIMIT = 64
+
+INF = float('inf')
+
+
+# CONTRACTION HIERARCHY OVER AN UNDIRECTED UNIT-COST ADJACENCY GRAPH ({CELL: [NEIGHBOR CELLS]})
+# NODES ARE CONTRACTED ONE BY ONE (CHEAPEST EDGE DIFFERENCE FIRST); A SHORTCUT U-V IS ADDED WHEN
+# THE ONLY SHORTEST U-V PATH WENT THROUGH THE CONTRACTED NODE, WHICH IS REMEMBERED FOR UNPACKING
+# A QUERY IS A BIDIRECTIONAL DIJKSTRA THAT ONLY FOLLOWS EDGES TOWARDS HIGHER-RANKED NODES
+class ContractionHierarchy:
+    def __init__(self, graph: Dict[Pos, List[Pos]]):
+        self.cells: List[Pos] = list(graph)
+        self.index: Dict[Pos, int] = {p: i for i, p in enumerate(self.cells)}
+        n = len(self.cells)
+        adj: List[Dict[int, float]] = [
+            {self.index[q]: 1.0 for q in graph[p] if q in self.index} for p in self.cells
+        ]
+        self.rank = [0] * n
+        self.up: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        self.middle: Dict[Tuple[int, int], int] = {}
+        self.shortcuts = 0
+        self._contract(adj)
+
+    # BUILDS THE HIERARCHY FROM A MAZE (SAME ADJACENCY AS MAZE.TO_GRAPH)
+    @classmethod
+    def from_maze(cls, maze) -> 'ContractionHierarchy':
+        return cls(maze.to_graph())
+
+    # SHORTCUTS NEEDED IF U WERE CONTRACTED NOW: [(A, B, COST)] FOR EVERY NEIGHBOR PAIR WITHOUT A WITNESS
+    @staticmethod
+    def _shortcuts(adj: List[Dict[int, float]], u: int) -> List[Tuple[int, int, float]]:
+        neighbors = list(adj[u].items())
+        needed = []
+        heappush, heappop = heapq.heappush, heapq.heappop
+        for k, (a, wa) in enumerate(neighbors[:-1]):
+            targets = {b: wa + wb for b, wb in neighbors[k + 1:]}
+            limit = max(targets.values())
+            pending = set(targets)
+            # LOCAL DIJKSTRA FROM A THAT SKIPS U; STOPS PAST THE LONGEST CANDIDATE SHORTCUT,
+            # ONCE EVERY TARGET IS SETTLED OR AFTER WITNESS_SETTLE_LIMIT NODES
+            dist = {a: 0.0}
+            heap = [(0.0, a)]
+            settled = 0
+            while heap and pending and settled < WITNESS_SETTLE_LIMIT:
+                d, x = heappop(heap)
+                if d > limit:
+                    break
+                if d > dist[x]:
+                    continue
+                settled += 1
+                pending.discard(x)
+                for y, w in adj[x].items():
+                    nd = d + w
+                    if y != u and nd < dist.get(y, INF):
+                        dist[y] = nd
+                        heappush(heap, (nd, y))
+            for b, via in targets.items():
+                if dist.get(b, INF) > via:
+                    needed.append((a, b, via))
+        return needed
+
+    # CONTRACTS EVERY NODE; PRIORITY = EDGE DIFFERENCE + CONTRACTED NEIGHBORS + LEVEL, UPDATED LAZILY
+    # (THE LAST TWO TERMS SPREAD THE CONTRACTION EVENLY, WHICH KEEPS OPEN AREAS FROM GROWING DENSE)
+    def _contract(self, adj: List[Dict[int, float]]):
+        deleted = [0] * len(adj)
+        level = [0] * len(adj)
+
+        def evaluate(u: int):
+            needed = self._shortcuts(adj, u)
+            return 2 * (len(needed) - len(adj[u])) + deleted[u] + level[u], needed
+
+        heap = [(evaluate(u)[0], u) for u in range(len(adj))]
+        heapq.heapify(heap)
+        order = 0
+        while heap:
+            _, u = heapq.heappop(heap)
+            # LAZY UPDATE: RE-EVALUATE AND PUT BACK IF U IS NO LONGER THE CHEAPEST
+            p, needed = evaluate(u)
+            if heap and p > heap[0][0]:
+                heapq.heappush(heap, (p, u))
+                continue
+            for a, b, cost in needed:
+                if cost < adj[a].get(b, INF):
+                    adj[a][b] = cost
+                    adj[b][a] = cost
+                    self.middle[(a, b)] = u
+                    self.middle[(b, a)] = u
+                    self.shortcuts += 1
+            self.rank[u] = order
+            order += 1
+            # REMAINING NEIGHBORS ARE CONTRACTED LATER, SO THEY RANK HIGHER: THESE ARE U'S UPWARD EDGES
+            for v, w in adj[u].items():
+                self.up[u].append((v, w))
+                del adj[v][u]
+                deleted[v] += 1
+                level[v] = max(level[v], level[u] + 1)
+            adj[u] = {}
+
+    # UPWARD DIJKSTRA FROM BOTH ENDS; RETURNS (COST, MEETING NODE, PARENTS F, PARENTS B, SETTLED)
+    def _search(self, s: int, t: int):
+        dist = ({s: 0.0}, {t: 0.0})
+        parent = ({s: -1}, {t: -1})
+        heaps = ([(0.0, s)], [(0.0, t)])
+        best, meet, settled = INF, -1, 0
+        side = 0
+        while heaps[0] or heaps[1]:
+            # ALTERNATE SIDES; A SIDE STOPS ONCE ITS SMALLEST KEY CANNOT IMPROVE THE BEST MEETING
+            if not heaps[side] or heaps[side][0][0] >= best:
+                if not heaps[1 - side] or heaps[1 - side][0][0] >= best:
+                    break
+                side = 1 - side
+            d, u = heapq.heappop(heaps[side])
+            if d > dist[side][u]:
+                side = 1 - side
+                continue
+            settled += 1
+            other = dist[1 - side].get(u)
+            if other is not None and d + other < best:
+                best, meet = d + other, u
+            for v, w in self.up[u]:
+                nd = d + w
+                if nd < dist[side].get(v, INF):
+                    dist[side][v] = nd
+                    parent[side][v] = u
+                    heapq.heappush(heaps[side], (nd, v))
+            side = 1 - side
+        return best, meet, parent[0], parent[1], settled
+
+    # EXPANDS AN EDGE OF THE HIERARCHY INTO THE ORIGINAL NODES (A INCLUDED, B EXCLUDED)
+    def _unpack(self, a: int, b: int, out: List[int]):
+        stack = [(a, b)]
+        while stack:
+            x, y = stack.pop()
+            mid = self.middle.get((x, y))
+            if mid is None:
+                out.append(x)
+            else:
+                stack.append((mid, y))
+                stack.append((x, mid))
+
+    # SHORTEST PATH COST BETWEEN TWO CELLS (NO UNPACKING), INF WHEN THERE IS NO PATH
+    def distance(self, start: Pos, goal: Pos) -> float:
+        s = self.index.get(tuple(start))
+        t = self.index.get(tuple(goal))
+        if s is None or t is None:
+            return INF
+        return self._search(s, t)[0]
+
+    # SHORTEST PATH BETWEEN TWO CELLS: (COST, CELLS FROM START TO GOAL, SETTLED NODES) OR NONE
+    def shortest_path(self, start: Pos, goal: Pos) -> Optional[Tuple[float, List[Pos], int]]:
+        s = self.index.get(tuple(start))
+        t = self.index.get(tuple(goal))
+        if s is None or t is None:
+            return None
+        best, meet, parent_f, parent_b, settled = self._search(s, t)
+        if meet < 0:
+            return None
+        up_f = []
+        i = meet
+        while i != -1:
+            up_f.append(i)
+            i = parent_f[i]
+        up_f.reverse()
+        up_b = []
+        i = parent_b[meet]
+        while i != -1:
+            up_b.append(i)
+            i = parent_b[i]
+        chain = up_f + up_b
+        ids: List[int] = []
+        for a, b in zip(chain, chain[1:]):
+            self._unpack(a, b, ids)
+        ids.append(chain[-1])
+        return best, [self.cells[i] for i in ids], settled
@@ -0,0 +1,87 @@
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+Pos = Tuple[int, int]
+
+
+# ONE CONTRACTED CHAIN OF DEGREE-2 CELLS BETWEEN TWO JUNCTIONS
+# CELLS ARE THE INTERMEDIATE CELLS IN WALKING ORDER FROM START TO END (BOTH EXCLUDED)
+class Corridor(NamedTuple):
+    start: Pos
+    end: Pos
+    cost: float
+    cells: Tuple[Pos, ...]
+
+    # SAME CORRIDOR WALKED IN THE OPPOSITE DIRECTION
+    def reversed(self) -> 'Corridor':
+        return Corridor(self.end, self.start, self.cost, self.cells[::-1])
+
+
+# REMOVES DEAD ENDS: CELLS LEFT WITH DEGREE <= 1 (OUTSIDE KEEP) CANNOT LIE ON A PATH BETWEEN KEPT CELLS
+# PEELING THEM REPEATEDLY DELETES EVERY PENDANT TREE, SO A PERFECT MAZE SHRINKS TO ITS S-G PATH
+def prune_dead_ends(graph: Dict[Pos, List[Pos]], keep: Iterable[Pos] = ()) -> Dict[Pos, List[Pos]]:
+    keep = set(keep)
+    degree = {p: len(neighbors) for p, neighbors in graph.items()}
+    stack = [p for p, d in degree.items() if d <= 1 and p not in keep]
+    removed = set()
+    while stack:
+        p = stack.pop()
+        if p in removed:
+            continue
+        removed.add(p)
+        for q in graph[p]:
+            if q not in removed:
+                degree[q] -= 1
+                if degree[q] <= 1 and q not in keep:
+                    stack.append(q)
+    if not removed:
+        return graph
+    return {p: [q for q in neighbors if q not in removed]
+            for p, neighbors in graph.items() if p not in removed}
+
+
+# WEIGHTED GRAPH WHERE EVERY DEGREE-2 CHAIN OF AN ADJACENCY GRAPH BECOMES A SINGLE EDGE
+# NODES ARE THE JUNCTIONS: CELLS WITH DEGREE != 2 PLUS THE CELLS IN KEEP (E.G. S AND G)
+# WITH PRUNE=TRUE DEAD ENDS ARE REMOVED FIRST (ONLY PATHS BETWEEN KEPT CELLS ARE PRESERVED)
+class CorridorGraph:
+    def __init__(self, graph: Dict[Pos, List[Pos]], keep: Iterable[Pos] = (), prune: bool = True):
+        keep = set(keep)
+        total = len(graph)
+        if prune:
+            graph = prune_dead_ends(graph, keep)
+        self.junctions = {p for p, neighbors in graph.items() if len(neighbors) != 2 or p in keep}
+        self.edges: Dict[Pos, List[Corridor]] = {}
+        for u in self.junctions:
+            out = []
+            for nxt in graph[u]:
+                prev, cur, cells = u, nxt, []
+                # FOLLOW THE CHAIN UNTIL THE NEXT JUNCTION
+                while cur not in self.junctions:
+                    cells.append(cur)
+                    a, b = graph[cur]
+                    prev, cur = cur, (b if a == prev else a)
+                # A CHAIN THAT LOOPS BACK TO ITS OWN JUNCTION NEVER SHORTENS A PATH
+                if cur != u:
+                    out.append(Corridor(u, cur, float(len(cells) + 1), tuple(cells)))
+            self.edges[u] = out
+        self.contracted_cells = len(graph) - len(self.junctions)
+        self.pruned_cells = total - len(graph)
+
+    # BUILDS THE CONTRACTED GRAPH OF A MAZE, KEEPING ITS S AND G AS JUNCTIONS
+    @classmethod
+    def from_maze(cls, maze, keep: Iterable[Pos] = (), prune: bool = True) -> 'CorridorGraph':
+        return cls(maze.to_graph(), keep={maze.start, maze.goal, *keep}, prune=prune)
+
+    # NUMBER OF JUNCTIONS (NODES OF THE REDUCED GRAPH)
+    def __len__(self) -> int:
+        return len(self.junctions)
+
+    # EXPANDS A SEQUENCE OF JUNCTIONS JOINED BY CORRIDORS BACK INTO THE FULL CELL PATH
+    @staticmethod
+    def unpack(corridors: Iterable[Corridor]) -> List[Pos]:
+        path: List[Pos] = []
+        for corridor in corridors:
+            if not path:
+                path.append(corridor.start)
+            path.extend(corridor.cells)
+            path.append(corridor.end)
+        return path
@@ -0,0 +1,57 @@
+from typing import List, Optional, Tuple
+from core.problem import Problem
+from core.maze_representation import Maze
+from core.corridor_graph import Corridor, CorridorGraph
+
+Coord = Tuple[int, int]
+
+# MAZE PROBLEM OVER THE CORRIDOR-CONTRACTED GRAPH: STATES ARE JUNCTIONS, ACTIONS ARE CORRIDORS
+# STEPS ARE WEIGHTED (CORRIDOR LENGTHS): THE ONE-DIRECTIONAL ENGINES AND MM STAY OPTIMAL ON IT, BUT
+# BIDIRECTIONAL BEST-FIRST STOPS AT THE FIRST MEETING, WHICH ASSUMES UNIT STEPS, SO IT REJECTS THIS PROBLEM
+# RECONSTRUCT_PATH UNPACKS THE CORRIDOR CELLS STORED IN NODE.ACTION
+class CorridorProblem(Problem):
+    # START AND GOAL DEFAULT TO THE MAZE S AND G (SWAP THEM FOR THE BACKWARD PROBLEM)
+    def __init__(self, maze: Maze, start: Optional[Coord] = None, goal: Optional[Coord] = None):
+        self.maze = maze
+        self.start = start if start is not None else maze.start
+        self.goal = goal if goal is not None else maze.goal
+        if self.start is None or self.goal is None:
+            raise ValueError("Maze must contain 'S' and 'G'")
+        graph = maze.corridor_graph()
+        if self.start not in graph.junctions or self.goal not in graph.junctions:
+            graph = CorridorGraph.from_maze(maze, keep=(self.start, self.goal))
+        self.graph = graph
+
+    # RETURNS THE INITIAL STATE OF THE PROBLEM
+    @property
+    def initial(self) -> Coord:
+        return self.start
+
+    # CHECKS IF THE GIVEN STATE IS THE GOAL STATE
+    def is_goal(self, state: Coord) -> bool:
+        return state == self.goal
+
+    # RETURNS THE CORRIDORS LEAVING A JUNCTION
+    def actions(self, state: Coord) -> List[Corridor]:
+        return self.graph.edges.get(state, [])
+
+    # RETURNS THE JUNCTION AT THE OTHER END OF THE CORRIDOR
+    def result(self, state: Coord, action: Corridor) -> Coord:
+        return action.end
+
+    # RETURNS THE LENGTH OF THE CORRIDOR (NUMBER OF UNIT STEPS)
+    def action_cost(self, s: Coord, a: Corridor, s2: Coord) -> float:
+        return a.cost
+
+    # CORRIDOR LENGTHS ARE WHOLE NUMBERS OF STEPS: THE LONGEST ONE BOUNDS THE STEP COST
+    def max_step_cost(self) -> Optional[int]:
+        if type(self).action_cost is not CorridorProblem.action_cost:
+            return None
+        costs = [corridor.cost for corridors in self.graph.edges.values() for corridor in corridors]
+        if not all(float(c).is_integer() and c >= 0 for c in costs):
+            return None
+        return int(max(costs, default=1))
+
+    # SAME CONNECTIVITY AS THE UNDERLYING MAZE
+    def unreachable(self) -> bool:
+        return self.maze.connected_if_known(self.start, self.goal) is False
@@ -0,0 +1,109 @@
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+from core.heuristics import HeuristicGrid
+
+Pos = Tuple[int, int]
+
+# DISTANCE STORED FOR CELLS THE SOURCES CANNOT REACH (WALLS AND OTHER COMPONENTS)
+UNREACHED = np.uint32(0xFFFFFFFF)
+
+# HOW MANY GOAL FIELDS STAY IN MEMORY (AN H x W UINT32 ARRAY EACH), LEAST RECENTLY USED GO FIRST
+FIELD_CACHE_SIZE = 8
+_fields: 'OrderedDict[Tuple[str, Pos], np.ndarray]' = OrderedDict()
+
+
+# PARENT-DIRECTION CODES: THE MOVE THAT REACHED A CELL, SAME ORDER AS THE MAZE ACTIONS N, S, O, L
+DIRECTIONS = ('N', 'S', 'O', 'L')
+NO_DIRECTION = -1
+
+
+# UNIT-COST BFS DISTANCES FROM A SET OF CELL IDS TO EVERY CELL, ONE NUMPY WAVEFRONT PER LEVEL
+# RETURNS A FLAT UINT32 ARRAY (H * W) WITH UNREACHED FOR WALLS AND CELLS OUT OF REACH
+def grid_distances(maze, sources: Iterable[int]) -> np.ndarray:
+    dist = np.full(maze.H * maze.W, UNREACHED, dtype=np.uint32)
+    _expand_wavefront(maze, sources, dist, UNREACHED)
+    return dist
+
+
+# DISTANCE AND PARENT-DIRECTION FIELDS OF A BFS FROM SOURCES, AS FLAT ARRAYS (H * W):
+# INT32 DISTANCES (-1 WHERE NOT REACHED) AND INT8 CODES INTO DIRECTIONS (NO_DIRECTION AT SOURCES AND
+# UNREACHED CELLS); WITH A TARGET CELL ID THE EXPANSION STOPS AT THE LEVEL THAT REACHES IT
+def wavefront_fields(maze, sources: Iterable[int], target: int = -1) -> Tuple[np.ndarray, np.ndarray]:
+    n = maze.H * maze.W
+    dist = np.full(n, -1, dtype=np.int32)
+    parent_dir = np.full(n, NO_DIRECTION, dtype=np.int8)
+    _expand_wavefront(maze, sources, dist, -1, parent_dir, target)
+    return dist, parent_dir
+
+
+# CELL IDS OF THE PATH FROM A SOURCE TO CELL I, WALKING THE PARENT-DIRECTION FIELD BACKWARDS
+def wavefront_path(maze, parent_dir: np.ndarray, i: int) -> List[int]:
+    W = maze.W
+    back = (W, -W, 1, -1)
+    ids = [i]
+    step = int(parent_dir[i])
+    while step != NO_DIRECTION:
+        i += back[step]
+        ids.append(i)
+        step = int(parent_dir[i])
+    ids.reverse()
+    return ids
+
+
+# THE WAVEFRONT ITSELF: EACH LEVEL SHIFTS THE FRONTIER'S CELL IDS ONE STEP IN EACH DIRECTION (-W, +W,
+# -1, +1) AND KEEPS THE OPEN, UNREACHED RESULTS; WORK PER LEVEL IS PROPORTIONAL TO THE FRONTIER, NOT
+# TO THE GRID (FULL H x W MASKS WOULD COST THE WHOLE GRID ON EACH OF THOUSANDS OF LEVELS)
+def _expand_wavefront(maze, sources: Iterable[int], dist: np.ndarray, unreached,
+                      parent_dir: Optional[np.ndarray] = None, target: int = -1):
+    H, W = maze.H, maze.W
+    n = H * W
+    open_flat = maze.open_mask().reshape(-1)
+    frontier = np.asarray(list(sources), dtype=np.int64)
+    frontier = frontier[open_flat[frontier]]
+    dist[frontier] = 0
+    # SCRATCH USED TO DROP DUPLICATES FROM A WAVEFRONT WITHOUT SORTING IT
+    owner = np.empty(n, dtype=np.int64)
+    d = 0
+    while frontier.size and (target < 0 or dist[target] == unreached):
+        d += 1
+        c = frontier % W
+        moves = (frontier >= W, frontier < n - W, c > 0, c < W - 1)
+        offsets = (-W, W, -1, 1)
+        parts = [frontier[m] + off for m, off in zip(moves, offsets)]
+        nxt = np.concatenate(parts)
+        fresh = open_flat[nxt] & (dist[nxt] == unreached)
+        nxt = nxt[fresh]
+        order = np.arange(nxt.size)
+        owner[nxt] = order
+        keep = owner[nxt] == order
+        if parent_dir is not None:
+            codes = np.repeat(np.arange(4, dtype=np.int8), [p.size for p in parts])[fresh]
+            parent_dir[nxt[keep]] = codes[keep]
+        nxt = nxt[keep]
+        dist[nxt] = d
+        frontier = nxt
+
+
+# EXACT DISTANCE FROM EVERY CELL TO GOAL AS A READ-ONLY (H, W) UINT32 ARRAY
+# MOVES ARE SYMMETRIC AND UNIT-COST, SO THE REVERSE SEARCH IS A BFS FROM G
+# FIELDS ARE KEPT IN AN LRU KEYED BY (MAZE.CONTENT_HASH(), GOAL)
+def goal_distance_field(maze, goal: Pos) -> np.ndarray:
+    key = (maze.content_hash(), tuple(goal))
+    field = _fields.get(key)
+    if field is not None:
+        _fields.move_to_end(key)
+        return field
+    field = grid_distances(maze, [maze.cell_id(goal)]).reshape(maze.H, maze.W)
+    field.flags.writeable = False
+    _fields[key] = field
+    if len(_fields) > FIELD_CACHE_SIZE:
+        _fields.popitem(last=False)
+    return field
+
+
+# PERFECT HEURISTIC TABLE FOR A PROBLEM'S GOAL (INF WHERE G CANNOT BE REACHED)
+# WITH IT A* AND GREEDY ONLY PUSH THE PATH CELLS AND THEIR NEIGHBORS
+def distance_heuristic_table(problem) -> HeuristicGrid:
+    field = goal_distance_field(problem.maze, problem.goal)
+    return HeuristicGrid(np.where(field == UNREACHED, np.inf, field.astype(np.float64)))
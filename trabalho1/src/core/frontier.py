@@ -0,0 +1,152 @@
+from functools import partial
+from heapq import heappush, heappop
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional
+
+# FRONTIER ENTRIES ARE TUPLES (f, TIEBREAK, ITEM, ...) COMPARED AS A WHOLE; THE TIEBREAK IS UNIQUE,
+# SO TWO ENTRIES NEVER COMPARE PAST IT. BOTH FRONTIERS EXPOSE THE ENTRIES AS A HEAP-ORDERED LIST (.heap)
+ENTRY_ITEM = itemgetter(2)
+
+
+# BINARY HEAP FROM HEAPQ WITH LAZY DUPLICATES: AN ITEM IMPROVED k TIMES IS QUEUED k TIMES AND THE
+# ENGINE SKIPS THE STALE ENTRIES WHEN THEY ARE POPPED (THE DEFAULT: PUSH AND POP ARE HEAPQ ITSELF)
+# COUNTING=TRUE TRADES SPEED FOR THE SAME COUNTERS INDEXEDHEAP KEEPS
+class LazyHeap:
+    def __init__(self, key: Optional[Callable[[tuple], Any]] = None, counting: bool = False):
+        self.heap: List[tuple] = []
+        self.pushes = 0
+        self.pops = 0
+        self.decreases = 0
+        self.peak = 0
+        if counting:
+            self.push = self._counted_push
+            self.pop = self._counted_pop
+        else:
+            self.push = partial(heappush, self.heap)
+            self.pop = partial(heappop, self.heap)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def _counted_push(self, entry: tuple):
+        heappush(self.heap, entry)
+        self.pushes += 1
+        if len(self.heap) > self.peak:
+            self.peak = len(self.heap)
+
+    def _counted_pop(self) -> tuple:
+        self.pops += 1
+        return heappop(self.heap)
+
+
+# INDEXED BINARY HEAP: AT MOST ONE ENTRY PER ITEM (KEY(ENTRY), A CELL ID OR A STATE), WITH THE POSITION
+# OF EACH ITEM KEPT IN POS; PUSHING AN ITEM ALREADY QUEUED REPLACES ITS ENTRY IN PLACE (DECREASE-KEY),
+# SO THE HEAP NEVER HOLDS MORE THAN ONE ENTRY PER ITEM AND NOTHING STALE IS EVER POPPED
+class IndexedHeap:
+    def __init__(self, key: Optional[Callable[[tuple], Any]] = None):
+        self.heap: List[tuple] = []
+        self.pos: Dict[Any, int] = {}
+        self.key = key or ENTRY_ITEM
+        self.pushes = 0
+        self.pops = 0
+        self.decreases = 0
+        self.peak = 0
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.pos
+
+    def contains(self, item: Any) -> bool:
+        return item in self.pos
+
+    # QUEUES AN ENTRY, OR REPLACES THE ONE ALREADY QUEUED FOR THE SAME ITEM (THE NEWEST ENTRY WINS)
+    def push(self, entry: tuple):
+        self.pushes += 1
+        item = self.key(entry)
+        i = self.pos.get(item)
+        if i is None:
+            i = len(self.heap)
+            self.heap.append(entry)
+            self.pos[item] = i
+            if i >= self.peak:
+                self.peak = i + 1
+            self._sift_up(i)
+        elif entry < self.heap[i]:
+            self.decreases += 1
+            self.heap[i] = entry
+            self._sift_up(i)
+        else:
+            self.heap[i] = entry
+            self._sift_down(i)
+
+    # LOWERS THE ENTRY OF AN ITEM THAT IS ALREADY QUEUED
+    def decrease_key(self, entry: tuple):
+        i = self.pos.get(self.key(entry))
+        if i is None:
+            raise ValueError("decrease_key on an item that is not in the heap")
+        if not entry < self.heap[i]:
+            raise ValueError("decrease_key with an entry that is not smaller")
+        self.push(entry)
+
+    # REMOVES AND RETURNS THE SMALLEST ENTRY
+    def pop(self) -> tuple:
+        heap = self.heap
+        last = heap.pop()
+        self.pops += 1
+        if not heap:
+            del self.pos[self.key(last)]
+            return last
+        top = heap[0]
+        del self.pos[self.key(top)]
+        heap[0] = last
+        self.pos[self.key(last)] = 0
+        self._sift_down(0)
+        return top
+
+    def _sift_up(self, i: int):
+        heap, pos, key = self.heap, self.pos, self.key
+        entry = heap[i]
+        while i > 0:
+            p = (i - 1) >> 1
+            above = heap[p]
+            if not entry < above:
+                break
+            heap[i] = above
+            pos[key(above)] = i
+            i = p
+        heap[i] = entry
+        pos[key(entry)] = i
+
+    def _sift_down(self, i: int):
+        heap, pos, key = self.heap, self.pos, self.key
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                break
+            if c + 1 < n and heap[c + 1] < heap[c]:
+                c += 1
+            below = heap[c]
+            if not below < entry:
+                break
+            heap[i] = below
+            pos[key(below)] = i
+            i = c
+        heap[i] = entry
+        pos[key(entry)] = i
+
+
+FRONTIERS = {'lazy': LazyHeap, 'indexed': IndexedHeap}
+
+
+# BUILDS THE FRONTIER AN ENGINE WAS ASKED FOR: A NAME FROM FRONTIERS, OR A FACTORY TAKING THE KEY
+# (A FACTORY LETS A CALLER KEEP THE FRONTIER AND READ ITS COUNTERS AFTER THE SEARCH)
+def make_frontier(frontier, key: Optional[Callable[[tuple], Any]] = None):
+    if isinstance(frontier, str):
+        if frontier not in FRONTIERS:
+            raise ValueError(f"Unknown frontier '{frontier}', expected one of {sorted(FRONTIERS)}")
+        frontier = FRONTIERS[frontier]
+    return frontier(key)
@@ -1,4 +1,6 @@
-from typing import Tuple
+from collections.abc import Mapping
+from typing import Iterator, List, Tuple
+import numpy as np
 
 Pos = Tuple[int, int]
 
@@ -12,4 +14,35 @@ def h_euclidean_distance(a: Pos, b: Pos) -> float:
 
 # INADMISSIBLE HEURISTIC (9 TIMES THE DIFFERENCE OF LINE COORDINATES)
 def h_inadmissible(a: Pos, b: Pos) -> float:
-    return abs(a[0] - a[1]) * 9
\ No newline at end of file
+    return abs(a[0] - a[1]) * 9
+
+
+# HEURISTIC TABLE BACKED BY AN (H, W) ARRAY: READS LIKE THE {(R, C): H} DICTS THE ENGINES TAKE,
+# WITHOUT BUILDING ONE PYTHON ENTRY PER CELL
+class HeuristicGrid(Mapping):
+    def __init__(self, values: np.ndarray):
+        self.values = values
+        self.H, self.W = values.shape
+
+    def __getitem__(self, key: Pos) -> float:
+        r, c = key
+        if not (0 <= r < self.H and 0 <= c < self.W):
+            raise KeyError(key)
+        return float(self.values[r, c])
+
+    def __iter__(self) -> Iterator[Pos]:
+        return ((r, c) for r in range(self.H) for c in range(self.W))
+
+    def __len__(self) -> int:
+        return self.H * self.W
+
+    # VALUES AS A FLAT LIST INDEXED BY CELL ID (SEE SEARCH.INTEGER_STATES.TABLE_BY_ID)
+    def flat_list(self) -> List[float]:
+        return self.values.reshape(-1).tolist()
+
+
+# MANHATTAN DISTANCE TO GOAL FOR EVERY CELL, BUILT WITH NUMPY INSTEAD OF ONE CALL PER CELL
+def manhattan_grid(H: int, W: int, goal: Pos) -> HeuristicGrid:
+    rows = np.abs(np.arange(H, dtype=np.float64) - goal[0])
+    cols = np.abs(np.arange(W, dtype=np.float64) - goal[1])
+    return HeuristicGrid(rows[:, None] + cols[None, :])
@@ -0,0 +1,105 @@
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
+from core.distance_field import UNREACHED, grid_distances
+from core.heuristics import HeuristicGrid
+
+Pos = Tuple[int, int]
+
+# WHERE THE MENUS KEEP LANDMARK TABLES BETWEEN RUNS (trabalho1/data/cache/landmarks)
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / 'data' / 'cache' / 'landmarks'
+
+
+# ALT (A*, LANDMARKS, TRIANGLE INEQUALITY): EXACT BFS DISTANCES FROM K LANDMARKS TO EVERY CELL
+# FOR ANY LANDMARK L, |d(L, s) - d(L, g)| <= d(s, g), SO THE MAXIMUM OVER LANDMARKS IS ADMISSIBLE
+# LANDMARKS ARE PICKED BY FARTHEST-POINT SELECTION INSIDE THE COMPONENT OF S
+class LandmarkTable:
+    def __init__(self, maze, landmarks: np.ndarray, distances: np.ndarray):
+        self.H, self.W = maze.H, maze.W
+        self.landmarks = landmarks
+        self.distances = distances
+
+    # PICKS K LANDMARKS AND RUNS ONE BFS PER LANDMARK
+    @classmethod
+    def build(cls, maze, k: int = 8) -> 'LandmarkTable':
+        if k < 1:
+            raise ValueError("At least one landmark is required")
+        open_ids = np.flatnonzero(maze.open_mask().reshape(-1))
+        if open_ids.size == 0:
+            raise ValueError("Maze has no open cell")
+        seed = maze.cell_id(maze.start) if maze.start is not None else int(open_ids[0])
+
+        # THE FIRST LANDMARK IS THE CELL FARTHEST FROM S; EACH NEXT ONE MAXIMIZES
+        # THE DISTANCE TO THE CLOSEST LANDMARK ALREADY CHOSEN
+        spread = grid_distances(maze, [seed]).astype(np.int64)
+        spread[spread == UNREACHED] = -1
+        landmarks = []
+        rows = []
+        for _ in range(k):
+            pick = int(np.argmax(spread))
+            if spread[pick] <= 0:
+                break
+            row = grid_distances(maze, [pick])
+            landmarks.append(pick)
+            rows.append(row)
+            np.minimum(spread, np.where(row == UNREACHED, -1, row.astype(np.int64)), out=spread)
+        if not rows:
+            landmarks.append(seed)
+            rows.append(grid_distances(maze, [seed]))
+        return cls(maze, np.array(landmarks, dtype=np.int64), np.stack(rows))
+
+    # LOADS THE TABLE FROM CACHE_DIR WHEN A FILE FOR THIS MAZE CONTENT AND K EXISTS,
+    # OTHERWISE BUILDS IT AND WRITES THE FILE
+    @classmethod
+    def load_or_build(cls, maze, k: int = 8, cache_dir=DEFAULT_CACHE_DIR) -> 'LandmarkTable':
+        path = Path(cache_dir) / f"{maze.content_hash()}-k{k}.npz"
+        if path.exists():
+            with np.load(path) as data:
+                distances = data['distances']
+                if distances.shape[1:] == (maze.H * maze.W,):
+                    return cls(maze, data['landmarks'], distances)
+        table = cls.build(maze, k)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # WRITE THEN RENAME: A HALF-WRITTEN FILE IS NEVER PICKED UP BY ANOTHER RUN
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            np.savez(f, landmarks=table.landmarks, distances=table.distances)
+        os.replace(tmp, path)
+        return table
+
+    # ALT LOWER BOUND FOR EVERY CELL TOWARDS GOAL AS A FLAT UINT32 ARRAY (NEVER BELOW MANHATTAN)
+    def heuristic_array(self, goal: Pos) -> np.ndarray:
+        H, W = self.H, self.W
+        rows, cols = np.divmod(np.arange(H * W, dtype=np.int64), W)
+        h = (np.abs(rows - goal[0]) + np.abs(cols - goal[1])).astype(np.uint32)
+        g = goal[0] * W + goal[1]
+        for row in self.distances:
+            dg = row[g]
+            if dg == UNREACHED:
+                continue
+            diff = np.where(row >= dg, row - dg, dg - row)
+            diff[row == UNREACHED] = 0
+            np.maximum(h, diff, out=h)
+        return h
+
+    # HEURISTIC TABLE IN THE FORMAT OF A_STAR_TABLE_SEARCH ({(R, C): H}), BACKED BY THE ARRAY
+    def heuristic_table(self, goal: Pos) -> HeuristicGrid:
+        return HeuristicGrid(self.heuristic_array(goal).astype(np.float64).reshape(self.H, self.W))
+
+    # SINGLE-PAIR BOUND WITH THE FUNCTION_H SIGNATURE (A, B) -> FLOAT
+    def __call__(self, a: Pos, b: Pos) -> float:
+        ia = a[0] * self.W + a[1]
+        ib = b[0] * self.W + b[1]
+        best = abs(a[0] - b[0]) + abs(a[1] - b[1])
+        for row in self.distances:
+            da, db = int(row[ia]), int(row[ib])
+            if da != UNREACHED and db != UNREACHED:
+                best = max(best, abs(da - db))
+        return float(best)
+
+
+# ALT HEURISTIC TABLE FOR A PROBLEM'S GOAL, USING THE MAZE'S CACHED LANDMARKS
+def landmark_heuristic_table(problem, k: int = 8,
+                             cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> HeuristicGrid:
+    return problem.maze.landmarks(k, cache_dir=cache_dir).heuristic_table(problem.goal)
@@ -0,0 +1,126 @@
+# EXTERNAL IMPORTS
+import mmap
+import struct
+from typing import Iterable, Tuple, Optional
+import numpy as np
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.maze_representation import Maze, WALL
+
+# .MZB LAYOUT (LITTLE-ENDIAN):
+#   HEADER: MAGIC 'MZB1', H, W, S_ROW, S_COL, G_ROW, G_COL (UINT32 EACH)
+#   BODY:   H ROWS OF CEIL(W / 8) BYTES, BIT c OF A ROW SET WHEN CELL c IS A WALL (LSB FIRST)
+MAGIC = b'MZB1'
+HEADER = struct.Struct('<4sIIIIII')
+FREE = ord('.')
+START = ord('S')
+GOAL = ord('G')
+
+
+# NUMBER OF BYTES OF ONE PACKED ROW
+def row_bytes(W: int) -> int:
+    return (W + 7) // 8
+
+
+# PACKS A BOOLEAN WALL ROW (OR BLOCK OF ROWS) INTO BYTES
+def _pack_rows(walls: np.ndarray) -> bytes:
+    return np.packbits(walls, axis=-1, bitorder='little').tobytes()
+
+
+# UNPACKS A BLOCK OF PACKED ROWS BACK INTO A BOOLEAN (ROWS, W) WALL ARRAY
+def _unpack_rows(packed: np.ndarray, W: int) -> np.ndarray:
+    return np.unpackbits(packed, axis=1, count=W, bitorder='little').view(bool)
+
+
+# WRITES A MAZE TO A .MZB FILE
+def save_maze_mzb(maze: Maze, file_path: str) -> None:
+    walls = ~maze.open_mask()
+    with open(file_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, maze.H, maze.W, *maze.start, *maze.goal))
+        f.write(_pack_rows(walls))
+
+
+# WRITES A STREAM OF CHARACTER ROWS (UINT8 ARRAYS OF LENGTH W) AS .MZB, KEEPING ONLY ONE ROW IN MEMORY
+def write_mzb_rows(rows: Iterable[np.ndarray], mzb_path: str) -> Tuple[int, int]:
+    H = 0
+    W = None
+    start: Optional[Tuple[int, int]] = None
+    goal: Optional[Tuple[int, int]] = None
+    with open(mzb_path, 'wb') as dst:
+        # HEADER IS REWRITTEN AT THE END, WHEN H, S AND G ARE KNOWN
+        dst.write(b'\0' * HEADER.size)
+        for row in rows:
+            if W is None:
+                W = len(row)
+            elif len(row) != W:
+                raise ValueError("Maze rows must all have the same width")
+            if start is None and (hits := np.flatnonzero(row == START)).size:
+                start = (H, int(hits[0]))
+            if goal is None and (hits := np.flatnonzero(row == GOAL)).size:
+                goal = (H, int(hits[0]))
+            dst.write(_pack_rows(row == WALL))
+            H += 1
+        if start is None or goal is None:
+            raise ValueError("Maze must contain 'S' and 'G'")
+        dst.seek(0)
+        dst.write(HEADER.pack(MAGIC, H, W or 0, *start, *goal))
+    return H, W or 0
+
+
+# CONVERTS A TEXT MAZE TO .MZB, STREAMING ONE ROW AT A TIME (O(W) MEMORY)
+def text_to_mzb(text_path: str, mzb_path: str) -> Tuple[int, int]:
+    def rows():
+        with open(text_path, 'rb') as src:
+            for line in src:
+                line = line.rstrip(b'\r\n')
+                if line.strip() != b'':
+                    yield np.frombuffer(line, dtype=np.uint8)
+    try:
+        return write_mzb_rows(rows(), mzb_path)
+    except ValueError as exc:
+        raise ValueError(f"Maze file '{text_path}': {exc}") from None
+
+
+# READS THE HEADER OF A .MZB BUFFER: (H, W, START, GOAL)
+def read_mzb_header(buffer) -> Tuple[int, int, Tuple[int, int], Tuple[int, int]]:
+    magic, H, W, sr, sc, gr, gc = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a .mzb file")
+    return H, W, (sr, sc), (gr, gc)
+
+
+# MAPS A .MZB FILE AND RETURNS THE ZERO-COPY (H, CEIL(W / 8)) VIEW OF THE PACKED WALLS
+def map_mzb(file_path: str) -> Tuple[np.ndarray, int, int, Tuple[int, int], Tuple[int, int]]:
+    with open(file_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    H, W, start, goal = read_mzb_header(mm)
+    packed = np.frombuffer(mm, dtype=np.uint8, count=H * row_bytes(W), offset=HEADER.size)
+    return packed.reshape(H, row_bytes(W)), H, W, start, goal
+
+
+# LOADS A .MZB FILE INTO A COMPACT MAZE (ONE UNPACK, NO TEXT PARSING)
+def load_maze_mzb(file_path: str) -> Maze:
+    packed, H, W, start, goal = map_mzb(file_path)
+    walls = _unpack_rows(packed, W)
+    cells = np.where(walls, np.uint8(WALL), np.uint8(FREE))
+    cells[start] = START
+    cells[goal] = GOAL
+    maze = Maze(cells, start=start, goal=goal)
+    # THE MASK IS ALREADY KNOWN, NO NEED TO RECOMPUTE IT FROM THE CELLS
+    maze.passable_mask = ~walls
+    return maze
+
+
+# CONVERTS A .MZB FILE BACK TO THE TEXT FORMAT, A BLOCK OF ROWS AT A TIME
+def mzb_to_text(mzb_path: str, text_path: str, block_rows: int = 1024) -> None:
+    packed, H, W, start, goal = map_mzb(mzb_path)
+    with open(text_path, 'wb') as dst:
+        for r0 in range(0, H, block_rows):
+            r1 = min(H, r0 + block_rows)
+            cells = np.where(_unpack_rows(packed[r0:r1], W), np.uint8(WALL), np.uint8(FREE))
+            for (r, c), ch in ((start, START), (goal, GOAL)):
+                if r0 <= r < r1:
+                    cells[r - r0, c] = ch
+            newline = np.full((r1 - r0, 1), ord('\n'), dtype=np.uint8)
+            dst.write(np.hstack([cells, newline]).tobytes())
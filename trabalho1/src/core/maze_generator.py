@@ -1,4 +1,9 @@
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Iterator, BinaryIO, Optional
+import os
+import mmap
+import numpy as np
+
+from core.maze_representation import Maze
 
 # READS A MATRIX FROM A TEXT FILE AND RETURNS IT AS A LIST OF LISTS
 def read_matrix_from_file(file_path: str) -> List[List[str]]:
@@ -26,3 +31,362 @@ def generate_graph_from_matrix(matrix: List[List[str]]) -> Dict[Tuple[int, int],
                 graph[(i, j)] = neighbors
 
     return graph
+
+
+# MEMORY-MAPS A RECTANGULAR MAZE TEXT FILE AND RETURNS THE RAW MAP PLUS ITS LAYOUT (H, W, STRIDE)
+# EVERY ROW HOLDS W CELLS FOLLOWED BY ITS LINE BREAK, SO ROW r STARTS AT BYTE r * STRIDE
+def map_matrix_file(file_path: str) -> Tuple[mmap.mmap, int, int, int]:
+    with open(file_path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    size = len(mm)
+    eol = mm.find(b"\n")
+    if eol < 0:
+        W = size - (1 if size and mm[size - 1] == 13 else 0)
+        return mm, (1 if W else 0), W, size + 1
+    W = eol - (1 if eol > 0 and mm[eol - 1] == 13 else 0)
+    stride = eol + 1
+    # TRAILING LINE BREAKS ARE TRIMMED FIRST, OTHERWISE W + 1 OF THEM WOULD PASS FOR ONE MORE ROW (OF '\n'
+    # BYTES READ AS OPEN CELLS); WHAT IS LEFT MUST END WITH A ROW OF EXACTLY W CELLS
+    end = size
+    while end > 0 and mm[end - 1] in (10, 13):
+        end -= 1
+    if end < W or (end - W) % stride:
+        raise ValueError(f"Maze file '{file_path}' is not rectangular")
+    H = (end - W) // stride + 1
+
+    # CHECK THE LINE BREAK COLUMN WITH A STRIDED VIEW (ONE BYTE PER ROW)
+    if H > 1:
+        breaks = np.ndarray((H - 1,), dtype=np.uint8, buffer=mm, offset=stride - 1, strides=(stride,))
+        if (breaks != ord("\n")).any():
+            raise ValueError(f"Maze file '{file_path}' is not rectangular")
+    return mm, H, W, stride
+
+
+# RETURNS THE (H, W + 1) ZERO-COPY BYTE VIEW OF A MAPPED MAZE (LAST COLUMN = LINE BREAK)
+# WHEN THE FILE DOES NOT END WITH A LINE BREAK THE LAST ROW IS LEFT OUT OF THE VIEW
+def map_rows_view(mm: mmap.mmap, H: int, W: int, stride: int) -> np.ndarray:
+    full_rows = H if H * stride <= len(mm) else H - 1
+    return np.ndarray((full_rows, stride), dtype=np.uint8, buffer=mm)
+
+
+# LOADS A MAZE BACKED BY A MEMORY MAP: NO COPY OF THE FILE IS MADE AND CELLS ARE PAGED IN ON DEMAND
+def load_maze_mmap(file_path: str) -> Maze:
+    mm, H, W, stride = map_matrix_file(file_path)
+
+    # LOCATE S AND G WITH THE MAP'S NATIVE BYTE SEARCH (STOPS AT THE FIRST MATCH)
+    def locate(ch: bytes) -> Tuple[int, int]:
+        idx = mm.find(ch)
+        if idx < 0:
+            raise ValueError(f"Caractere '{ch.decode()}' no encontrado no grid")
+        return divmod(idx, stride)
+
+    return Maze.from_buffer(mm, H, W, stride, start=locate(b"S"), goal=locate(b"G"))
+
+
+# YIELDS EACH BLOCK OF NON-BLANK LINES (AS BYTES, WITHOUT LINE BREAKS) UNTIL EOF
+# WHEN STOP_AFTER_FIRST IS TRUE ONLY THE BLOCK AT THE CURRENT FILE POSITION IS READ
+def _iter_line_blocks(f: BinaryIO, stop_after_first: bool = False) -> Iterator[List[bytes]]:
+    rows: List[bytes] = []
+    for line in f:
+        line = line.rstrip(b"\r\n")
+        if line.strip() == b"":
+            if rows:
+                yield rows
+                if stop_after_first:
+                    return
+                rows = []
+        else:
+            rows.append(line)
+    if rows:
+        yield rows
+
+
+# BUILDS A MAZE FROM ONE BLOCK OF LINES (LIST OF LISTS OR COMPACT UINT8 ARRAY)
+def _maze_from_block(rows: List[bytes], compact: bool) -> Maze:
+    if compact:
+        W = len(rows[0])
+        if any(len(row) != W for row in rows):
+            raise ValueError("Compact mode requires all rows with the same width")
+        return Maze(np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), W))
+    return Maze([list(row.decode("latin-1")) for row in rows])
+
+
+# STREAMS THE MAZES OF A COLLECTION FILE (MAZES SEPARATED BY BLANK LINES), ONE AT A TIME
+# ONLY THE MAZE BEING YIELDED IS KEPT IN MEMORY
+def iter_mazes_from_file(file_path: str, compact: bool = False) -> Iterator[Maze]:
+    with open(file_path, "rb") as f:
+        for rows in _iter_line_blocks(f):
+            yield _maze_from_block(rows, compact)
+
+
+# STREAMS THE MATRICES (LIST OF LISTS) OF A COLLECTION FILE, ONE AT A TIME
+def iter_matrices_from_file(file_path: str) -> Iterator[List[List[str]]]:
+    with open(file_path, "rb") as f:
+        for rows in _iter_line_blocks(f):
+            yield [list(row.decode("latin-1")) for row in rows]
+
+
+# SCANS A COLLECTION FILE ONCE AND RETURNS THE BYTE OFFSET WHERE EACH MAZE STARTS
+def build_maze_index(file_path: str) -> np.ndarray:
+    offsets = []
+    in_block = False
+    pos = 0
+    with open(file_path, "rb") as f:
+        for line in f:
+            blank = line.strip() == b""
+            if not blank and not in_block:
+                offsets.append(pos)
+            in_block = not blank
+            pos += len(line)
+    return np.array(offsets, dtype=np.int64)
+
+
+# RETURNS THE SIDECAR FILE WHERE THE OFFSET INDEX OF A COLLECTION IS CACHED
+def maze_index_path(file_path: str) -> str:
+    return file_path + ".idx.npy"
+
+
+# LOADS THE CACHED OFFSET INDEX, REBUILDING (AND SAVING) IT WHEN MISSING OR OLDER THAN THE FILE
+def load_maze_index(file_path: str, save: bool = True) -> np.ndarray:
+    idx_path = maze_index_path(file_path)
+    if os.path.exists(idx_path) and os.path.getmtime(idx_path) >= os.path.getmtime(file_path):
+        return np.load(idx_path)
+    index = build_maze_index(file_path)
+    if save:
+        try:
+            with open(idx_path, "wb") as f:
+                np.save(f, index)
+        except OSError:
+            pass
+    return index
+
+
+# READS ONLY MAZE K OF A COLLECTION, SEEKING STRAIGHT TO ITS OFFSET
+def read_maze_at(file_path: str, k: int, index: Optional[np.ndarray] = None, compact: bool = False) -> Maze:
+    if index is None:
+        index = load_maze_index(file_path)
+    if not 0 <= k < len(index):
+        raise IndexError(f"Maze {k} out of range: the collection has {len(index)} mazes")
+    with open(file_path, "rb") as f:
+        f.seek(int(index[k]))
+        for rows in _iter_line_blocks(f, stop_after_first=True):
+            return _maze_from_block(rows, compact)
+    raise ValueError(f"Maze {k} not found at offset {int(index[k])}")
+
+
+# KINDS OF PROCEDURAL MAZES (SEEDED, STREAMED ROW BY ROW)
+MAZE_KINDS = ("perfect", "obstacles", "rooms", "open")
+_WALL = ord("#")
+_FREE = ord(".")
+_START = ord("S")
+_GOAL = ord("G")
+
+
+# ELLER'S ALGORITHM: A PERFECT MAZE (SPANNING TREE, KRUSKAL-STYLE SET MERGES) BUILT ONE ROW AT A TIME
+# YIELDS, FOR EACH OF THE `ROWS` CELL ROWS, (EAST, SOUTH): EAST[x] OPENS (y, x)-(y, x+1), SOUTH[x] OPENS (y, x)-(y+1, x)
+# ONLY THE SET LABELS OF THE CURRENT ROW ARE KEPT, SO MEMORY IS O(COLS)
+def _eller_rows(rows: int, cols: int, rng: np.random.Generator,
+                bias: float = 0.5) -> Iterator[Tuple[List[bool], List[bool]]]:
+    labels = list(range(cols))
+    next_label = cols
+    for y in range(rows):
+        last = y == rows - 1
+        parent: Dict[int, int] = {}
+
+        def find(a: int) -> int:
+            root = a
+            while root in parent:
+                root = parent[root]
+            while a != root:
+                parent[a], a = root, parent[a]
+            return root
+
+        # JOIN NEIGHBORS OF DIFFERENT SETS AT RANDOM (ALL OF THEM ON THE LAST ROW)
+        join = (rng.random(max(cols - 1, 0)) < bias).tolist()
+        east = [False] * max(cols - 1, 0)
+        for x in range(cols - 1):
+            if last or join[x]:
+                a, b = find(labels[x]), find(labels[x + 1])
+                if a != b:
+                    parent[b] = a
+                    east[x] = True
+        roots = [find(label) for label in labels]
+        if last:
+            yield east, [False] * cols
+            return
+
+        # EVERY SET GOES DOWN AT LEAST ONCE, OTHERWISE IT WOULD BE CUT OFF
+        drop = (rng.random(cols) < bias).tolist()
+        members: Dict[int, List[int]] = {}
+        for x, root in enumerate(roots):
+            members.setdefault(root, []).append(x)
+        south = [False] * cols
+        for xs in members.values():
+            opened = [x for x in xs if drop[x]]
+            if not opened:
+                opened = [xs[int(rng.integers(len(xs)))]]
+            for x in opened:
+                south[x] = True
+
+        # CELLS THAT DID NOT GO DOWN START A NEW SET ON THE NEXT ROW
+        labels = []
+        for x in range(cols):
+            if south[x]:
+                labels.append(roots[x])
+            else:
+                labels.append(next_label)
+                next_label += 1
+        yield east, south
+
+
+# PERFECT MAZE: CELLS ON ODD COORDINATES, WALLS BETWEEN THEM; S BOTTOM-LEFT, G TOP-RIGHT
+def _perfect_rows(H: int, W: int, rng: np.random.Generator) -> Iterator[np.ndarray]:
+    rows, cols = (H - 1) // 2, (W - 1) // 2
+    wall_row = np.full(W, _WALL, dtype=np.uint8)
+    yield wall_row
+    for y, (east, south) in enumerate(_eller_rows(rows, cols, rng)):
+        row = wall_row.copy()
+        row[1:2 * cols:2] = _FREE
+        row[2:2 * cols - 1:2][np.array(east, dtype=bool)] = _FREE
+        if y == 0:
+            row[2 * cols - 1] = _GOAL
+        if y == rows - 1:
+            row[1] = _START
+        yield row
+        below = wall_row.copy()
+        below[1:2 * cols:2][np.array(south, dtype=bool)] = _FREE
+        yield below
+    if H % 2 == 0:
+        yield wall_row
+
+
+# RANDOM OBSTACLES: EACH CELL IS A WALL WITH PROBABILITY `DENSITY` (S AND G MAY END UP DISCONNECTED)
+def _obstacle_rows(H: int, W: int, rng: np.random.Generator, density: float) -> Iterator[np.ndarray]:
+    for r in range(H):
+        row = np.where(rng.random(W) < density, np.uint8(_WALL), np.uint8(_FREE))
+        if r == 0:
+            row[W - 1] = _GOAL
+        if r == H - 1:
+            row[0] = _START
+        yield row
+
+
+# OPEN FIELD: NO WALLS AT ALL
+def _open_rows(H: int, W: int) -> Iterator[np.ndarray]:
+    for r in range(H):
+        row = np.full(W, _FREE, dtype=np.uint8)
+        if r == 0:
+            row[W - 1] = _GOAL
+        if r == H - 1:
+            row[0] = _START
+        yield row
+
+
+# ONE RANDOM ROOM (INCLUSIVE BOUNDS Y0, Y1, X0, X1) PER BLOCK OF A BLOCK ROW, KEEPING A 1-CELL MARGIN
+def _block_rooms(i: int, cols: int, room: int, rng: np.random.Generator) -> List[Tuple[int, int, int, int]]:
+    inner = room - 2
+    h, w = rng.integers(1, inner + 1, size=(2, cols))
+    y0 = i * room + 1 + (rng.random(cols) * (inner - h + 1)).astype(np.int64)
+    x0 = np.arange(cols) * room + 1 + (rng.random(cols) * (inner - w + 1)).astype(np.int64)
+    return list(zip(y0.tolist(), (y0 + h - 1).tolist(), x0.tolist(), (x0 + w - 1).tolist()))
+
+
+# ROOMS AND CORRIDORS: ONE ROOM PER ROOM x ROOM BLOCK, CONNECTED ALONG A PERFECT MAZE OVER THE BLOCKS
+# (PLUS A FEW EXTRA CORRIDORS THAT CREATE LOOPS); ONLY ONE BLOCK ROW (ROOM x W CELLS) IS BUFFERED
+def _room_rows(H: int, W: int, rng: np.random.Generator, room: int, loops: float) -> Iterator[np.ndarray]:
+    rows, cols = H // room, W // room
+
+    def center(rect):
+        y0, y1, x0, x1 = rect
+        return (y0 + y1) // 2, (x0 + x1) // 2
+
+    current = _block_rooms(0, cols, room, rng)
+    incoming: List[Optional[int]] = [None] * cols
+    for i, (east, south) in enumerate(_eller_rows(rows, cols, rng)):
+        top = i * room
+        block = np.full((room, W), _WALL, dtype=np.uint8)
+
+        def carve(r0, r1, c0, c1):
+            r0, r1 = sorted((r0, r1))
+            c0, c1 = sorted((c0, c1))
+            block[r0 - top:r1 - top + 1, c0:c1 + 1] = _FREE
+
+        for y0, y1, x0, x1 in current:
+            carve(y0, y1, x0, x1)
+
+        # CORRIDORS COMING FROM THE BLOCK ROW ABOVE: DOWN FROM THE TOP EDGE INTO THE ROOM
+        for j, col in enumerate(incoming):
+            if col is not None:
+                carve(top, current[j][0], col, col)
+
+        # EAST CORRIDORS: ROOM -> MARGIN COLUMN -> NEIGHBOR ROOM
+        extra = (rng.random(max(cols - 1, 0)) < loops).tolist()
+        for j in range(cols - 1):
+            if east[j] or extra[j]:
+                (ya, xa), (yb, xb) = center(current[j]), center(current[j + 1])
+                edge = (j + 1) * room - 1
+                carve(ya, ya, xa, edge)
+                carve(ya, yb, edge, edge)
+                carve(yb, yb, edge, xb)
+
+        # SOUTH CORRIDORS: ROOM -> BOTTOM MARGIN ROW -> COLUMN OF THE ROOM BELOW (FINISHED ON THE NEXT BLOCK ROW)
+        below = _block_rooms(i + 1, cols, room, rng) if i + 1 < rows else []
+        extra = (rng.random(cols) < loops).tolist()
+        incoming = [None] * cols
+        for j in range(cols):
+            if below and (south[j] or extra[j]):
+                (ya, xa), (yb, xb) = center(current[j]), center(below[j])
+                edge = top + room - 1
+                carve(ya, edge, xa, xa)
+                carve(edge, edge, xa, xb)
+                incoming[j] = xb
+
+        if i == 0:
+            r, c = center(current[cols - 1])
+            block[r - top, c] = _GOAL
+        if i == rows - 1:
+            r, c = center(current[0])
+            block[r - top, c] = _START
+        yield from block
+        current = below
+
+    for _ in range(H - rows * room):
+        yield np.full(W, _WALL, dtype=np.uint8)
+
+
+# YIELDS THE ROWS (UINT8 ARRAYS OF LENGTH W) OF A PROCEDURAL MAZE OF THE GIVEN KIND
+# THE SAME SEED ALWAYS PRODUCES THE SAME MAZE; ONLY O(W) CELLS ARE ALIVE AT ANY TIME
+def generate_maze_rows(kind: str, H: int, W: int, seed: Optional[int] = None,
+                       density: float = 0.3, room: int = 8, loops: float = 0.1) -> Iterator[np.ndarray]:
+    if H < 1 or W < 1 or H * W < 2:
+        raise ValueError("Maze must have at least two cells")
+    # SIZE CHECKS HAPPEN HERE, BEFORE ANY ROW IS PRODUCED (OR ANY FILE IS CREATED)
+    if kind == "perfect" and ((H - 1) // 2) * ((W - 1) // 2) < 2:
+        raise ValueError("A perfect maze needs at least 3x5 or 5x3 cells")
+    if kind == "rooms" and (room < 3 or (H // room) * (W // room) < 2):
+        raise ValueError("Maze too small for the requested room size (two room x room blocks at least)")
+    rng = np.random.default_rng(seed)
+    if kind == "perfect":
+        return _perfect_rows(H, W, rng)
+    if kind == "obstacles":
+        return _obstacle_rows(H, W, rng, density)
+    if kind == "rooms":
+        return _room_rows(H, W, rng, room, loops)
+    if kind == "open":
+        return _open_rows(H, W)
+    raise ValueError(f"Unknown maze kind '{kind}', expected one of {MAZE_KINDS}")
+
+
+# GENERATES A MAZE STRAIGHT TO DISK, ROW BY ROW (TEXT, OR BIT-PACKED .MZB WHEN THE PATH ENDS WITH .MZB)
+def generate_maze_file(file_path: str, kind: str, H: int, W: int, seed: Optional[int] = None, **options) -> str:
+    rows = generate_maze_rows(kind, H, W, seed=seed, **options)
+    if str(file_path).endswith(".mzb"):
+        from core.maze_binary import write_mzb_rows
+        write_mzb_rows(rows, file_path)
+        return file_path
+    newline = b"\n"
+    with open(file_path, "wb") as f:
+        for row in rows:
+            f.write(row.tobytes())
+            f.write(newline)
+    return file_path
@@ -7,12 +7,16 @@ Coord = Tuple[int, int]
 # REPRESENTS A MAZE SEARCH PROBLEM USING THE PROBLEM BASE CLASS
 class MazeProblem(Problem):
     # INITIALIZES THE MAZE PROBLEM WITH START AND GOAL POSITIONS
-    def __init__(self, maze: Maze):
+    # THEY DEFAULT TO THE MAZE S AND G; ANY OTHER OPEN CELLS CAN BE GIVEN (ONE MAZE, MANY QUERIES)
+    def __init__(self, maze: Maze, start: Optional[Coord] = None, goal: Optional[Coord] = None):
         self.maze = maze
-        self.start = maze.start
-        self.goal = maze.goal
+        self.start = tuple(start) if start is not None else maze.start
+        self.goal = tuple(goal) if goal is not None else maze.goal
         if self.start is None or self.goal is None:
             raise ValueError("Maze must contain 'S' and 'G'")
+        for p in (self.start, self.goal):
+            if not (maze.in_bounds(p) and maze.passable(p)):
+                raise ValueError(f"Cell {p} is not an open cell of the maze")
 
     # RETURNS THE INITIAL STATE OF THE PROBLEM
     @property
@@ -21,7 +25,7 @@ class MazeProblem(Problem):
 
     # CHECKS IF THE GIVEN STATE IS THE GOAL STATE
     def is_goal(self, state: Coord) -> bool:
-        return self.maze.goal_test(state)
+        return state == self.goal
 
     # RETURNS POSSIBLE ACTIONS FROM THE CURRENT STATE
     def actions(self, state: Coord):
@@ -35,8 +39,19 @@ class MazeProblem(Problem):
     def action_cost(self, s: Coord, a: Coord, s2: Coord) -> float:
         return self.maze.step_cost(s, a, s2)
 
+    # EVERY MAZE STEP COSTS 1; A SUBCLASS THAT CHANGES THE COSTS MUST REPORT THEM ITSELF
+    def max_step_cost(self) -> Optional[int]:
+        if type(self).action_cost is not MazeProblem.action_cost or type(self.maze).step_cost is not Maze.step_cost:
+            return None
+        return 1
+
     # COMPUTES THE HEURISTIC VALUE USING A GIVEN HEURISTIC FUNCTION
     def heuristic(self, s: Coord, goal: Optional[Coord] = None, function_h: Optional[Callable[[Coord, Coord], float]] = None) -> float:
         if function_h and goal is not None:
             return function_h(s, goal)
         return 0.0
+
+    # USES THE MAZE COMPONENT LABELS: S AND G IN DIFFERENT COMPONENTS MEANS NO PATH
+    # (A MAPPED MAZE WITHOUT CACHED LABELS ANSWERS FALSE RATHER THAN READ THE WHOLE FILE)
+    def unreachable(self) -> bool:
+        return self.maze.connected_if_known(self.start, self.goal) is False
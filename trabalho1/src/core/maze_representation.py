@@ -1,23 +1,118 @@
-from typing import List, Tuple
+import hashlib
+from typing import List, Optional, Tuple, Union
+import numpy as np
 
 Grid = List[List[str]]
 Pos = Tuple[int, int]
 
+# BYTE CODES USED BY THE COMPACT (NUMPY) GRID
+WALL = ord('#')
+START = ord('S')
+GOAL = ord('G')
+
 
 # REPRESENTS THE STATE SPACE FOR THE MAZE PROBLEM
 class Maze:
-    def __init__(self, grid: Grid):
-        self.grid = grid
-        self.H = len(grid)
-        self.W = len(grid[0]) if self.H > 0 else 0
-        self.start = self._find('S')
-        self.goal = self._find('G')
+    # ACCEPTS A LIST OF LISTS (CLASSIC MODE) OR A (H, W) UINT8 ARRAY (COMPACT MODE)
+    # START AND GOAL MAY BE GIVEN WHEN THE CALLER ALREADY KNOWS THEM (SKIPS THE SCAN)
+    def __init__(self, grid: Union[Grid, np.ndarray], start: Optional[Pos] = None, goal: Optional[Pos] = None):
+        if isinstance(grid, np.ndarray):
+            cells = np.ascontiguousarray(grid, dtype=np.uint8)
+            if cells.ndim != 2:
+                raise ValueError("Compact grid must be a 2D array")
+            # FLAT VIEW OF THE CHARACTERS: INDEXING IT IS CHEAPER THAN INDEXING THE ARRAY
+            self._init_compact(cells, memoryview(cells).cast('B'), cells.shape[1], lazy=False)
+        else:
+            self.cells = None
+            self._grid = grid
+            self.H = len(grid)
+            self.W = len(grid[0]) if self.H > 0 else 0
+            self._flat = None
+            self._stride = self.W
+            self.lazy = False
+        self.passable_mask = None
+        self._adjacency = None
+        self._components = None
+        self._corridors = None
+        self._clusters = {}
+        self._hierarchy = None
+        self._landmarks = {}
+        self._hash = None
+        self._bitboard = None
+        self.start = start if start is not None else self._find('S')
+        self.goal = goal if goal is not None else self._find('G')
+
+    # WRAPS A RAW BYTE BUFFER (E.G. AN MMAP) WITH ROWS OF `STRIDE` BYTES WITHOUT COPYING IT
+    # CELLS ARE READ ON DEMAND, SO ONLY THE PAGES TOUCHED BY THE SEARCH ARE LOADED
+    @classmethod
+    def from_buffer(cls, buffer, H: int, W: int, stride: int,
+                    start: Optional[Pos] = None, goal: Optional[Pos] = None) -> 'Maze':
+        maze = cls.__new__(cls)
+        cells = np.ndarray((H, W), dtype=np.uint8, buffer=buffer, strides=(stride, 1))
+        maze._init_compact(cells, memoryview(buffer).cast('B'), stride, lazy=True)
+        maze._buffer = buffer
+        maze.passable_mask = None
+        maze._adjacency = None
+        maze._components = None
+        maze._corridors = None
+        maze._clusters = {}
+        maze._hierarchy = None
+        maze._landmarks = {}
+        maze._hash = None
+        maze._bitboard = None
+        maze.start = start if start is not None else maze._find('S')
+        maze.goal = goal if goal is not None else maze._find('G')
+        return maze
+
+    # SHARED SETUP FOR THE ARRAY-BACKED MODES
+    def _init_compact(self, cells: np.ndarray, flat, stride: int, lazy: bool):
+        self.cells = cells
+        self._grid = None
+        self.H, self.W = cells.shape
+        self._flat = flat
+        self._stride = stride
+        self.lazy = lazy
+
+    # TRUE WHEN THE MAZE IS BACKED BY A NUMPY ARRAY (IN MEMORY OR MAPPED)
+    @property
+    def compact(self) -> bool:
+        return self.cells is not None
+
+    # LIST OF LISTS VIEW OF THE GRID (DECODED LAZILY IN COMPACT MODE)
+    @property
+    def grid(self) -> Grid:
+        if self._grid is None:
+            raw = self.cells.tobytes().decode('latin-1')
+            W = self.W
+            self._grid = [list(raw[r * W:(r + 1) * W]) for r in range(self.H)]
+        return self._grid
+
+    @grid.setter
+    def grid(self, value: Grid):
+        self._grid = value
+
+    # RETURNS A BOOLEAN (H, W) ARRAY WITH TRUE ON EVERY NON-WALL CELL
+    def open_mask(self) -> np.ndarray:
+        if self.compact:
+            if self.passable_mask is None:
+                self.passable_mask = self.cells != WALL
+            return self.passable_mask
+        if self.H == 0:
+            return np.zeros((0, 0), dtype=bool)
+        W = self.W
+        return np.array([[ch != '#' for ch in row[:W]] + [False] * (W - len(row)) for row in self._grid], dtype=bool)
 
     # FINDS THE POSITION OF A GIVEN CHARACTER IN THE GRID
     def _find(self, ch: str) -> Pos:
+        if self.compact:
+            hits = np.flatnonzero(self.cells == ord(ch))
+            if hits.size:
+                r, c = divmod(int(hits[0]), self.W)
+                return (r, c)
+            raise ValueError(f"Caractere '{ch}' no encontrado no grid")
         for r in range(self.H):
             for c in range(self.W):
-                if self.grid[r][c] == ch:
+                if self._grid[r][c] == ch:
                     return (r, c)
         raise ValueError(f"Caractere '{ch}' no encontrado no grid")
 
@@ -29,7 +124,9 @@ class Maze:
     # CHECKS IF A POSITION IS PASSABLE (NOT A WALL)
     def passable(self, p: Pos) -> bool:
         r, c = p
-        return self.grid[r][c] != '#'
+        if self._flat is not None:
+            return self._flat[r * self._stride + c] != WALL
+        return self._grid[r][c] != '#'
 
     # RETURNS POSSIBLE ACTIONS FROM A GIVEN POSITION
     def actions(self, p: Pos):
@@ -65,9 +162,24 @@ class Maze:
     def goal_test(self, p: Pos) -> bool:
         return p == self.goal
 
-    # CREATES A MAZE INSTANCE FROM A TEXT FILE
+    # CREATES A MAZE INSTANCE FROM A TEXT FILE (COMPACT=TRUE KEEPS IT AS A UINT8 ARRAY)
     @classmethod
-    def from_file(cls, file_path: str) -> 'Maze':
+    def from_file(cls, file_path: str, compact: bool = False) -> 'Maze':
+        # BINARY .MZB FILES ARE ALWAYS LOADED IN COMPACT MODE
+        if str(file_path).endswith('.mzb'):
+            from core.maze_binary import load_maze_mzb
+            return load_maze_mzb(file_path)
+        if compact:
+            with open(file_path, 'rb') as f:
+                lines = [line.rstrip(b'\r\n') for line in f.read().split(b'\n')]
+            lines = [line for line in lines if line.strip() != b'']
+            if not lines:
+                return cls(np.zeros((0, 0), dtype=np.uint8))
+            W = len(lines[0])
+            if any(len(line) != W for line in lines):
+                raise ValueError("Compact mode requires all rows with the same width")
+            cells = np.frombuffer(b''.join(lines), dtype=np.uint8).reshape(len(lines), W)
+            return cls(cells)
         with open(file_path, 'r') as f:
             lines = [line.rstrip('\n') for line in f.readlines() if line.strip() != '']
         grid = [list(line) for line in lines]
@@ -79,11 +191,213 @@ class Maze:
         candidates = [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]
         return [q for q in candidates if self.in_bounds(q) and self.passable(q)]
 
+    # RETURNS FOUR (H, W) MASKS TELLING IF THE N, S, O AND L NEIGHBORS ARE OPEN
+    def neighbor_masks(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        mask = self.open_mask()
+        north = np.zeros_like(mask)
+        south = np.zeros_like(mask)
+        west = np.zeros_like(mask)
+        east = np.zeros_like(mask)
+        north[1:, :] = mask[1:, :] & mask[:-1, :]
+        south[:-1, :] = mask[:-1, :] & mask[1:, :]
+        west[:, 1:] = mask[:, 1:] & mask[:, :-1]
+        east[:, :-1] = mask[:, :-1] & mask[:, 1:]
+        return north, south, west, east
+
+    # CONVERTS A POSITION TO ITS ROW-MAJOR CELL ID
+    def cell_id(self, p: Pos) -> int:
+        return p[0] * self.W + p[1]
+
+    # CONVERTS A ROW-MAJOR CELL ID BACK TO A POSITION
+    def cell_pos(self, i: int) -> Pos:
+        return divmod(i, self.W)
+
+    # RETURNS THE CSR ADJACENCY (INDPTR, INDICES) OVER ROW-MAJOR CELL IDS, BUILT ONCE
+    # NEIGHBORS OF CELL i ARE indices[indptr[i]:indptr[i + 1]], IN N, S, O, L ORDER
+    def adjacency(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._adjacency is None:
+            self._adjacency = self._build_adjacency()
+        return self._adjacency
+
+    # BUILDS THE CSR ARRAYS IN ROW BLOCKS TO BOUND THE TEMPORARY MEMORY
+    def _build_adjacency(self, block_cells: int = 1 << 20) -> Tuple[np.ndarray, np.ndarray]:
+        H, W = self.H, self.W
+        masks = self.neighbor_masks()
+        degree = np.zeros(H * W, dtype=np.int32)
+        for m in masks:
+            degree += m.ravel()
+        indptr = np.zeros(H * W + 1, dtype=np.int32)
+        np.cumsum(degree, out=indptr[1:])
+        indices = np.empty(int(indptr[-1]), dtype=np.int32)
+        offsets = np.array([-W, W, -1, 1], dtype=np.int32)
+
+        rows_per_block = max(1, block_cells // max(W, 1))
+        for r0 in range(0, H, rows_per_block):
+            r1 = min(H, r0 + rows_per_block)
+            ids = np.arange(r0 * W, r1 * W, dtype=np.int32)
+            valid = np.stack([m[r0:r1].ravel() for m in masks], axis=1)
+            neighbors = ids[:, None] + offsets[None, :]
+            chunk = neighbors[valid]
+            start = indptr[r0 * W]
+            indices[start:start + chunk.size] = chunk
+        return indptr, indices
+
+    # RETURNS THE (H, W) INT32 CONNECTED-COMPONENT LABELS, COMPUTED ONCE AND CACHED
+    # WALLS ARE -1; EVERY OPEN CELL HOLDS THE SMALLEST CELL ID OF ITS COMPONENT
+    def component_labels(self) -> np.ndarray:
+        if self._components is None:
+            self._components = self._label_components()
+        return self._components
+
+    # VECTORIZED UNION-FIND: HOOK THE LARGER ROOT OF EVERY CROSSING EDGE ONTO THE SMALLER ONE,
+    # THEN FLATTEN THE TREES BY POINTER JUMPING; EACH ROUND AT LEAST HALVES THE NUMBER OF COMPONENTS
+    def _label_components(self) -> np.ndarray:
+        mask = self.open_mask()
+        H, W = mask.shape
+        parent = np.arange(H * W, dtype=np.int32)
+        ids = parent.reshape(H, W)
+        east = mask[:, :-1] & mask[:, 1:]
+        south = mask[:-1, :] & mask[1:, :]
+        u = np.concatenate([ids[:, :-1][east], ids[:-1, :][south]])
+        v = np.concatenate([ids[:, 1:][east], ids[1:, :][south]])
+        while u.size:
+            ru, rv = parent[u], parent[v]
+            crossing = ru != rv
+            u, v, ru, rv = u[crossing], v[crossing], ru[crossing], rv[crossing]
+            if not u.size:
+                break
+            np.minimum.at(parent, np.maximum(ru, rv), np.minimum(ru, rv))
+            while True:
+                grand = parent[parent]
+                if np.array_equal(grand, parent):
+                    break
+                parent = grand
+        return np.where(mask, parent.reshape(H, W), np.int32(-1))
+
+    # CHECKS IF TWO CELLS ARE OPEN AND IN THE SAME CONNECTED COMPONENT (O(1) AFTER THE FIRST CALL)
+    def connected(self, p: Pos, q: Pos) -> bool:
+        if not (self.in_bounds(p) and self.in_bounds(q)):
+            return False
+        labels = self.component_labels()
+        return bool(labels[p] >= 0 and labels[p] == labels[q])
+
+    # CONNECTED() FOR PER-QUERY CHECKS, WITHOUT LABELLING AS A SIDE EFFECT ON A LAZY MAZE: LABELLING READS
+    # THE WHOLE MAPPED FILE, SO ONLY LABELS ALREADY CACHED ARE USED THERE; NONE MEANS NOT KNOWN
+    def connected_if_known(self, p: Pos, q: Pos) -> Optional[bool]:
+        if self.lazy and self._components is None:
+            return None
+        return self.connected(p, q)
+
+    # VECTORIZED CONNECTED() FOR A BATCH OF (START, GOAL) PAIRS GIVEN AS (K, 2) ARRAYS
+    def connected_pairs(self, starts, goals) -> np.ndarray:
+        labels = self.component_labels()
+        starts = np.asarray(starts, dtype=np.int64).reshape(-1, 2)
+        goals = np.asarray(goals, dtype=np.int64).reshape(-1, 2)
+        ok = np.ones(len(starts), dtype=bool)
+        for pts in (starts, goals):
+            ok &= (pts[:, 0] >= 0) & (pts[:, 0] < self.H) & (pts[:, 1] >= 0) & (pts[:, 1] < self.W)
+        s = labels[np.where(ok, starts[:, 0], 0), np.where(ok, starts[:, 1], 0)]
+        g = labels[np.where(ok, goals[:, 0], 0), np.where(ok, goals[:, 1], 0)]
+        return ok & (s >= 0) & (s == g)
+
+    # RETURNS THE CORRIDOR-CONTRACTED GRAPH (DEGREE-2 CHAINS AS WEIGHTED EDGES), BUILT ONCE
+    def corridor_graph(self):
+        if self._corridors is None:
+            from core.corridor_graph import CorridorGraph
+            self._corridors = CorridorGraph.from_maze(self)
+        return self._corridors
+
+    # RETURNS THE OPEN CELLS PACKED INTO ONE PYTHON INT (BIT-PARALLEL BFS AND FLOOD FILLS), BUILT ONCE
+    def bitboard(self):
+        if self._bitboard is None:
+            from core.bitboard import MazeBitboard
+            self._bitboard = MazeBitboard(self)
+        return self._bitboard
+
+    # RETURNS THE HPA* CLUSTER ABSTRACTION FOR A GIVEN CLUSTER SIZE, BUILT ONCE PER SIZE
+    def cluster_abstraction(self, size: int = 32):
+        if size not in self._clusters:
+            from core.cluster_abstraction import ClusterAbstraction
+            self._clusters[size] = ClusterAbstraction(self, size)
+        return self._clusters[size]
+
+    # RETURNS THE CONTRACTION HIERARCHY OF THE MAZE GRAPH (MANY-QUERY PREPROCESSING), BUILT ONCE
+    def contraction_hierarchy(self):
+        if self._hierarchy is None:
+            from core.contraction_hierarchy import ContractionHierarchy
+            self._hierarchy = ContractionHierarchy.from_maze(self)
+        return self._hierarchy
+
+    # SHA-1 OF THE SIZE AND WALL LAYOUT (S AND G EXCLUDED): KEYS TABLES THAT ONLY DEPEND ON THE WALLS
+    def content_hash(self) -> str:
+        if self._hash is None:
+            digest = hashlib.sha1(f"{self.H}x{self.W}:".encode())
+            digest.update(np.packbits(self.open_mask()).tobytes())
+            self._hash = digest.hexdigest()
+        return self._hash
+
+    # RETURNS THE ALT LANDMARK TABLE WITH K LANDMARKS, BUILT ONCE PER K
+    # WITH A CACHE_DIR THE TABLE IS ALSO SAVED TO (AND REUSED FROM) DISK, KEYED BY CONTENT_HASH
+    def landmarks(self, k: int = 8, cache_dir=None):
+        if k not in self._landmarks:
+            from core.landmarks import LandmarkTable
+            if cache_dir is None:
+                self._landmarks[k] = LandmarkTable.build(self, k)
+            else:
+                self._landmarks[k] = LandmarkTable.load_or_build(self, k, cache_dir)
+        return self._landmarks[k]
+
+    # CHANGES CELLS IN PLACE ({(R, C): '#' OR '.'}); DERIVED CACHES ARE DROPPED,
+    # EXCEPT THE CLUSTER ABSTRACTIONS, WHICH ONLY REBUILD THE CLUSTERS AROUND THE CHANGES
+    def update_cells(self, changes) -> None:
+        if self.lazy:
+            raise ValueError("Mapped mazes are read-only")
+        # ARRAYS BUILT STRAIGHT FROM FILE BYTES ARE READ-ONLY: TAKE A PRIVATE COPY FIRST
+        if self.cells is not None and not self.cells.flags.writeable:
+            cells = self.cells.copy()
+            self._init_compact(cells, memoryview(cells).cast('B'), self.W, lazy=False)
+        for (r, c), ch in changes.items():
+            if not self.in_bounds((r, c)):
+                raise ValueError(f"Cell {(r, c)} is outside the maze")
+            if self.cells is not None:
+                self.cells[r, c] = ord(ch)
+            if self._grid is not None:
+                self._grid[r][c] = ch
+            if self.passable_mask is not None:
+                self.passable_mask[r, c] = ch != '#'
+        self._adjacency = None
+        self._components = None
+        self._corridors = None
+        self._hierarchy = None
+        self._landmarks = {}
+        self._hash = None
+        self._bitboard = None
+        for abstraction in self._clusters.values():
+            abstraction.update(changes.keys())
+
     # CONVERTS THE MAZE TO AN ADJACENCY GRAPH
     def to_graph(self):
         graph = {}
+        if self.compact:
+            north, south, west, east = self.neighbor_masks()
+            rows, cols = np.nonzero(self.open_mask())
+            flags = zip(rows.tolist(), cols.tolist(),
+                        north[rows, cols].tolist(), south[rows, cols].tolist(),
+                        west[rows, cols].tolist(), east[rows, cols].tolist())
+            for r, c, n, s, o, l in flags:
+                neighbors = []
+                if n:
+                    neighbors.append((r-1, c))
+                if s:
+                    neighbors.append((r+1, c))
+                if o:
+                    neighbors.append((r, c-1))
+                if l:
+                    neighbors.append((r, c+1))
+                graph[(r, c)] = neighbors
+            return graph
         for r in range(self.H):
             for c in range(self.W):
                 if self.passable((r, c)):
                     graph[(r, c)] = self.neighbors_coords((r, c))
-        return graph
\ No newline at end of file
+        return graph
@@ -0,0 +1,57 @@
+from array import array
+from typing import Any, List
+from core.node import Node
+
+# PARENT INDEX OF THE ROOT
+NO_PARENT = -1
+
+
+# SEARCH TREE KEPT IN PARALLEL ARRAYS: NODE I IS STATES[I], REACHED FROM NODE PARENT[I] BY ACTIONS[I],
+# WITH COSTS G[I] AND H[I]; ENGINES HOLD ONLY THE INDEX (HEAP ENTRIES ARE (f, TIEBREAK, INDEX))
+# THE ARRAYS ARE PREALLOCATED AND DOUBLED WHEN FULL, SO ADDING A NODE USUALLY ALLOCATES NOTHING
+class NodePool:
+    def __init__(self, capacity: int = 1024):
+        capacity = max(1, capacity)
+        self.size = 0
+        self.parent = array('q', bytes(8 * capacity))
+        self.g = array('d', bytes(8 * capacity))
+        self.h = array('d', bytes(8 * capacity))
+        self.states: List[Any] = [None] * capacity
+        self.actions: List[Any] = [None] * capacity
+
+    # STORES A NEW NODE AND RETURNS ITS INDEX
+    def add(self, state: Any, parent: int, action: Any, g: float, h: float = 0.0) -> int:
+        i = self.size
+        if i == len(self.states):
+            self._grow()
+        self.states[i] = state
+        self.parent[i] = parent
+        self.actions[i] = action
+        self.g[i] = g
+        self.h[i] = h
+        self.size = i + 1
+        return i
+
+    # DOUBLES THE CAPACITY OF EVERY ARRAY
+    def _grow(self):
+        n = len(self.states)
+        self.parent.frombytes(bytes(8 * n))
+        self.g.frombytes(bytes(8 * n))
+        self.h.frombytes(bytes(8 * n))
+        self.states.extend([None] * n)
+        self.actions.extend([None] * n)
+
+    def __len__(self) -> int:
+        return self.size
+
+    # MATERIALIZES THE PATH ENDING AT NODE I AS A CHAIN OF NODES (WHAT THE ENGINES RETURN)
+    def node(self, i: int) -> Node:
+        chain = []
+        while i != NO_PARENT:
+            chain.append(i)
+            i = self.parent[i]
+        node = None
+        for j in reversed(chain):
+            g, h = self.g[j], self.h[j]
+            node = Node(state=self.states[j], parent=node, action=self.actions[j], g=g, h=h, f=g + h)
+        return node
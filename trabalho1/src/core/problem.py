@@ -28,8 +28,17 @@ class Problem(ABC):
     def action_cost(self, s: Any, a: Any, s2: Any) -> float:
         return 1.0
 
+    # LARGEST STEP COST WHEN EVERY STEP COST IS A NON-NEGATIVE INTEGER (LETS DIJKSTRA USE A BUCKET QUEUE)
+    # NONE WHEN THE COSTS ARE NOT KNOWN TO BE INTEGERS (DEFAULT)
+    def max_step_cost(self) -> Optional[int]:
+        return None
+
     # RETURNS THE HEURISTIC VALUE FOR A GIVEN STATE (DEFAULT = 0)
     def heuristic(self, s: Any, goal: Optional[Any] = None, function_h: Optional[Callable[[Any, Any], float]] = None) -> float:
         if function_h and goal is not None:
             return function_h(s, goal)
         return 0.0
+
+    # TRUE WHEN THE GOAL IS KNOWN TO BE UNREACHABLE FROM THE INITIAL STATE (DEFAULT = NOT KNOWN)
+    def unreachable(self) -> bool:
+        return False
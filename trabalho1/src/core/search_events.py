@@ -0,0 +1,127 @@
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+# DELTA-ENCODED SEARCH EVENTS: ON_STEP RECEIVES ONE SMALL DICT PER CHANGE, CARRYING ONLY THE STATE THAT
+# CHANGED, SO TRACING COSTS O(1) PER EVENT INSTEAD OF A COPY OF THE FRONTIER AND REACHED EACH TIME
+#   push     STATE REACHED FOR THE FIRST TIME, ENTERS THE FRONTIER
+#   improve  STATE ALREADY REACHED, RE-ENTERS THE FRONTIER WITH A LOWER g
+#   pop      STATE LEAVES THE FRONTIER TO BE EXPANDED (THE CURRENT STATE)
+#   meet     BIDIRECTIONAL: THE TWO SEARCHES MEET AT STATE
+# EVERY EVENT HAS 'event', 'state' AND 'nodes_expanded'; BIDIRECTIONAL ENGINES ADD 'direction'
+PUSH = 'push'
+IMPROVE = 'improve'
+POP = 'pop'
+MEET = 'meet'
+SEARCH_EVENTS = (PUSH, IMPROVE, POP, MEET)
+
+FORWARD = 'Forward'
+BACKWARD = 'Backward'
+
+
+# BUILDS ONE EVENT
+def search_event(kind: str, state, nodes_expanded: int, direction: Optional[str] = None) -> Dict[str, Any]:
+    event = {'event': kind, 'state': state, 'nodes_expanded': nodes_expanded}
+    if direction is not None:
+        event['direction'] = direction
+    return event
+
+
+# REBUILDS THE SEARCH STATE FROM THE EVENTS, ONE EVENT AT A TIME: REACHED (IN FIRST-REACHED ORDER) AND
+# FRONTIER PER DIRECTION AND THE CURRENT STATE
+# THE FRONTIER IS A SET: A LAZY HEAP MAY STILL HOLD A STALE ENTRY OF A POPPED STATE, BUT IT IS NOT DRAWN
+class SearchReplay:
+    def __init__(self):
+        self.reached: Dict[str, Dict[Any, None]] = {FORWARD: {}, BACKWARD: {}}
+        self.frontier: Dict[str, Set[Any]] = {FORWARD: set(), BACKWARD: set()}
+        self.current = None
+        self.last: Optional[Dict[str, Any]] = None
+        self.bidirectional = False
+
+    # APPLIES ONE EVENT AND RETURNS THE STATES WHOSE LAYER MAY HAVE CHANGED (THE EVENT STATE AND THE
+    # PREVIOUS CURRENT), SO A VIEW ONLY REPAINTS THOSE
+    def apply(self, event: Dict[str, Any]) -> List[Any]:
+        kind, s = event['event'], event['state']
+        if kind not in SEARCH_EVENTS:
+            raise ValueError(f"Unknown search event '{kind}', expected one of {list(SEARCH_EVENTS)}")
+        side = event.get('direction', FORWARD)
+        if 'direction' in event:
+            self.bidirectional = True
+        if kind == PUSH or kind == IMPROVE:
+            self.reached[side][s] = None
+            self.frontier[side].add(s)
+        elif kind == POP:
+            # THE ROOT IS NEVER PUSHED: ITS FIRST POP IS WHAT PUTS IT IN REACHED
+            self.reached[side][s] = None
+            self.frontier[side].discard(s)
+        touched = [s] if self.current is None or self.current == s else [s, self.current]
+        self.current = s
+        self.last = event
+        return touched
+
+    # TOPMOST LAYER OF A STATE, IN DRAWING ORDER: current, frontier_B, frontier_F, reached_B, reached_F
+    # (NONE WHEN THE SEARCH HAS NOT TOUCHED IT)
+    def layer(self, s) -> Optional[str]:
+        if s == self.current:
+            return 'current'
+        if s in self.frontier[BACKWARD]:
+            return 'frontier_B'
+        if s in self.frontier[FORWARD]:
+            return 'frontier_F'
+        if s in self.reached[BACKWARD]:
+            return 'reached_B'
+        if s in self.reached[FORWARD]:
+            return 'reached_F'
+        return None
+
+    # EVERY STATE REACHED BY EITHER DIRECTION
+    def reached_states(self) -> Set[Any]:
+        return set(self.reached[FORWARD]) | set(self.reached[BACKWARD])
+
+    # FULL SNAPSHOT IN THE FORMAT THE ENGINES USED TO EMIT (O(REACHED), ONLY BUILT ON DEMAND)
+    def snapshot(self) -> Dict[str, Any]:
+        event = self.last or {}
+        snapshot = {
+            'current': self.current,
+            'event': event.get('event'),
+            'nodes_expanded': event.get('nodes_expanded', 0),
+        }
+        if self.bidirectional:
+            snapshot['frontier_F'] = list(self.frontier[FORWARD])
+            snapshot['frontier_B'] = list(self.frontier[BACKWARD])
+            snapshot['reached_F'] = list(self.reached[FORWARD])
+            snapshot['reached_B'] = list(self.reached[BACKWARD])
+            snapshot['direction'] = event.get('direction', FORWARD)
+        else:
+            snapshot['frontier'] = list(self.frontier[FORWARD])
+            snapshot['reached'] = list(self.reached[FORWARD])
+        return snapshot
+
+
+# RECORDS THE EVENT STREAM OF A SEARCH; PASS THE TRACE ITSELF AS ON_STEP
+class SearchTrace:
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+
+    def __call__(self, event: Dict[str, Any]):
+        self.events.append(event)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    # ALWAYS TRUE, EVEN BEFORE THE FIRST EVENT: THE ENGINES TEST `if on_step:` BEFORE EMITTING
+    def __bool__(self) -> bool:
+        return True
+
+    # FULL SNAPSHOTS REBUILT LAZILY FROM THE EVENTS: ONE EVERY `EVERY` EVENTS, PLUS THE LAST ONE
+    def snapshots(self, every: int = 1) -> Iterator[Dict[str, Any]]:
+        if every < 1:
+            raise ValueError(f"every must be at least 1, got {every}")
+        replay = SearchReplay()
+        last = len(self.events) - 1
+        for i, event in enumerate(self.events):
+            replay.apply(event)
+            if (i + 1) % every == 0 or i == last:
+                yield replay.snapshot()
+
+    # EVERY STATE THE SEARCH REACHED (THE SEARCH TREE DRAWN OVER THE FINAL FRAME)
+    def tree_nodes(self) -> Set[Any]:
+        return {event['state'] for event in self.events if event['event'] != MEET}
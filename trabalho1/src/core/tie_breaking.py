@@ -0,0 +1,33 @@
+import random
+from itertools import count
+from typing import Any, Callable, Optional
+
+# TIE-BREAKING POLICIES OF THE BEST-FIRST FRONTIERS: HEAP ENTRIES ARE (f, TIE, ITEM, ...) AND TIE
+# DECIDES AMONG EQUAL f; EVERY TIE ENDS IN A UNIQUE INSERTION NUMBER, SO ENTRIES NEVER COMPARE PAST IT
+#   lifo    NEWEST ENTRY FIRST (DEPTH-FIRST AMONG TIES; THE A* DEFAULT)
+#   fifo    OLDEST ENTRY FIRST (BREADTH-FIRST AMONG TIES; THE DIJKSTRA AND GREEDY DEFAULT)
+#   high_g  DEEPEST ENTRY FIRST, THEN LIFO
+#   low_h   ENTRY CLOSEST TO G FIRST, THEN LIFO
+#   random  UNIFORMLY RANDOM ORDER AMONG TIES (SEEDABLE)
+TIE_BREAKS = ('lifo', 'fifo', 'high_g', 'low_h', 'random')
+
+
+# RETURNS TIE(g, h), WHICH THE ENGINE CALLS ONCE PER PUSH (A FRESH COUNTER PER SEARCH)
+def make_tie_break(policy: str, seed: Optional[int] = None) -> Callable[[float, float], Any]:
+    if policy == 'fifo':
+        counter = count(1)
+        return lambda g, h: next(counter)
+    if policy == 'lifo':
+        counter = count(-1, -1)
+        return lambda g, h: next(counter)
+    if policy == 'high_g':
+        counter = count(-1, -1)
+        return lambda g, h: (-g, next(counter))
+    if policy == 'low_h':
+        counter = count(-1, -1)
+        return lambda g, h: (h, next(counter))
+    if policy == 'random':
+        rng = random.Random(seed)
+        counter = count(1)
+        return lambda g, h: (rng.random(), next(counter))
+    raise ValueError(f"Unknown tie-breaking policy '{policy}', expected one of {list(TIE_BREAKS)}")
@@ -1,31 +1,28 @@
 # EXTERNAL IMPORTS
-import heapq
 from typing import Optional, Tuple, Callable, Dict, Any
 
 # INTERNAL PROJECT IMPORTS
 # CORE
-from core.heuristics import h_manhattan_distance, h_euclidean_distance, h_inadmissible
 from core.problem import Problem
 from core.node import Node
+from core.node_pool import NodePool, NO_PARENT
+from core.frontier import make_frontier
+from core.tie_breaking import make_tie_break
+from core.search_events import search_event, PUSH, IMPROVE, POP
 
 # SEARCH
 from search.measure_time_memory import measure_time_memory
+from search.integer_states import heuristic_table_for, csr_maze, csr_views, table_by_id, ids_from_parents, node_from_ids
 
 
 # COMPUTES A* SEARCH USING A SPECIFIED HEURISTIC
 def compute_a_star_search(problem: Problem, heuristic: str):
-    # BUILD HEURISTIC TABLE FOR ALL COORDINATES
-    heuristic_table_coordinate = {
-        (x, y): problem.heuristic(
-            (x, y),
-            problem.goal,
-            function_h=h_manhattan_distance if heuristic == "manhattan" else
-                       h_euclidean_distance if heuristic == "euclidean" else
-                       h_inadmissible
-                       
-        )
-        for x in range(problem.maze.W) for y in range(problem.maze.H)
-    }
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    heuristic_table_coordinate = heuristic_table_for(problem, heuristic)
 
     # DEFINE f FUNCTION FOR A* (G + H)
     f_astar = lambda n: n.g + n.h 
@@ -55,67 +52,131 @@ def compute_a_star_search(problem: Problem, heuristic: str):
 
 
 # A* SEARCH USING PRECOMPUTED HEURISTIC TABLE
+# FRONTIER: 'lazy' (HEAPQ WITH DUPLICATES) OR 'indexed' (ONE ENTRY PER STATE, DECREASE-KEY), SEE CORE.FRONTIER
+# TIE_BREAK: ORDER AMONG EQUAL f, ONE OF CORE.TIE_BREAKING.TIE_BREAKS
+# TIE_BREAK_SEED: SEED OF THE 'random' POLICY (NONE DRAWS A FRESH ORDER EACH RUN)
 def a_star_table_search(problem: Problem, f: Callable[[Node], float],
                         heuristic_table_coordinate: Dict[tuple, float],
-                        on_step: Optional[Callable[[dict], None]] = None) -> Optional[Tuple[Node, int]]:
-    start = Node(
-        state=problem.initial,
-        g=0.0,
-        h=heuristic_table_coordinate[problem.initial],
-        f=heuristic_table_coordinate[problem.initial]
-    )
-    frontier = []
-    heapq.heappush(frontier, (f(start), start))
+                        on_step: Optional[Callable[[dict], None]] = None,
+                        frontier='lazy', tie_break: str = 'lifo',
+                        tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+
+    # FAST PATH: INTEGER CELL IDS OVER THE MAZE CSR ADJACENCY
+    if on_step is None:
+        maze = csr_maze(problem)
+        if maze is not None:
+            return a_star_table_search_csr(problem, maze, f, heuristic_table_coordinate, frontier, tie_break,
+                                           tie_break_seed)
+
+    # NODES LIVE IN A POOL OF ARRAYS; THE FRONTIER AND EXPLORED HOLD POOL INDICES
+    h0 = heuristic_table_coordinate[problem.initial]
+    pool = NodePool()
+    root = pool.add(problem.initial, NO_PARENT, None, 0.0, h0)
+    # F IS EVALUATED ON A SINGLE REUSED NODE INSTEAD OF ONE NODE PER CHILD
+    probe = Node(state=problem.initial, g=0.0, h=h0, f=h0)
+    states, g_of = pool.states, pool.g
+    # AN INDEXED FRONTIER IS KEYED BY STATE: EACH IMPROVEMENT ADDS A POOL NODE BUT REPLACES THE QUEUED ENTRY
+    frontier = make_frontier(frontier, key=lambda entry: states[entry[2]])
+    tie = make_tie_break(tie_break, tie_break_seed)
+    frontier.push((f(probe), tie(0.0, h0), root))
     explored = {}
     nodes_expanded = 0
 
-    while frontier:
-        _, node = heapq.heappop(frontier)
-        if problem.is_goal(node.state):
-            return node, nodes_expanded
-
-        reached_node = explored.get(node.state)
-        if reached_node is not None and reached_node is not node and reached_node.g < node.g:
+    while frontier.heap:
+        _, _, i = frontier.pop()
+        state = states[i]
+        if on_step:
+            on_step(search_event(POP, state, nodes_expanded))
+        if problem.is_goal(state):
+            return pool.node(i), nodes_expanded
+
+        g = g_of[i]
+        reached = explored.get(state)
+        if reached is not None and reached != i and g_of[reached] < g:
             continue
 
         # EXPAND CHILDREN
-        for action in problem.actions(node.state):
-            s2 = problem.result(node.state, action)
-            g2 = node.g + problem.action_cost(node.state, action, s2)
+        for action in problem.actions(state):
+            s2 = problem.result(state, action)
+            g2 = g + problem.action_cost(state, action, s2)
             h_val = heuristic_table_coordinate.get(s2, 0.0)
-            child = Node(state=s2, parent=node, action=action, g=g2, h=h_val, f=g2 + h_val)
-
-            if on_step:
-                snapshot = {
-                    'current': node.state,
-                    'frontier': [n.state for _, n in frontier],
-                    'reached': list(explored.keys()),
-                    'event': 'expand_node',
-                    'nodes_expanded': nodes_expanded,
-                }
-                on_step(snapshot)
-
-            existing = explored.get(child.state)
-            if existing is None or child.g < existing.g:
-                explored[child.state] = child
-                heapq.heappush(frontier, (f(child), child))
+
+            existing = explored.get(s2)
+            if existing is None or g2 < g_of[existing]:
+                j = pool.add(s2, i, action, g2, h_val)
+                explored[s2] = j
+                probe.state = s2
+                probe.g = g2
+                probe.h = h_val
+                probe.f = g2 + h_val
+                frontier.push((f(probe), tie(g2, h_val), j))
                 nodes_expanded += 1
 
                 if on_step:
-                    snapshot = {
-                        'current': child.state,
-                        'frontier': [n.state for _, n in frontier],
-                        'reached': list(explored.keys()),
-                        'event': 'push_child',
-                        'nodes_expanded': nodes_expanded,
-                    }
-                    on_step(snapshot)
+                    on_step(search_event(PUSH if existing is None else IMPROVE, s2, nodes_expanded))
+    return None
+
+
+# A* OVER INTEGER CELL IDS, SAME EXPANSION AND STALE-ENTRY RULES AS A_STAR_TABLE_SEARCH
+def a_star_table_search_csr(problem: Problem, maze, f: Callable[[Node], float],
+                            heuristic_table_coordinate: Dict[tuple, float],
+                            frontier='lazy', tie_break: str = 'lifo',
+                            tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
+    indptr, indices = csr_views(maze)
+    h = table_by_id(maze, heuristic_table_coordinate)
+    start = maze.cell_id(problem.initial)
+    goal = maze.cell_id(problem.goal)
+    h0 = heuristic_table_coordinate[problem.initial]
+
+    # F IS EVALUATED ON A SINGLE REUSED NODE INSTEAD OF ONE NODE PER CHILD
+    probe = Node(state=start, g=0.0, h=h0, f=h0)
+    frontier = make_frontier(frontier)
+    heap, push, pop = frontier.heap, frontier.push, frontier.pop
+    tie = make_tie_break(tie_break, tie_break_seed)
+    push((f(probe), tie(0.0, h0), start, 0.0))
+    explored = {}
+    parent = {start: -1}
+    nodes_expanded = 0
+
+    while heap:
+        _, _, u, g = pop()
+        if u == goal:
+            node = node_from_ids(maze, ids_from_parents(parent, u))
+            node.h = h[u]
+            node.f = node.g + node.h
+            return node, nodes_expanded
+
+        best = explored.get(u)
+        if best is not None and best < g:
+            continue
+
+        g2 = g + 1.0
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            existing = explored.get(v)
+            if existing is None or g2 < existing:
+                explored[v] = g2
+                # THE START IS NOT SEEDED IN EXPLORED (AS IN THE NODE VERSION), KEEP IT AS THE ROOT
+                if v != start:
+                    parent[v] = u
+                h_val = h[v]
+                probe.state = v
+                probe.g = g2
+                probe.h = h_val
+                probe.f = g2 + h_val
+                push((f(probe), tie(g2, h_val), v, g2))
+                nodes_expanded += 1
     return None
 
 
 # PUBLIC WRAPPER FOR A* THAT BUILDS HEURISTIC TABLE
 def a_star_search(problem: Problem, h: Optional[Callable[[Any, Any], float]] = None,
-                  on_step: Optional[Callable[[dict], None]] = None) -> Optional[Tuple[Node, int]]:
+                  on_step: Optional[Callable[[dict], None]] = None,
+                  frontier='lazy', tie_break: str = 'lifo',
+                  tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
     heuristic_fn = h or (lambda s, goal: problem.heuristic(s, goal))
 
     heuristic_table_coordinate = {
@@ -127,12 +188,17 @@ def a_star_search(problem: Problem, h: Optional[Callable[[Any, Any], float]] = N
     def f(n: Node) -> float:
         return n.g + n.h
 
-    return a_star_table_search(problem, f=f, heuristic_table_coordinate=heuristic_table_coordinate, on_step=on_step)
+    return a_star_table_search(problem, f=f, heuristic_table_coordinate=heuristic_table_coordinate, on_step=on_step,
+                               frontier=frontier, tie_break=tie_break, tie_break_seed=tie_break_seed)
 
 # RECONSTRUCTS THE PATH FROM GOAL NODE TO START NODE
 def reconstruct_path(node: Node):
     path = []
     while node:
         path.append(node.state)
+        # CONTRACTED CORRIDOR: THE ACTION CARRIES THE CELLS WALKED TO REACH THIS NODE
+        cells = getattr(node.action, 'cells', None)
+        if cells:
+            path.extend(reversed(cells))
         node = node.parent
     return list(reversed(path))
@@ -0,0 +1,206 @@
+# EXTERNAL IMPORTS
+import heapq
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.heuristics import manhattan_grid
+from core.problem import Problem
+from core.node import Node
+from core.search_events import search_event, PUSH, IMPROVE, POP
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import state_space, node_from_ids
+
+# INFORMED SEARCH
+from informed.a_star_search import reconstruct_path
+
+# DEFAULT SCHEDULE: FIRST SOLUTION WITH WEIGHT 3, THEN 2.5, 2.0, ... DOWN TO 1 (OPTIMAL)
+ARA_INITIAL_WEIGHT = 3.0
+ARA_WEIGHT_STEP = 0.5
+
+# THE DEADLINE IS CHECKED ONCE EVERY THIS MANY EXPANSIONS
+DEADLINE_CHECK_EVERY = 256
+
+
+# COMPUTES ARA* WITH MANHATTAN DISTANCE, PRINTING EVERY IMPROVED SOLUTION FOUND WITHIN THE BUDGET
+def compute_ara_star_search(problem: Problem, time_budget_ms: Optional[float] = None):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    heuristic_table_coordinate = manhattan_grid(problem.maze.H, problem.maze.W, problem.goal)
+
+    # COLLECT EVERY SOLUTION OF THE ANYTIME SEQUENCE WITH ITS TIMESTAMP
+    def run():
+        began = time.perf_counter()
+        deadline = None if time_budget_ms is None else began + time_budget_ms / 1000
+        return [(sol, (time.perf_counter() - began) * 1000)
+                for sol in ara_star_iter(problem, heuristic_table_coordinate, deadline=deadline)]
+
+    solutions, elapsed_time, memory_used, current, peak = measure_time_memory(run)
+
+    if not solutions:
+        print("No path found within the time budget")
+        return
+
+    for (goal_node, nodes_expanded, bound), at in solutions:
+        print(f"Bound {bound:.3f}: cost {goal_node.g} after {at:.3f} ms ({nodes_expanded} nodes)")
+
+    (goal_node, nodes_expanded, bound), _ = solutions[-1]
+    print("Path:", reconstruct_path(goal_node))
+    print("Number of nodes expanded:", nodes_expanded)
+    print("Cost of path:", goal_node.g)
+    print(f"Suboptimality bound: {bound:.3f}")
+    print(f"Time taken: {elapsed_time:.3f} milliseconds")
+    print(f"Memory used: {memory_used:.12f} B")
+    print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
+
+
+# ANYTIME REPAIRING A* (LIKHACHEV, GORDON & THRUN): WEIGHTED A* WITH f = g + w * h, REPEATED WITH A
+# DECREASING WEIGHT; EACH ROUND REUSES g VALUES AND ONLY REOPENS STATES WHOSE g IMPROVED (INCONS)
+# YIELDS (GOAL NODE, NODES EXPANDED SO FAR, BOUND) AFTER EVERY ROUND: COST <= BOUND * OPTIMAL COST
+# STOPS AT THE DEADLINE (TIME.PERF_COUNTER() SECONDS), ONCE THE BOUND REACHES 1, OR WHEN THERE IS NO PATH
+# ON_STEP RECEIVES THE SEARCH EVENTS (SEE CORE.SEARCH_EVENTS); INCONS STATES REOPENED BY A NEW ROUND ARE
+# REPORTED AS IMPROVE
+def ara_star_iter(problem: Problem, heuristic_table_coordinate: Dict[tuple, float],
+                  w0: float = ARA_INITIAL_WEIGHT, step: float = ARA_WEIGHT_STEP,
+                  deadline: Optional[float] = None,
+                  on_step: Optional[Callable[[dict], None]] = None) -> Iterator[Tuple[Node, int, float]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return
+
+    maze, start, goal, h, successors = state_space(problem, heuristic_table_coordinate, csr=on_step is None)
+
+    def solution() -> Node:
+        chain = []
+        u = goal
+        while u is not None:
+            chain.append(u)
+            u = parent[u][0]
+        chain.reverse()
+        if maze is not None:
+            return node_from_ids(maze, chain)
+        # g OF A STATE MAY BE STALE (ITS ANCESTORS IMPROVED LATER), SO THE COST IS SUMMED ALONG THE CHAIN
+        node = None
+        cost = 0.0
+        for s in chain:
+            _, action, step_cost = parent[s]
+            cost += step_cost
+            node = Node(state=s, parent=node, action=action, g=cost)
+        return node
+
+    g: Dict[Any, float] = {start: 0.0}
+    parent: Dict[Any, Tuple[Any, Any, float]] = {start: (None, None, 0.0)}
+    w = max(w0, 1.0)
+    open_keys: Dict[Any, float] = {start: w * h(start)}
+    frontier = [(open_keys[start], 0, start)]
+    closed = set()
+    incons = set()
+    nodes_expanded = 0
+    seq = 0
+    last = None
+    INF = float('inf')
+
+    while True:
+        # IMPROVEPATH: EXPAND WHILE SOME OPEN STATE COULD STILL BEAT THE CURRENT GOAL COST
+        expansions = 0
+        while frontier:
+            key, _, u = frontier[0]
+            if open_keys.get(u) != key:
+                heapq.heappop(frontier)
+                continue
+            if key >= g.get(goal, INF):
+                break
+            heapq.heappop(frontier)
+            del open_keys[u]
+            closed.add(u)
+            if on_step:
+                on_step(search_event(POP, u, nodes_expanded))
+            expansions += 1
+            if deadline is not None and expansions % DEADLINE_CHECK_EVERY == 0 and time.perf_counter() >= deadline:
+                return
+            gu = g[u]
+            for v, action, cost in successors(u):
+                g2 = gu + cost
+                existing = g.get(v)
+                if existing is None or g2 < existing:
+                    g[v] = g2
+                    parent[v] = (u, action, cost)
+                    if v in closed:
+                        incons.add(v)
+                    else:
+                        key_v = g2 + w * h(v)
+                        open_keys[v] = key_v
+                        # NEGATIVE COUNTER: EQUAL KEYS PREFER THE NEWEST STATE, LIKE THE A* FAST PATH
+                        seq -= 1
+                        heapq.heappush(frontier, (key_v, seq, v))
+                        nodes_expanded += 1
+                        if on_step:
+                            on_step(search_event(PUSH if existing is None else IMPROVE, v, nodes_expanded))
+
+        if goal not in g:
+            return
+
+        # BOUND: GOAL COST OVER THE SMALLEST UNWEIGHTED f STILL PENDING (OPEN OR INCONS)
+        pending = [g[s] + h(s) for s in open_keys]
+        pending.extend(g[s] + h(s) for s in incons)
+        lower = min(pending, default=g[goal])
+        bound = max(1.0, min(w, g[goal] / lower) if lower > 0 else 1.0)
+        # ONLY A CHEAPER PATH OR A TIGHTER BOUND IS REPORTED
+        if (g[goal], bound) != last:
+            last = (g[goal], bound)
+            yield solution(), nodes_expanded, bound
+
+        if bound <= 1.0 or (deadline is not None and time.perf_counter() >= deadline):
+            return
+
+        # NEXT ROUND: LOWER THE WEIGHT, MOVE INCONS INTO OPEN, REBUILD KEYS, EMPTY CLOSED
+        w = max(1.0, w - step)
+        for s in incons:
+            open_keys[s] = 0.0
+            if on_step:
+                on_step(search_event(IMPROVE, s, nodes_expanded))
+        incons.clear()
+        for s in open_keys:
+            open_keys[s] = g[s] + w * h(s)
+        frontier = [(key, 0, s) for s, key in open_keys.items()]
+        heapq.heapify(frontier)
+        closed.clear()
+
+
+# ARA* WITH THE ENGINE CONTRACT: THE BEST SOLUTION FOUND BEFORE THE BUDGET RUNS OUT (OR THE OPTIMAL ONE)
+# RETURNS (GOAL NODE, NODES EXPANDED) OR NONE WHEN NOT EVEN THE FIRST SOLUTION FITS IN THE BUDGET
+def ara_star_table_search(problem: Problem, heuristic_table_coordinate: Dict[tuple, float],
+                          time_budget_ms: Optional[float] = None,
+                          w0: float = ARA_INITIAL_WEIGHT, step: float = ARA_WEIGHT_STEP,
+                          on_step: Optional[Callable[[dict], None]] = None) -> Optional[Tuple[Node, int]]:
+    deadline = None if time_budget_ms is None else time.perf_counter() + time_budget_ms / 1000
+    best = None
+    for goal_node, nodes_expanded, _ in ara_star_iter(problem, heuristic_table_coordinate, w0, step, deadline,
+                                                     on_step=on_step):
+        best = (goal_node, nodes_expanded)
+    return best
+
+
+# PUBLIC WRAPPER FOR ARA* THAT BUILDS THE HEURISTIC TABLE (SAME SHAPE AS A_STAR_SEARCH)
+# THE DEFAULT IS MANHATTAN (ZERO WOULD MAKE THE WEIGHT POINTLESS); BUILDING THE TABLE COUNTS AGAINST THE BUDGET
+def ara_star_search(problem: Problem, h: Optional[Callable[[Any, Any], float]] = None,
+                    time_budget_ms: Optional[float] = None,
+                    on_step: Optional[Callable[[dict], None]] = None) -> Optional[Tuple[Node, int]]:
+    began = time.perf_counter()
+    if h is None:
+        heuristic_table_coordinate = manhattan_grid(problem.maze.H, problem.maze.W, problem.goal)
+    else:
+        heuristic_table_coordinate = {
+            (r, c): h((r, c), problem.goal)
+            for r in range(problem.maze.H) for c in range(problem.maze.W)
+        }
+    if time_budget_ms is not None:
+        time_budget_ms -= (time.perf_counter() - began) * 1000
+
+    return ara_star_table_search(problem, heuristic_table_coordinate, time_budget_ms, on_step=on_step)
@@ -0,0 +1,171 @@
+# EXTERNAL IMPORTS
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.maze_representation import Maze
+from core.node import Node
+
+# SEARCH
+from search.integer_states import node_from_ids
+
+Pos = Tuple[int, int]
+INF = float('inf')
+
+
+# INCREMENTAL PLANNER (D* LITE, KOENIG & LIKHACHEV): SEARCHES BACKWARD FROM G AND KEEPS ITS g/rhs
+# VALUES BETWEEN CALLS, SO AFTER WALLS CHANGE ONLY THE VERTICES WHOSE DISTANCE CHANGED ARE REPAIRED
+# STATES ARE ROW-MAJOR CELL IDS; MOVES ARE THE UNIT-COST 4-NEIGHBOR MOVES OF THE MAZE
+class DStarLite:
+    def __init__(self, maze: Maze, start: Optional[Pos] = None, goal: Optional[Pos] = None):
+        self.maze = maze
+        self.W = maze.W
+        self.start = tuple(start) if start is not None else maze.start
+        self._reset(tuple(goal) if goal is not None else maze.goal)
+
+    # FORGETS EVERYTHING AND PLANS TOWARDS A NEW GOAL (THE SEARCH IS ROOTED AT G, SO IT CANNOT BE REUSED)
+    def _reset(self, goal: Pos):
+        self.goal = goal
+        n = self.maze.H * self.W
+        self.g: List[float] = [INF] * n
+        self.rhs: List[float] = [INF] * n
+        self.km = 0.0
+        self._last = self.start
+        self._queue: List[Tuple[Tuple[float, float], int]] = []
+        self._queued: Dict[int, Tuple[float, float]] = {}
+        self.nodes_expanded = 0
+        g = self.maze.cell_id(goal)
+        self.rhs[g] = 0.0
+        self._push(g)
+
+    # MOVES THE GOAL (THE GUI CASE): A FULL RESTART
+    def set_goal(self, goal: Pos):
+        self._reset(tuple(goal))
+
+    # THE AGENT MOVED: KEYS ALREADY IN THE QUEUE STAY VALID THANKS TO THE KM OFFSET
+    def move_start(self, start: Pos):
+        start = tuple(start)
+        self.km += abs(start[0] - self._last[0]) + abs(start[1] - self._last[1])
+        self._last = start
+        self.start = start
+
+    # MANHATTAN DISTANCE FROM THE CURRENT START TO A CELL ID
+    def _h(self, u: int) -> float:
+        r, c = divmod(u, self.W)
+        return abs(r - self.start[0]) + abs(c - self.start[1])
+
+    # QUEUE KEY [min(g, rhs) + h + km, min(g, rhs)], COMPARED LEXICOGRAPHICALLY
+    def _key(self, u: int) -> Tuple[float, float]:
+        m = min(self.g[u], self.rhs[u])
+        return (m + self._h(u) + self.km, m)
+
+    # QUEUES U WITH ITS CURRENT KEY; OLDER ENTRIES OF U BECOME STALE AND ARE SKIPPED WHEN POPPED
+    def _push(self, u: int):
+        key = self._key(u)
+        self._queued[u] = key
+        heapq.heappush(self._queue, (key, u))
+        self.nodes_expanded += 1
+
+    # SMALLEST LIVE ENTRY OF THE QUEUE (STALE ONES ARE DROPPED ON THE WAY)
+    def _top(self):
+        queue = self._queue
+        while queue:
+            key, u = queue[0]
+            if self._queued.get(u) == key:
+                return key, u
+            heapq.heappop(queue)
+        return (INF, INF), -1
+
+    # OPEN 4-NEIGHBORS OF A CELL ID (EVERY MOVE COSTS 1, MOVES INTO WALLS COST INF)
+    def _neighbors(self, u: int) -> List[int]:
+        maze, W = self.maze, self.W
+        r, c = divmod(u, W)
+        out = []
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            q = (r + dr, c + dc)
+            if maze.in_bounds(q) and maze.passable(q):
+                out.append(u + dr * W + dc)
+        return out
+
+    # TRUE WHEN THE CELL ID IS NOT A WALL
+    def _open(self, u: int) -> bool:
+        return self.maze.passable(divmod(u, self.W))
+
+    # RECOMPUTES RHS(U) FROM ITS NEIGHBORS AND (RE)QUEUES U WHEN IT IS INCONSISTENT
+    # G ITSELF HAS RHS 0 WHILE OPEN; A WALLED G HAS RHS = g = INF, SO NOTHING IS ROUTED THROUGH IT
+    def _update_vertex(self, u: int):
+        if divmod(u, self.W) == self.goal:
+            if self._open(u):
+                self.rhs[u] = 0.0
+            else:
+                self.rhs[u] = self.g[u] = INF
+        else:
+            best = INF
+            if self._open(u):
+                for v in self._neighbors(u):
+                    if self.g[v] + 1.0 < best:
+                        best = self.g[v] + 1.0
+            self.rhs[u] = best
+        self._queued.pop(u, None)
+        if self.g[u] != self.rhs[u]:
+            self._push(u)
+
+    # PROCESSES INCONSISTENT VERTICES UNTIL S IS CONSISTENT AND NOTHING CHEAPER IS LEFT IN THE QUEUE
+    def _compute_shortest_path(self):
+        s = self.maze.cell_id(self.start)
+        while True:
+            key, u = self._top()
+            if u < 0 or (key >= self._key(s) and self.rhs[s] == self.g[s]):
+                return
+            new_key = self._key(u)
+            if key < new_key:
+                self._queued[u] = new_key
+                heapq.heappush(self._queue, (new_key, u))
+                continue
+            heapq.heappop(self._queue)
+            del self._queued[u]
+            if self.g[u] > self.rhs[u]:
+                # OVERCONSISTENT: U GOT CLOSER TO G, PROPAGATE TO ITS NEIGHBORS
+                self.g[u] = self.rhs[u]
+                for v in self._neighbors(u):
+                    self._update_vertex(v)
+            else:
+                # UNDERCONSISTENT: U GOT FARTHER (E.G. ITS PATH WAS BLOCKED), RESET AND RE-EVALUATE
+                self.g[u] = INF
+                for v in self._neighbors(u) + [u]:
+                    self._update_vertex(v)
+
+    # CHANGES CELLS OF THE MAZE ({(R, C): '#' OR '.'}) AND MARKS THE AFFECTED VERTICES AS INCONSISTENT
+    # NOTHING IS SEARCHED UNTIL THE NEXT REPLAN()
+    def update_cells(self, changed: Dict[Pos, str]):
+        self.maze.update_cells(changed)
+        W = self.W
+        for p in changed:
+            u = self.maze.cell_id(p)
+            self._update_vertex(u)
+            r, c = p
+            for q in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if self.maze.in_bounds(q):
+                    self._update_vertex(q[0] * W + q[1])
+
+    # REPAIRS THE SEARCH AND RETURNS (GOAL NODE, NODES QUEUED SINCE THE LAST CALL) OR NONE
+    # THE FIRST CALL IS A FULL BACKWARD SEARCH; LATER ONES ONLY TOUCH WHAT THE CHANGES INVALIDATED
+    # A WALLED G HAS NO PATH: ANSWER WITHOUT SEARCHING (THE QUEUED REPAIRS WAIT UNTIL G REOPENS)
+    def replan(self) -> Optional[Tuple[Node, int]]:
+        if not self._open(self.maze.cell_id(self.goal)):
+            return None
+        self._compute_shortest_path()
+        nodes_expanded = self.nodes_expanded
+        self.nodes_expanded = 0
+        s = self.maze.cell_id(self.start)
+        goal = self.maze.cell_id(self.goal)
+        if self.g[s] == INF or not self._open(s):
+            return None
+        # WALK DOWNHILL IN g FROM S TO G
+        ids = [s]
+        u = s
+        while u != goal:
+            u = min(self._neighbors(u), key=lambda v: self.g[v])
+            ids.append(u)
+        return node_from_ids(self.maze, ids), nodes_expanded
@@ -9,6 +9,7 @@ from core.maze_representation import Maze
 from core.maze_problem import MazeProblem
 from core.heuristics import h_manhattan_distance, h_euclidean_distance, h_inadmissible
 from core.problem import Problem
+from core.search_events import SearchTrace
 
 # INFORMED SEARCH
 from informed.greedy_best_first_search import greedy_best_first_search, reconstruct_path
@@ -16,26 +17,11 @@ from informed.a_star_search import a_star_table_search
 import search.visualize_matrix as visualize_matrix
 
 
-# COLLECTS ALL UNIQUE NODES FROM SNAPSHOTS FOR VISUALIZATION
-def _collect_tree_nodes(snapshots):
-    nodes = set()
-    for snap in snapshots:
-        if snap.get('reached'):
-            nodes.update(tuple(state) for state in snap['reached'])
-        for key in ('reached_F', 'reached_B'):
-            if key in snap:
-                nodes.update(tuple(state) for state in snap[key])
-    return nodes
-
-
-# GENERATES GIFS FOR INFORMED SEARCH (GREEDY OR A*) WITH SNAPSHOT COLLECTION
+# GENERATES GIFS FOR INFORMED SEARCH (GREEDY OR A*) FROM THE RECORDED SEARCH EVENTS
 def generate_gifs_informed(problem: Problem, matrix, heuristic: str = "manhattan", algorithm: str = "greedy", interval_ms: int | None = 100, out_file: str | None = None):
     
-    snapshots = []
-
-    # CALLBACK TO COLLECT SNAPSHOTS DURING SEARCH
-    def on_step(snapshot):
-        snapshots.append(snapshot.copy())
+    # RECORD THE SEARCH EVENTS (THE TRACE IS THE ON_STEP CALLBACK)
+    trace = SearchTrace()
 
     # BUILD HEURISTIC TABLE MATCHING MAZE COORDINATES
     heuristic_table_coordinate = {
@@ -52,9 +38,9 @@ def generate_gifs_informed(problem: Problem, matrix, heuristic: str = "manhattan
     result = None
     # RUN THE SELECTED INFORMED SEARCH ALGORITHM
     if algorithm.lower() in ("greedy", "greedy_best_first", "greedy_bfs"):
-        result = greedy_best_first_search(problem, f=lambda n: n.f, heuristic_table_coordinate=heuristic_table_coordinate, on_step=on_step)
+        result = greedy_best_first_search(problem, f=lambda n: n.f, heuristic_table_coordinate=heuristic_table_coordinate, on_step=trace)
     elif algorithm.lower() in ("astar", "a*", "a_star"):
-        result = a_star_table_search(problem, f=lambda n: n.g + n.h, heuristic_table_coordinate=heuristic_table_coordinate, on_step=on_step)
+        result = a_star_table_search(problem, f=lambda n: n.g + n.h, heuristic_table_coordinate=heuristic_table_coordinate, on_step=trace)
     else:
         print(f"Unknown algorithm '{algorithm}', supported: greedy, a_star")
         return
@@ -64,7 +50,7 @@ def generate_gifs_informed(problem: Problem, matrix, heuristic: str = "manhattan
         return None
     solution, nodes_expanded = result
 
-    if not snapshots:
+    if not trace.events:
         print('No snapshots were produced for visualization.')
         return None
 
@@ -101,9 +87,9 @@ def generate_gifs_informed(problem: Problem, matrix, heuristic: str = "manhattan
             f=lambda n: n.g,
             interval=interval_ms,
             precompute=True,
-            precomputed_snapshots=snapshots,
+            precomputed_trace=trace,
             final_path=reconstruct_path(solution) if solution else None,
-            tree_nodes=_collect_tree_nodes(snapshots),
+            tree_nodes=trace.tree_nodes(),
             final_hold_ms=5000,
             out_file=out_path,
         )
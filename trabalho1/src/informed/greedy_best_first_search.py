@@ -4,26 +4,24 @@ from typing import Optional, Tuple, Callable
 
 # INTERNAL PROJECT IMPORTS
 # CORE
-from core.heuristics import h_manhattan_distance, h_euclidean_distance, h_inadmissible
 from core.problem import Problem
 from core.node import Node
+from core.node_pool import NodePool, NO_PARENT
+from core.tie_breaking import make_tie_break
+from core.search_events import search_event, PUSH, IMPROVE, POP
 
 # SEARCH
 from search.measure_time_memory import measure_time_memory
+from search.integer_states import heuristic_table_for, csr_maze, csr_views, table_by_id, ids_from_parents, node_from_ids
 
 # COMPUTES GREEDY BEST-FIRST SEARCH USING SPECIFIED HEURISTIC
 def compute_greedy_best_first_search(problem: Problem, heuristic: str):
-    # BUILD HEURISTIC TABLE FOR ALL COORDINATES
-    heuristic_table_coordinate = {
-        (x, y): problem.heuristic(
-            (x, y),
-            problem.goal,
-            function_h=h_manhattan_distance if heuristic == "manhattan" else
-                       h_euclidean_distance if heuristic == "euclidean" else
-                       h_inadmissible
-        )
-        for x in range(problem.maze.W) for y in range(problem.maze.H)
-    }
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    heuristic_table_coordinate = heuristic_table_for(problem, heuristic)
 
     # RUN GREEDY BEST-FIRST SEARCH AND MEASURE TIME/MEMORY
     result, elapsed_time, memory_used, current, peak = measure_time_memory(
@@ -47,46 +45,103 @@ def compute_greedy_best_first_search(problem: Problem, heuristic: str):
 
 
 # GREEDY BEST-FIRST SEARCH USING PRECOMPUTED HEURISTIC TABLE
+# TIE_BREAK: ORDER AMONG EQUAL f, ONE OF CORE.TIE_BREAKING.TIE_BREAKS (SEEDED BY TIE_BREAK_SEED WHEN 'random')
 def greedy_best_first_search(problem: Problem, f: Callable[[Node], float],
                              heuristic_table_coordinate: dict,
-                             on_step: Callable[[dict], None] | None = None) -> Optional[Tuple[Node, int]]:
-    start = Node(state=problem.initial, f=heuristic_table_coordinate[problem.initial], h=heuristic_table_coordinate[problem.initial])
-    frontier = []
-    heapq.heappush(frontier, (f(start), start))
-    reached = {start.state: start}
+                             on_step: Callable[[dict], None] | None = None,
+                             tie_break: str = 'fifo',
+                             tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+
+    # FAST PATH: INTEGER CELL IDS OVER THE MAZE CSR ADJACENCY
+    if on_step is None:
+        maze = csr_maze(problem)
+        if maze is not None:
+            return greedy_best_first_search_csr(problem, maze, f, heuristic_table_coordinate, tie_break,
+                                                tie_break_seed)
+
+    # NODES LIVE IN A POOL OF ARRAYS; THE FRONTIER AND REACHED HOLD POOL INDICES
+    h0 = heuristic_table_coordinate[problem.initial]
+    pool = NodePool()
+    root = pool.add(problem.initial, NO_PARENT, None, 0.0, h0)
+    # F IS EVALUATED ON A SINGLE REUSED NODE INSTEAD OF ONE NODE PER CHILD
+    probe = Node(state=problem.initial, g=0.0, h=h0, f=h0)
+    tie = make_tie_break(tie_break, tie_break_seed)
+    frontier = [(f(probe), tie(0.0, h0), root)]
+    reached = {problem.initial: root}
+    states, g_of, h_of = pool.states, pool.g, pool.h
     nodes_expanded = 0
 
     while frontier:
-        _, node = heapq.heappop(frontier)
-        if problem.is_goal(node.state):
+        _, _, i = heapq.heappop(frontier)
+        state = states[i]
+        if on_step:
+            on_step(search_event(POP, state, nodes_expanded))
+        if problem.is_goal(state):
+            node = pool.node(i)
+            node.f = node.h
             return node, nodes_expanded
 
         # EXPAND CHILDREN
-        for child in expand(problem, node, heuristic_table_coordinate):
-            if on_step:
-                snapshot = {
-                    'current': node.state,
-                    'frontier': [n.state for _, n in frontier],
-                    'reached': list(reached.keys()),
-                    'event': 'expand_node',
-                    'nodes_expanded': nodes_expanded,
-                }
-                on_step(snapshot)
-            existing = reached.get(child.state)
-            if existing is None or child.f < existing.f:
-                reached[child.state] = child
-                heapq.heappush(frontier, (f(child), child))
+        g = g_of[i]
+        for action in problem.actions(state):
+            s2 = problem.result(state, action)
+            h_val = heuristic_table_coordinate[s2]
+            existing = reached.get(s2)
+            if existing is None or h_val < h_of[existing]:
+                g2 = g + problem.action_cost(state, action, s2)
+                j = pool.add(s2, i, action, g2, h_val)
+                reached[s2] = j
+                probe.state = s2
+                probe.g = g2
+                probe.h = probe.f = h_val
+                heapq.heappush(frontier, (f(probe), tie(g2, h_val), j))
                 nodes_expanded += 1
 
                 if on_step:
-                    snapshot = {
-                        'current': child.state,
-                        'frontier': [n.state for _, n in frontier],
-                        'reached': list(reached.keys()),
-                        'event': 'push_child',
-                        'nodes_expanded': nodes_expanded,
-                    }
-                    on_step(snapshot)
+                    on_step(search_event(PUSH if existing is None else IMPROVE, s2, nodes_expanded))
+    return None
+
+
+# GREEDY BEST-FIRST SEARCH OVER INTEGER CELL IDS (A STATE IS PUSHED ONLY ONCE, AS IN THE NODE VERSION)
+def greedy_best_first_search_csr(problem: Problem, maze, f: Callable[[Node], float],
+                                 heuristic_table_coordinate: dict,
+                                 tie_break: str = 'fifo',
+                                 tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
+    indptr, indices = csr_views(maze)
+    h = table_by_id(maze, heuristic_table_coordinate)
+    start = maze.cell_id(problem.initial)
+    goal = maze.cell_id(problem.goal)
+    h0 = heuristic_table_coordinate[problem.initial]
+
+    # F IS EVALUATED ON A SINGLE REUSED NODE INSTEAD OF ONE NODE PER CHILD
+    probe = Node(state=start, g=0.0, h=h0, f=h0)
+    tie = make_tie_break(tie_break, tie_break_seed)
+    frontier = [(f(probe), tie(0.0, h0), start, 0.0)]
+    parent = {start: -1}
+    nodes_expanded = 0
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    while frontier:
+        _, _, u, g = heappop(frontier)
+        if u == goal:
+            node = node_from_ids(maze, ids_from_parents(parent, u))
+            node.h = node.f = h[u]
+            return node, nodes_expanded
+
+        g2 = g + 1.0
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if v not in parent:
+                parent[v] = u
+                h_val = h[v]
+                probe.state = v
+                probe.g = g2
+                probe.h = probe.f = h_val
+                heappush(frontier, (f(probe), tie(g2, h_val), v, g2))
+                nodes_expanded += 1
     return None
 
 
@@ -105,5 +160,9 @@ def reconstruct_path(node: Node):
     path = []
     while node:
         path.append(node.state)
+        # CONTRACTED CORRIDOR: THE ACTION CARRIES THE CELLS WALKED TO REACH THIS NODE
+        cells = getattr(node.action, 'cells', None)
+        if cells:
+            path.extend(reversed(cells))
         node = node.parent
     return list(reversed(path))
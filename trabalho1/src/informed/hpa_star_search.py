@@ -0,0 +1,173 @@
+# EXTERNAL IMPORTS
+import heapq
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.cluster_abstraction import ClusterAbstraction
+from core.problem import Problem
+from core.node import Node
+from core.tie_breaking import make_tie_break
+from core.search_events import search_event, PUSH, IMPROVE, POP
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import node_from_ids
+
+# INFORMED SEARCH
+from informed.a_star_search import reconstruct_path
+
+
+# COMPUTES HPA* (BUILDS OR REUSES THE CLUSTER ABSTRACTION OF THE MAZE, THEN MEASURES ONE QUERY)
+def compute_hpa_star_search(problem: Problem, cluster_size: int = 32):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    # ONE-TIME PREPROCESSING, KEPT OUT OF THE QUERY MEASUREMENT
+    _, build_time, _, _, _ = measure_time_memory(problem.maze.cluster_abstraction, cluster_size)
+
+    result, elapsed_time, memory_used, current, peak = measure_time_memory(
+        hpa_star_search, problem, cluster_size
+    )
+
+    if result is None:
+        print("No path found")
+        return
+
+    goal_node, nodes_expanded = result
+
+    if goal_node:
+        path = reconstruct_path(goal_node)
+        print("Path:", path)
+        print("Number of nodes expanded:", nodes_expanded)
+        print("Cost of path:", goal_node.g)
+        print(f"Abstraction build time: {build_time:.3f} milliseconds")
+        print(f"Time taken: {elapsed_time:.3f} milliseconds")
+        print(f"Memory used: {memory_used:.12f} B")
+        print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
+
+
+# BFS FROM A CELL THAT NEVER LEAVES ITS CLUSTER; RETURNS THE PARENT MAP (ROOT -> -1)
+# STOPS EARLY ONCE STOP_AT IS REACHED
+def _local_bfs(abstraction: ClusterAbstraction, open_flat, source: int,
+               stop_at: int = -1) -> Dict[int, int]:
+    W = abstraction.W
+    r0, r1, c0, c1 = abstraction.cluster_bounds(abstraction.cluster_of(source))
+    parent = {source: -1}
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        if u == stop_at:
+            break
+        r, c = divmod(u, W)
+        for v, ok in ((u - W, r > r0), (u + W, r + 1 < r1), (u - 1, c > c0), (u + 1, c + 1 < c1)):
+            if ok and v not in parent and open_flat[v]:
+                parent[v] = u
+                queue.append(v)
+    return parent
+
+
+# CELLS FROM U TO V (BOTH INCLUDED) INSIDE THEIR SHARED CLUSTER, OR [U, V] WHEN THEY ARE NEIGHBORS
+def _refine(abstraction: ClusterAbstraction, open_flat, u: int, v: int) -> List[int]:
+    if abs(u - v) == 1 or abs(u - v) == abstraction.W:
+        return [u, v]
+    parent = _local_bfs(abstraction, open_flat, u, stop_at=v)
+    cells = []
+    i = v
+    while i != -1:
+        cells.append(i)
+        i = parent[i]
+    cells.reverse()
+    return cells
+
+
+# HPA* SEARCH: A* ON THE CACHED ABSTRACT GRAPH (ENTRANCES + INTRA-CLUSTER DISTANCES), THEN EACH
+# ABSTRACT EDGE IS REFINED INSIDE ITS CLUSTER; S AND G ARE LINKED TO THEIR CLUSTER'S ENTRANCES PER QUERY
+# THE RESULT IS NEAR-OPTIMAL (ENTRANCES ARE SAMPLED); NODES_EXPANDED COUNTS ABSTRACT PUSHES
+def hpa_star_search(problem: Problem, cluster_size: int = 32,
+                    on_step: Optional[Callable[[dict], None]] = None,
+                    tie_break: str = 'lifo',
+                    tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+
+    maze = problem.maze
+    abstraction = maze.cluster_abstraction(cluster_size)
+    open_flat = memoryview(maze.open_mask().reshape(-1))
+    W = maze.W
+    start = maze.cell_id(problem.initial)
+    goal = maze.cell_id(problem.goal)
+    gr, gc = problem.goal
+
+    # TEMPORARY EDGES FOR S AND G (NOT STORED IN THE SHARED ABSTRACTION)
+    extra: Dict[int, Dict[int, float]] = {}
+
+    def link(a: int, b: int, cost: float):
+        extra.setdefault(a, {})[b] = cost
+        extra.setdefault(b, {})[a] = cost
+
+    for endpoint in (start, goal):
+        seen = _local_bfs(abstraction, open_flat, endpoint)
+        targets = list(abstraction.nodes.get(abstraction.cluster_of(endpoint), ()))
+        if endpoint == start:
+            targets.append(goal)
+        for t in targets:
+            if t != endpoint and t in seen:
+                d = 0
+                i = t
+                while seen[i] != -1:
+                    i = seen[i]
+                    d += 1
+                link(endpoint, t, float(d))
+
+    def neighbors(u: int):
+        yield from abstraction.edges.get(u, {}).items()
+        yield from extra.get(u, {}).items()
+
+    def h(u: int) -> float:
+        r, c = divmod(u, W)
+        return float(abs(r - gr) + abs(c - gc))
+
+    tie = make_tie_break(tie_break, tie_break_seed)
+    frontier = [(h(start), tie(0.0, h(start)), start, 0.0)]
+    best = {start: 0.0}
+    parent = {start: -1}
+    closed = set()
+    nodes_expanded = 0
+
+    while frontier:
+        _, _, u, g = heapq.heappop(frontier)
+        if on_step:
+            on_step(search_event(POP, divmod(u, W), nodes_expanded))
+        if u == goal:
+            abstract_path = []
+            i = u
+            while i != -1:
+                abstract_path.append(i)
+                i = parent[i]
+            abstract_path.reverse()
+            cells = [start]
+            for a, b in zip(abstract_path, abstract_path[1:]):
+                cells.extend(_refine(abstraction, open_flat, a, b)[1:])
+            return node_from_ids(maze, cells), nodes_expanded
+        if u in closed:
+            continue
+        closed.add(u)
+
+        for v, cost in neighbors(u):
+            g2 = g + cost
+            existing = best.get(v)
+            if existing is None or g2 < existing:
+                best[v] = g2
+                parent[v] = u
+                h_v = h(v)
+                heapq.heappush(frontier, (g2 + h_v, tie(g2, h_v), v, g2))
+                nodes_expanded += 1
+
+                if on_step:
+                    on_step(search_event(PUSH if existing is None else IMPROVE, divmod(v, W), nodes_expanded))
+    return None
@@ -0,0 +1,152 @@
+# EXTERNAL IMPORTS
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.problem import Problem
+from core.node import Node
+from core.search_events import search_event, POP
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import heuristic_table_for, state_space, node_from_ids
+
+# INFORMED SEARCH
+from informed.a_star_search import reconstruct_path
+
+# TRANSPOSITION TABLE CAPACITY (STATES); ONCE FULL, NEW STATES ARE SEARCHED WITHOUT BEING REMEMBERED
+IDA_TABLE_SIZE = 1 << 18
+
+INF = float('inf')
+
+
+# COMPUTES IDA* USING A SPECIFIED HEURISTIC
+def compute_ida_star_search(problem: Problem, heuristic: str, table_size: int = IDA_TABLE_SIZE):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    heuristic_table_coordinate = heuristic_table_for(problem, heuristic)
+
+    # CALL IDA* AND MEASURE TIME/MEMORY
+    result, elapsed_time, memory_used, current, peak = measure_time_memory(
+        ida_star_table_search,
+        problem,
+        heuristic_table_coordinate,
+        table_size
+    )
+
+    if result is None:
+        print("No path found")
+        return
+
+    goal_node, nodes_expanded = result
+
+    if goal_node:
+        print("Path:", reconstruct_path(goal_node))
+        print("Number of nodes expanded:", nodes_expanded)
+        print("Cost of path:", goal_node.g)
+        print(f"Time taken: {elapsed_time:.3f} milliseconds")
+        print(f"Memory used: {memory_used:.12f} B")
+        print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
+
+
+# ITERATIVE-DEEPENING A* (KORF): DEPTH-FIRST PASSES BOUNDED BY f = g + h <= THRESHOLD, THE THRESHOLD
+# GROWING TO THE SMALLEST f THAT EXCEEDED IT; ONLY THE CURRENT PATH AND A TRANSPOSITION TABLE ARE KEPT
+# THE TABLE HOLDS THE SMALLEST g EACH STATE WAS REACHED WITH IN THIS PASS: REACHING IT AGAIN WITH
+# g >= THAT VALUE CANNOT FIND ANYTHING NEW, SO THE BRANCH IS CUT (THE TABLE IS CAPPED AT TABLE_SIZE)
+# ON_STEP GETS A POP EVENT EACH TIME A STATE JOINS THE PATH (THE ROOT ONCE PER PASS); THERE IS NO FRONTIER
+def ida_star_table_search(problem: Problem, heuristic_table_coordinate: Dict[tuple, float],
+                          table_size: int = IDA_TABLE_SIZE,
+                          on_step: Optional[Callable[[dict], None]] = None) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+
+    maze, start, goal, h, successors = state_space(problem, heuristic_table_coordinate, csr=on_step is None)
+
+    # CHILDREN ARE TRIED CLOSEST-TO-G FIRST, WHICH FINDS THE GOAL EARLY IN THE LAST PASS
+    def ordered(u):
+        children = successors(u)
+        children.sort(key=lambda child: h(child[0]))
+        return iter(children)
+
+    def solution(path, actions, costs) -> Node:
+        if maze is not None:
+            return node_from_ids(maze, path)
+        node = None
+        for s, action, g in zip(path, actions, costs):
+            node = Node(state=s, parent=node, action=action, g=g, h=h(s), f=g + h(s))
+        return node
+
+    if start == goal:
+        return solution([start], [None], [0.0]), 0
+
+    nodes_expanded = 0
+    threshold = h(start)
+    while threshold < INF:
+        # ONE DEPTH-FIRST PASS; THE STACK HOLDS THE CURRENT PATH AND AN ITERATOR OVER EACH STATE'S CHILDREN
+        path = [start]
+        actions = [None]
+        costs = [0.0]
+        stack = [ordered(start)]
+        on_path = {start}
+        table = {start: 0.0}
+        next_threshold = INF
+        if on_step:
+            on_step(search_event(POP, start, nodes_expanded))
+
+        while stack:
+            step = next(stack[-1], None)
+            if step is None:
+                stack.pop()
+                on_path.discard(path.pop())
+                actions.pop()
+                costs.pop()
+                continue
+
+            v, action, cost = step
+            g2 = costs[-1] + cost
+            f2 = g2 + h(v)
+            if f2 > threshold:
+                if f2 < next_threshold:
+                    next_threshold = f2
+                continue
+            if v in on_path:
+                continue
+            seen = table.get(v)
+            if seen is not None and seen <= g2:
+                continue
+            if seen is not None or len(table) < table_size:
+                table[v] = g2
+            nodes_expanded += 1
+
+            path.append(v)
+            actions.append(action)
+            costs.append(g2)
+            if v == goal:
+                return solution(path, actions, costs), nodes_expanded
+
+            if on_step:
+                on_step(search_event(POP, v, nodes_expanded))
+
+            on_path.add(v)
+            stack.append(ordered(v))
+
+        threshold = next_threshold
+    return None
+
+
+# PUBLIC WRAPPER FOR IDA* THAT BUILDS HEURISTIC TABLE (SAME SHAPE AS A_STAR_SEARCH)
+def ida_star_search(problem: Problem, h: Optional[Callable[[Any, Any], float]] = None,
+                    table_size: int = IDA_TABLE_SIZE,
+                    on_step: Optional[Callable[[dict], None]] = None) -> Optional[Tuple[Node, int]]:
+    heuristic_fn = h or (lambda s, goal: problem.heuristic(s, goal))
+
+    heuristic_table_coordinate = {
+        (r, c): heuristic_fn((r, c), problem.goal)
+        for r in range(problem.maze.H) for c in range(problem.maze.W)
+    }
+
+    return ida_star_table_search(problem, heuristic_table_coordinate, table_size, on_step=on_step)
@@ -9,12 +9,15 @@ import json
 # CORE
 from core.maze_representation import Maze
 from core.maze_problem import MazeProblem
+from core.maze_generator import iter_mazes_from_file
 from core.heuristics import h_manhattan_distance, h_euclidean_distance, h_inadmissible
 from core.node import Node
 
 # INFORMED SEARCH
 from informed.a_star_search import a_star_table_search 
 from informed.greedy_best_first_search import greedy_best_first_search, reconstruct_path
+from informed.jump_point_search import jump_point_table_search
+from informed.ara_star_search import ara_star_table_search
 
 # SEARCH 
 from search.measure_time_memory import measure_time_memory
@@ -23,14 +26,19 @@ from search.measure_time_memory import measure_time_memory
 from comparisons.informed_plots import plot_informed_metrics
 
 
-def compare_informed_search_algorithms(matrix: List[List[str]], num_runs: int = 15) -> Dict[str, str]:
+# COMPARES A*, GREEDY, JPS AND ARA* FOR EVERY HEURISTIC (SAVE=FALSE SKIPS THE JSON AND PLOTS)
+# ARA* STOPS AFTER ARA_BUDGET_MS MILLISECONDS (OR EARLIER ONCE ITS SOLUTION IS PROVEN OPTIMAL)
+def compare_informed_search_algorithms(matrix: List[List[str]], num_runs: int = 15, save: bool = True,
+                                       ara_budget_ms: float = 1000.0) -> Dict[str, str]:
     # CREATE A PROBLEM INSTANCE FROM THE MAZE MATRIX
     problem = MazeProblem(Maze(matrix))
     
     # DEFINE KEYS FOR ALL ALGORITHM-HEURISTIC COMBINATIONS
     keys_to_test = [
         'A*-Manhattan', 'A*-Euclidean', 'A*-Inadmissible',
-        'Greedy-Manhattan', 'Greedy-Euclidean', 'Greedy-Inadmissible'
+        'Greedy-Manhattan', 'Greedy-Euclidean', 'Greedy-Inadmissible',
+        'JPS-Manhattan', 'JPS-Euclidean',
+        'ARA*-Manhattan'
     ]
     
     # INITIALIZE METRIC STORAGE
@@ -95,6 +103,35 @@ def compare_informed_search_algorithms(matrix: List[List[str]], num_runs: int =
                 memories[name].append(m)
                 currents[name].append(c)
 
+        # --- JUMP POINT SEARCHES (ADMISSIBLE HEURISTICS ONLY) ---
+        for name, table in zip(
+            ['JPS-Manhattan','JPS-Euclidean'],
+            [heuristic_table_manh, heuristic_table_euc]
+        ):
+            res, t, m, c, p = measure_time_memory(jump_point_table_search, problem, f_astar, table)
+            if res:
+                sol, ne = res
+                found[name] += 1
+                times[name].append(t)
+                nodes[name].append(ne)
+                costs[name].append(sol.g)
+                peaks[name].append(p)
+                memories[name].append(m)
+                currents[name].append(c)
+
+        # --- ARA* (ANYTIME, BEST SOLUTION WITHIN THE BUDGET) ---
+        name = 'ARA*-Manhattan'
+        res, t, m, c, p = measure_time_memory(ara_star_table_search, problem, heuristic_table_manh, ara_budget_ms)
+        if res:
+            sol, ne = res
+            found[name] += 1
+            times[name].append(t)
+            nodes[name].append(ne)
+            costs[name].append(sol.g)
+            peaks[name].append(p)
+            memories[name].append(m)
+            currents[name].append(c)
+
     # COMPUTE AVERAGES AND ASSEMBLE FINAL METRICS DICTIONARY
     metrics = {}
     for key in times:
@@ -113,6 +150,9 @@ def compare_informed_search_algorithms(matrix: List[List[str]], num_runs: int =
         metrics[f'{key} avg memory (B)'] = f"{avg_memory:.3f}"
         metrics[f'{key} avg current (KB)'] = f"{(avg_current / 1024):.3f}"
     
+    if not save:
+        return metrics
+
     output_filename = '././data/output/metrics/metrics_informed.json'
 
     with open(output_filename, 'w', encoding='utf-8') as f:
@@ -131,3 +171,12 @@ def compare_informed_search_algorithms(matrix: List[List[str]], num_runs: int =
 
 
     return metrics
+
+
+# COMPARES THE ALGORITHMS ON EVERY MAZE OF A COLLECTION FILE, STREAMING ONE MAZE AT A TIME
+# MAZES WHOSE G IS NOT CONNECTED TO S ARE SKIPPED (THEIR INDEX K IS NOT YIELDED)
+def compare_informed_search_collection(file_path: str, num_runs: int = 15):
+    for k, maze in enumerate(iter_mazes_from_file(file_path)):
+        if not maze.connected(maze.start, maze.goal):
+            continue
+        yield k, compare_informed_search_algorithms(maze.grid, num_runs, save=False)
@@ -0,0 +1,207 @@
+# EXTERNAL IMPORTS
+import heapq
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.maze_problem import MazeProblem
+from core.maze_representation import Maze
+from core.problem import Problem
+from core.node import Node
+from core.tie_breaking import make_tie_break
+from core.search_events import search_event, PUSH, IMPROVE, POP
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import heuristic_table_for
+
+# INFORMED SEARCH
+from informed.a_star_search import a_star_table_search, reconstruct_path
+
+Pos = Tuple[int, int]
+
+
+# STRAIGHT JUMP BETWEEN TWO JUMP POINTS (SAME ROW OR SAME COLUMN)
+# CELLS ARE ONLY LISTED WHEN RECONSTRUCT_PATH ASKS FOR THEM
+class Jump(NamedTuple):
+    start: Pos
+    end: Pos
+    cost: float
+
+    # INTERMEDIATE CELLS FROM START TO END (BOTH EXCLUDED)
+    @property
+    def cells(self) -> Tuple[Pos, ...]:
+        (r0, c0), (r1, c1) = self.start, self.end
+        dr = (r1 > r0) - (r1 < r0)
+        dc = (c1 > c0) - (c1 < c0)
+        return tuple((r0 + k * dr, c0 + k * dc) for k in range(1, int(self.cost)))
+
+    # SAME JUMP WALKED IN THE OPPOSITE DIRECTION
+    def reversed(self) -> 'Jump':
+        return Jump(self.end, self.start, self.cost)
+
+
+# COMPUTES JUMP POINT SEARCH USING A SPECIFIED HEURISTIC
+def compute_jump_point_search(problem: Problem, heuristic: str):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    heuristic_table_coordinate = heuristic_table_for(problem, heuristic)
+
+    # CALL JPS AND MEASURE TIME/MEMORY
+    result, elapsed_time, memory_used, current, peak = measure_time_memory(
+        jump_point_table_search,
+        problem,
+        lambda n: n.g + n.h,
+        heuristic_table_coordinate
+    )
+
+    if result is None:
+        print("No path found")
+        return
+
+    goal_node, nodes_expanded = result
+
+    if goal_node:
+        path = reconstruct_path(goal_node)
+        print("Path:", path)
+        print("Number of nodes expanded:", nodes_expanded)
+        print("Cost of path:", goal_node.g)
+        print(f"Time taken: {elapsed_time:.3f} milliseconds")
+        print(f"Memory used: {memory_used:.12f} B")
+        print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
+
+
+# PADDED ROW-MAJOR OPEN MAP: CELL (R, C) IS AT (R + 1) * (W + 2) + C + 1, THE BORDER IS ALWAYS BLOCKED
+def _padded_open_map(maze: Maze) -> bytes:
+    padded = np.zeros((maze.H + 2, maze.W + 2), dtype=bool)
+    padded[1:-1, 1:-1] = maze.open_mask()
+    return padded.tobytes()
+
+
+# JUMP POINT SEARCH FOR 4-CONNECTED UNIT-COST GRIDS, SAME CONTRACT AS A_STAR_TABLE_SEARCH
+# HORIZONTAL MOVES GO FIRST (CANONICAL ORDER): A HORIZONTAL JUMP STOPS AT A FORCED NEIGHBOR ABOVE
+# OR BELOW; A VERTICAL JUMP ALSO STOPS WHEN A HORIZONTAL JUMP FROM THE CELL WOULD FIND A JUMP POINT
+# ONLY JUMP POINTS ENTER THE FRONTIER; NODE.ACTION IS A JUMP, SO RECONSTRUCT_PATH RETURNS EVERY CELL
+def jump_point_table_search(problem: Problem, f: Callable[[Node], float],
+                            heuristic_table_coordinate: Dict[tuple, float],
+                            on_step: Optional[Callable[[dict], None]] = None,
+                            tie_break: str = 'lifo',
+                            tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+
+    # JUMPING ASSUMES THE PLAIN UNIT-COST 4-CONNECTED MOVES OF MAZEPROBLEM
+    if type(problem) is not MazeProblem:
+        return a_star_table_search(problem, f, heuristic_table_coordinate, on_step=on_step, tie_break=tie_break,
+                                   tie_break_seed=tie_break_seed)
+
+    maze = problem.maze
+    stride = maze.W + 2
+    open_map = _padded_open_map(maze)
+    goal = problem.goal
+    goal_key = (goal[0] + 1) * stride + goal[1] + 1
+
+    # SCANS ALONG A ROW; RETURNS THE JUMP POINT OR NONE
+    def jump_horizontal(r: int, c: int, dc: int) -> Optional[Pos]:
+        k = (r + 1) * stride + c + 1
+        while True:
+            k += dc
+            c += dc
+            if not open_map[k]:
+                return None
+            if k == goal_key:
+                return (r, c)
+            # FORCED NEIGHBOR: OPEN ABOVE/BELOW WHILE THE CELL BEHIND IT IS BLOCKED
+            if (open_map[k - stride] and not open_map[k - stride - dc]) or \
+               (open_map[k + stride] and not open_map[k + stride - dc]):
+                return (r, c)
+
+    # SCANS ALONG A COLUMN; RETURNS THE JUMP POINT OR NONE
+    def jump_vertical(r: int, c: int, dr: int) -> Optional[Pos]:
+        step = dr * stride
+        k = (r + 1) * stride + c + 1
+        while True:
+            k += step
+            r += dr
+            if not open_map[k]:
+                return None
+            if k == goal_key:
+                return (r, c)
+            if (open_map[k - 1] and not open_map[k - 1 - step]) or \
+               (open_map[k + 1] and not open_map[k + 1 - step]):
+                return (r, c)
+            # A HORIZONTAL BRANCH FROM HERE REACHES A JUMP POINT: THIS CELL IS A TURNING POINT
+            if jump_horizontal(r, c, 1) is not None or jump_horizontal(r, c, -1) is not None:
+                return (r, c)
+
+    # PRUNED DIRECTIONS: ALL FOUR AT THE START, OTHERWISE FORWARD PLUS BOTH PERPENDICULARS
+    def directions(node: Node) -> List[Pos]:
+        if node.parent is None:
+            return [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        (r0, c0), (r1, c1) = node.parent.state, node.state
+        dr = (r1 > r0) - (r1 < r0)
+        dc = (c1 > c0) - (c1 < c0)
+        if dc:
+            return [(0, dc), (-1, 0), (1, 0)]
+        return [(dr, 0), (0, -1), (0, 1)]
+
+    h0 = heuristic_table_coordinate.get(problem.initial, 0.0)
+    start = Node(state=problem.initial, g=0.0, h=h0, f=h0)
+    tie = make_tie_break(tie_break, tie_break_seed)
+    frontier = [(f(start), tie(0.0, h0), start)]
+    explored = {start.state: start}
+    closed = set()
+    nodes_expanded = 0
+
+    while frontier:
+        _, _, node = heapq.heappop(frontier)
+        if on_step:
+            on_step(search_event(POP, node.state, nodes_expanded))
+        if problem.is_goal(node.state):
+            return node, nodes_expanded
+        if node.state in closed:
+            continue
+        closed.add(node.state)
+
+        r, c = node.state
+        for dr, dc in directions(node):
+            point = jump_horizontal(r, c, dc) if dc else jump_vertical(r, c, dr)
+            if point is None:
+                continue
+
+            cost = float(abs(point[0] - r) + abs(point[1] - c))
+            g2 = node.g + cost
+            existing = explored.get(point)
+            if existing is None or g2 < existing.g:
+                h_val = heuristic_table_coordinate.get(point, 0.0)
+                child = Node(state=point, parent=node, action=Jump(node.state, point, cost),
+                             g=g2, h=h_val, f=g2 + h_val)
+                explored[point] = child
+                heapq.heappush(frontier, (f(child), tie(g2, h_val), child))
+                nodes_expanded += 1
+
+                if on_step:
+                    on_step(search_event(PUSH if existing is None else IMPROVE, child.state, nodes_expanded))
+    return None
+
+
+# PUBLIC WRAPPER FOR JPS THAT BUILDS THE HEURISTIC TABLE (SAME SIGNATURE AS A_STAR_SEARCH)
+def jump_point_search(problem: Problem, h: Optional[Callable[[Any, Any], float]] = None,
+                      on_step: Optional[Callable[[dict], None]] = None,
+                      tie_break: str = 'lifo',
+                      tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
+    heuristic_fn = h or (lambda s, goal: problem.heuristic(s, goal))
+
+    heuristic_table_coordinate = {
+        (r, c): heuristic_fn((r, c), problem.goal)
+        for r in range(problem.maze.H) for c in range(problem.maze.W)
+    }
+
+    return jump_point_table_search(problem, f=lambda n: n.g + n.h,
+                                   heuristic_table_coordinate=heuristic_table_coordinate, on_step=on_step,
+                                   tie_break=tie_break, tie_break_seed=tie_break_seed)
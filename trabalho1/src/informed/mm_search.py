@@ -0,0 +1,267 @@
+# EXTERNAL IMPORTS
+import heapq
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.maze_generator import generate_maze_rows
+from core.maze_problem import MazeProblem
+from core.maze_representation import Maze
+from core.problem import Problem
+from core.node import Node
+from core.search_events import search_event, PUSH, IMPROVE, POP, MEET, FORWARD, BACKWARD
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import heuristic_table_for, csr_maze, state_space, node_from_ids
+
+# INFORMED SEARCH
+from informed.a_star_search import a_star_table_search, reconstruct_path
+
+# UNINFORMED SEARCH
+from uninformed.bidirectional_best_first_search import reverse_action
+from uninformed.dijkstra import dijkstra
+
+INF = float('inf')
+
+
+# COMPUTES MM (BIDIRECTIONAL HEURISTIC SEARCH) USING A SPECIFIED HEURISTIC IN BOTH DIRECTIONS
+def compute_mm_search(problem: Problem, heuristic: str):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    # THE BACKWARD SEARCH RUNS FROM G TO S, SO ITS TABLE IS BUILT TOWARDS S
+    problem_B = MazeProblem(problem.maze, problem.goal, problem.initial)
+    heuristic_table_F = heuristic_table_for(problem, heuristic)
+    heuristic_table_B = heuristic_table_for(problem_B, heuristic)
+
+    # CALL MM AND MEASURE TIME/MEMORY
+    result, elapsed_time, memory_used, current, peak = measure_time_memory(
+        mm_table_search,
+        problem,
+        problem_B,
+        heuristic_table_F,
+        heuristic_table_B
+    )
+
+    if result is None:
+        print("No path found")
+        return
+
+    goal_node, nodes_expanded = result
+
+    if goal_node:
+        print("Path:", reconstruct_path(goal_node))
+        print("Number of nodes expanded:", nodes_expanded)
+        print("Cost of path:", goal_node.g)
+        print(f"Time taken: {elapsed_time:.3f} milliseconds")
+        print(f"Memory used: {memory_used:.12f} B")
+        print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
+
+
+# ONE DIRECTION OF MM: g OF EVERY REACHED STATE, THE OPEN ONES, THEIR PARENTS, AND THREE LAZY HEAPS
+# (PRIORITY, f AND g) SO THE MINIMA USED BY THE STOPPING RULE ARE READ IN O(1) AMORTIZED
+class _Side:
+    def __init__(self, start, h: Callable[[Any], float], successors: Callable[[Any], list]):
+        self.h = h
+        self.successors = successors
+        self.reached: Dict[Any, float] = {start: 0.0}
+        self.open: Dict[Any, float] = {}
+        self.parent: Dict[Any, Any] = {start: None}
+        self.by_priority: list = []
+        self.by_f: list = []
+        self.by_g: list = []
+        self.push(start, 0.0, 0)
+
+    # OPENS A STATE WITH A NEW g; PR = max(f, 2g) IS THE MM PRIORITY, TIES GO TO THE DEEPER STATE
+    def push(self, s, g: float, seq: int):
+        f = g + self.h(s)
+        self.open[s] = g
+        heapq.heappush(self.by_priority, (max(f, 2 * g), -g, seq, s, g))
+        heapq.heappush(self.by_f, (f, -g, seq, s, g))
+        heapq.heappush(self.by_g, (g, 0, seq, s, g))
+
+    # SMALLEST KEY OF A LAZY HEAP WHOSE ENTRY IS STILL OPEN WITH THE SAME g (STALE ENTRIES ARE DROPPED)
+    def top(self, heap: list) -> float:
+        open_ = self.open
+        while heap:
+            key, _, _, s, g = heap[0]
+            if open_.get(s) == g:
+                return key
+            heapq.heappop(heap)
+        return INF
+
+    # CLOSES AND RETURNS THE OPEN STATE WITH THE SMALLEST PRIORITY
+    def pop(self):
+        self.top(self.by_priority)
+        _, _, _, s, g = heapq.heappop(self.by_priority)
+        del self.open[s]
+        return s, g
+
+
+# MM (HOLTE, FELNER, SHARON & STURTEVANT): BIDIRECTIONAL A* THAT EXPANDS THE SIDE WITH THE SMALLEST
+# PRIORITY max(g + h, 2g), SO THE TWO SEARCHES ARE GUARANTEED TO MEET IN THE MIDDLE
+# U IS THE BEST PATH SEEN THROUGH A STATE REACHED BY BOTH SIDES; IT IS PROVEN OPTIMAL (AND RETURNED) ONCE
+# U <= max(C, fmin_F, fmin_B, gmin_F + gmin_B + EPSILON), C BEING THE SMALLEST PRIORITY OF BOTH SIDES
+# PROBLEM_B IS THE SAME MAZE WITH START AND GOAL SWAPPED; HEURISTIC_TABLE_B POINTS TOWARDS S
+# EPSILON IS THE CHEAPEST ACTION COST (1 ON THE MAZE GRID)
+def mm_table_search(problem_F: Problem, problem_B: Problem,
+                    heuristic_table_F: Dict[tuple, float], heuristic_table_B: Dict[tuple, float],
+                    epsilon: float = 1.0,
+                    on_step: Optional[Callable[[dict], None]] = None) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem_F.unreachable():
+        return None
+
+    # BOTH SIDES MUST SHARE ONE CELL NUMBERING TO USE CELL IDS
+    csr = False
+    if on_step is None:
+        maze_F, maze_B = csr_maze(problem_F), csr_maze(problem_B)
+        csr = maze_F is not None and maze_B is not None and (maze_B.H, maze_B.W) == (maze_F.H, maze_F.W)
+    maze, start_F, _, h_F, successors_F = state_space(problem_F, heuristic_table_F, csr)
+    _, start_B, _, h_B, successors_B = state_space(problem_B, heuristic_table_B, csr)
+    side_F = _Side(start_F, h_F, successors_F)
+    side_B = _Side(start_B, h_B, successors_B)
+
+    best = 0.0 if start_F == start_B else INF
+    meet = start_F if start_F == start_B else None
+    nodes_expanded = 0
+    seq = 0
+    forward = False
+
+    while side_F.open and side_B.open:
+        pr_F = side_F.top(side_F.by_priority)
+        pr_B = side_B.top(side_B.by_priority)
+        lower = max(
+            min(pr_F, pr_B),
+            side_F.top(side_F.by_f),
+            side_B.top(side_B.by_f),
+            side_F.top(side_F.by_g) + side_B.top(side_B.by_g) + epsilon,
+        )
+        if best <= lower:
+            break
+
+        # THE SIDE WITH THE SMALLER PRIORITY MOVES; ON A TIE THE SIDES TAKE TURNS
+        if pr_F != pr_B:
+            forward = pr_F < pr_B
+        else:
+            forward = not forward
+        side, other = (side_F, side_B) if forward else (side_B, side_F)
+        u, g = side.pop()
+
+        direction = FORWARD if side is side_F else BACKWARD
+        if on_step:
+            on_step(search_event(POP, u, nodes_expanded, direction))
+
+        for v, action, cost in side.successors(u):
+            g2 = g + cost
+            existing = side.reached.get(v)
+            if existing is None or g2 < existing:
+                side.reached[v] = g2
+                side.parent[v] = (u, action, cost)
+                # NEGATIVE COUNTER: EQUAL KEYS PREFER THE NEWEST STATE, LIKE THE A* FAST PATH
+                seq -= 1
+                side.push(v, g2, seq)
+                nodes_expanded += 1
+                if on_step:
+                    on_step(search_event(PUSH if existing is None else IMPROVE, v, nodes_expanded, direction))
+
+                # A STATE REACHED BY BOTH SIDES CLOSES A PATH: KEEP THE CHEAPEST ONE
+                g_other = other.reached.get(v)
+                if g_other is not None and g2 + g_other < best:
+                    best = g2 + g_other
+                    meet = v
+                    if on_step:
+                        on_step(search_event(MEET, v, nodes_expanded, direction))
+
+    if meet is None:
+        return None
+
+    # PATH = S .. MEET FROM THE FORWARD PARENTS, THEN MEET .. G FROM THE BACKWARD PARENTS, TURNED AROUND
+    if maze is not None:
+        forward = [s for s, _ in _chain(side_F.parent, meet)]
+        forward.reverse()
+        backward = [s for s, _ in _chain(side_B.parent, meet)]
+        return node_from_ids(maze, forward + backward[1:]), nodes_expanded
+
+    node = None
+    for s, step in reversed(list(_chain(side_F.parent, meet))):
+        if step is None:
+            node = Node(state=s, g=0.0)
+        else:
+            node = Node(state=s, parent=node, action=step[1], g=node.g + step[2])
+    for s, step in _chain(side_B.parent, meet):
+        if step is None:
+            break
+        prev, action, cost = step
+        node = Node(state=prev, parent=node, action=reverse_action(action), g=node.g + cost)
+    return node, nodes_expanded
+
+
+# PARENT ENTRIES FROM A STATE BACK TO THE ROOT OF ITS SEARCH: [(STATE, (PREV, ACTION, COST) OR NONE)]
+def _chain(parent: Dict[Any, Any], s) -> List[Tuple[Any, Any]]:
+    out = []
+    while True:
+        step = parent[s]
+        out.append((s, step))
+        if step is None:
+            return out
+        s = step[0]
+
+
+# PUBLIC WRAPPER FOR MM THAT BUILDS BOTH HEURISTIC TABLES (SAME SHAPE AS A_STAR_SEARCH)
+def mm_search(problem: Problem, h: Optional[Callable[[Any, Any], float]] = None,
+              on_step: Optional[Callable[[dict], None]] = None) -> Optional[Tuple[Node, int]]:
+    heuristic_fn = h or (lambda s, goal: problem.heuristic(s, goal))
+    cells = [(r, c) for r in range(problem.maze.H) for c in range(problem.maze.W)]
+    heuristic_table_F = {p: heuristic_fn(p, problem.goal) for p in cells}
+    heuristic_table_B = {p: heuristic_fn(p, problem.initial) for p in cells}
+    problem_B = MazeProblem(problem.maze, problem.goal, problem.initial)
+    return mm_table_search(problem, problem_B, heuristic_table_F, heuristic_table_B, on_step=on_step)
+
+
+# BENCHMARKS MM AGAINST DIJKSTRA AND A* (SAME HEURISTIC) ON SEEDED SYNTHETIC MAZES OF EVERY KIND
+# ALL MAZES OF A KIND ARE GENERATED IN MEMORY FROM SEEDS 0..NUM_SEEDS-1; COSTS ARE CROSS-CHECKED
+# TIMES ARE PLAIN WALL-CLOCK (NO TRACEMALLOC) SO LARGE MAZES STAY AFFORDABLE
+def benchmark_mm_search(size: int = 501, num_seeds: int = 3, heuristic: str = "manhattan",
+                        kinds: Tuple[str, ...] = ("perfect", "rooms", "obstacles", "open")) -> Dict[str, str]:
+    metrics = {}
+    for kind in kinds:
+        times = {'Dijkstra': [], 'A*': [], 'MM': []}
+        nodes = {'Dijkstra': [], 'A*': [], 'MM': []}
+        mismatches = 0
+        for seed in range(num_seeds):
+            maze = Maze(np.stack(list(generate_maze_rows(kind, size, size, seed=seed))))
+            problem = MazeProblem(maze)
+            if problem.unreachable():
+                continue
+            problem_B = MazeProblem(maze, maze.goal, maze.start)
+            table_F = heuristic_table_for(problem, heuristic)
+            table_B = heuristic_table_for(problem_B, heuristic)
+            maze.adjacency()
+
+            runs = {
+                'Dijkstra': lambda: dijkstra(problem, engine='heap'),
+                'A*': lambda: a_star_table_search(problem, lambda n: n.g + n.h, table_F),
+                'MM': lambda: mm_table_search(problem, problem_B, table_F, table_B),
+            }
+            costs = {}
+            for name, run in runs.items():
+                began = time.perf_counter()
+                goal_node, expanded = run()
+                times[name].append((time.perf_counter() - began) * 1000)
+                nodes[name].append(expanded)
+                costs[name] = goal_node.g
+            if costs['MM'] != costs['Dijkstra']:
+                mismatches += 1
+
+        for name in times:
+            n = max(len(times[name]), 1)
+            metrics[f'{kind} {name} avg time (ms)'] = f"{sum(times[name]) / n:.3f}"
+            metrics[f'{kind} {name} avg nodes'] = f"{sum(nodes[name]) / n:.1f}"
+        metrics[f'{kind} MM cost mismatches'] = f"{mismatches}"
+    return metrics
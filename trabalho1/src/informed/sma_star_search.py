@@ -0,0 +1,255 @@
+# EXTERNAL IMPORTS
+import heapq
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.problem import Problem
+from core.node import Node
+from core.search_events import search_event, PUSH, IMPROVE, POP
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import heuristic_table_for, state_space, node_from_ids
+
+# INFORMED SEARCH
+from informed.a_star_search import reconstruct_path
+
+# MAXIMUM NUMBER OF SEARCH NODES KEPT IN MEMORY AT ONCE
+SMA_NODE_CAP = 50_000
+
+INF = float('inf')
+
+
+# SEARCH TREE NODE OF SMA*: F IS THE BACKED-UP VALUE (MIN OVER ITS SUBTREE), FORGOTTEN MAPS THE STATES
+# OF EVICTED CHILDREN TO THEIR LAST f SO THEY CAN BE REGENERATED WITH WHAT WAS LEARNED ABOUT THEM
+# BOTH CONTAINERS STAY NONE UNTIL NEEDED: MOST NODES ARE LEAVES AND NEVER LOSE A CHILD
+class _SMANode:
+    __slots__ = ('state', 'parent', 'action', 'g', 'f', 'depth', 'children', 'forgotten',
+                 'expanded', 'alive', 'stamp')
+
+    def __init__(self, state, parent, action, g, f, depth):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.g = g
+        self.f = f
+        self.depth = depth
+        self.children: Optional[List['_SMANode']] = None
+        self.forgotten: Optional[Dict[Any, float]] = None
+        self.expanded = False
+        self.alive = True
+        self.stamp = 0
+
+
+# COMPUTES SMA* USING A SPECIFIED HEURISTIC
+def compute_sma_star_search(problem: Problem, heuristic: str, node_cap: int = SMA_NODE_CAP):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    heuristic_table_coordinate = heuristic_table_for(problem, heuristic)
+
+    # CALL SMA* AND MEASURE TIME/MEMORY
+    result, elapsed_time, memory_used, current, peak = measure_time_memory(
+        sma_star_table_search,
+        problem,
+        heuristic_table_coordinate,
+        node_cap
+    )
+
+    if result is None:
+        print(f"No path found within {node_cap} nodes")
+        return
+
+    goal_node, nodes_expanded = result
+
+    if goal_node:
+        print("Path:", reconstruct_path(goal_node))
+        print("Number of nodes expanded:", nodes_expanded)
+        print("Cost of path:", goal_node.g)
+        print(f"Time taken: {elapsed_time:.3f} milliseconds")
+        print(f"Memory used: {memory_used:.12f} B")
+        print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
+
+
+# SIMPLIFIED MEMORY-BOUNDED A* (RUSSELL): A* THAT NEVER HOLDS MORE THAN NODE_CAP NODES; WHEN FULL, THE
+# WORST LEAF (HIGHEST f, SHALLOWEST) IS DROPPED AND ITS f IS BACKED UP INTO ITS PARENT, WHICH IS QUEUED
+# AGAIN TO REGENERATE IT IF THAT SUBTREE BECOMES THE BEST ONE; OPTIMAL WHEN THE OPTIMAL PATH FITS IN THE CAP
+# A STATE ALREADY IN MEMORY WITH g <= THE NEW ONE IS NOT GENERATED TWICE
+# ON_STEP GETS THE SEARCH EVENTS; EVICTIONS ARE NOT REPORTED, SO A REPLAY SHOWS EVERY STATE EVER GENERATED
+def sma_star_table_search(problem: Problem, heuristic_table_coordinate: Dict[tuple, float],
+                          node_cap: int = SMA_NODE_CAP,
+                          on_step: Optional[Callable[[dict], None]] = None) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+    if node_cap < 2:
+        raise ValueError("SMA* needs room for at least two nodes")
+
+    maze, start, goal, h, successors = state_space(problem, heuristic_table_coordinate, csr=on_step is None)
+
+    def solution(n: _SMANode) -> Node:
+        chain = []
+        while n is not None:
+            chain.append(n)
+            n = n.parent
+        chain.reverse()
+        if maze is not None:
+            return node_from_ids(maze, [m.state for m in chain])
+        node = None
+        for m in chain:
+            node = Node(state=m.state, parent=node, action=m.action, g=m.g, h=m.f - m.g, f=m.f)
+        return node
+
+    # OPEN: MIN-HEAP OF (KEY, -DEPTH, SEQ, NODE); LEAVES: MIN-HEAP OF (-f, DEPTH, SEQ, NODE) FOR EVICTION
+    # ENTRIES ARE LAZY: ONE IS LIVE ONLY WHILE ITS SEQ MATCHES THE NODE'S STAMP
+    open_heap: list = []
+    leaf_heap: list = []
+    live = set()
+    best: Dict[Any, _SMANode] = {}
+    counter = [0]
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    # KEY OF A NODE IN OPEN: ITS f BEFORE THE FIRST EXPANSION, THEN THE BEST f AMONG ITS FORGOTTEN CHILDREN
+    def in_open(n: _SMANode) -> bool:
+        return not n.expanded or bool(n.forgotten)
+
+    def open_key(n: _SMANode) -> float:
+        return min(n.forgotten.values()) if n.expanded else n.f
+
+    # (RE)QUEUES A NODE WHOSE KEY OR LEAF STATUS CHANGED, INVALIDATING ITS OLDER ENTRIES
+    def touch(n: _SMANode):
+        counter[0] += 1
+        n.stamp = counter[0]
+        if in_open(n):
+            heappush(open_heap, (open_key(n), -n.depth, n.stamp, n))
+        if not n.children and n.parent is not None:
+            heappush(leaf_heap, (-n.f, n.depth, n.stamp, n))
+
+    # LAZY HEAPS KEEP STALE ENTRIES; REBUILD THEM FROM THE LIVE NODES SO THEY STAY PROPORTIONAL TO THE CAP
+    def compact():
+        open_heap.clear()
+        leaf_heap.clear()
+        for n in live:
+            touch(n)
+
+    # WORST LIVE LEAF OTHER THAN THE NODE BEING EXPANDED (WHOSE ENTRY IS SET ASIDE AND PUT BACK)
+    def worst_leaf(exclude: _SMANode) -> Optional[_SMANode]:
+        held = None
+        found = None
+        while leaf_heap:
+            _, _, stamp, n = leaf_heap[0]
+            if not n.alive or n.stamp != stamp or n.children:
+                heappop(leaf_heap)
+            elif n is exclude:
+                held = heappop(leaf_heap)
+            else:
+                found = n
+                break
+        if held is not None:
+            heappush(leaf_heap, held)
+        return found
+
+    # RECOMPUTES f OF N FROM ITS CHILDREN AND FORGOTTEN CHILDREN, THEN WALKS UP WHILE ANYTHING CHANGES
+    def back_up(n: Optional[_SMANode]):
+        while n is not None and n.expanded:
+            values = [c.f for c in n.children or ()]
+            values.extend((n.forgotten or {}).values())
+            new_f = max(n.f, min(values)) if values else INF
+            if new_f == n.f:
+                return
+            n.f = new_f
+            touch(n)
+            n = n.parent
+
+    # DROPS A LEAF, REMEMBERING ITS f IN THE PARENT (WHICH GOES BACK TO OPEN)
+    def evict(n: _SMANode):
+        n.alive = False
+        live.discard(n)
+        if best.get(n.state) is n:
+            del best[n.state]
+        p = n.parent
+        p.children.remove(n)
+        if p.forgotten is None:
+            p.forgotten = {}
+        p.forgotten[n.state] = min(p.forgotten.get(n.state, INF), n.f)
+        touch(p)
+
+    root = _SMANode(start, None, None, 0.0, h(start), 0)
+    live.add(root)
+    best[start] = root
+    touch(root)
+    nodes_expanded = 0
+
+    while open_heap:
+        key, _, stamp, n = heappop(open_heap)
+        if not n.alive or n.stamp != stamp:
+            continue
+        if key == INF:
+            return None
+        if n.state == goal:
+            return solution(n), nodes_expanded
+
+        if on_step:
+            on_step(search_event(POP, n.state, nodes_expanded))
+
+        # FIRST EXPANSION GENERATES EVERY SUCCESSOR; LATER ONES ONLY THE FORGOTTEN ONES
+        remembered = n.forgotten if n.expanded else None
+        n.expanded = True
+        n.forgotten = None
+        for v, action, cost in successors(n.state):
+            if remembered is not None and v not in remembered:
+                continue
+            g2 = n.g + cost
+            existing = best.get(v)
+            if existing is not None and existing.g <= g2:
+                continue
+            f2 = max(n.f, g2 + h(v))
+            if remembered is not None:
+                f2 = max(f2, remembered[v])
+            # A PATH THAT FILLS THE WHOLE MEMORY CANNOT BE EXTENDED
+            if n.depth + 2 >= node_cap and v != goal:
+                f2 = INF
+
+            # MEMORY FULL: DROP THE WORST LEAF, OR FORGET THE NEW CHILD RIGHT AWAY IF IT IS WORSE
+            if len(live) >= node_cap:
+                victim = worst_leaf(n)
+                if victim is None or (-victim.f, victim.depth) >= (-f2, n.depth + 1):
+                    if n.forgotten is None:
+                        n.forgotten = {}
+                    n.forgotten[v] = min(n.forgotten.get(v, INF), f2)
+                    continue
+                evict(victim)
+
+            child = _SMANode(v, n, action, g2, f2, n.depth + 1)
+            if n.children is None:
+                n.children = []
+            n.children.append(child)
+            live.add(child)
+            best[v] = child
+            touch(child)
+            nodes_expanded += 1
+            if on_step:
+                on_step(search_event(PUSH if existing is None else IMPROVE, v, nodes_expanded))
+
+        touch(n)
+        back_up(n)
+        if len(open_heap) + len(leaf_heap) > 4 * node_cap + 64:
+            compact()
+    return None
+
+
+# PUBLIC WRAPPER FOR SMA* THAT BUILDS HEURISTIC TABLE (SAME SHAPE AS A_STAR_SEARCH)
+def sma_star_search(problem: Problem, h: Optional[Callable[[Any, Any], float]] = None,
+                    node_cap: int = SMA_NODE_CAP,
+                    on_step: Optional[Callable[[dict], None]] = None) -> Optional[Tuple[Node, int]]:
+    heuristic_fn = h or (lambda s, goal: problem.heuristic(s, goal))
+
+    heuristic_table_coordinate = {
+        (r, c): heuristic_fn((r, c), problem.goal)
+        for r in range(problem.maze.H) for c in range(problem.maze.W)
+    }
+
+    return sma_star_table_search(problem, heuristic_table_coordinate, node_cap, on_step=on_step)
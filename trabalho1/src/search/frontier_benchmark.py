@@ -0,0 +1,86 @@
+# EXTERNAL IMPORTS
+import time
+from typing import Dict, Tuple
+import numpy as np
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.frontier import LazyHeap, IndexedHeap
+from core.maze_generator import generate_maze_rows
+from core.maze_problem import MazeProblem
+from core.maze_representation import Maze
+
+# SEARCH
+from search.integer_states import heuristic_table_for
+
+# INFORMED SEARCH
+from informed.a_star_search import a_star_table_search
+
+# UNINFORMED SEARCH
+from uninformed.dijkstra import dijkstra
+
+# COUNTING VERSION OF EACH FRONTIER (THE TIMED RUNS USE THE PLAIN NAMED ONES)
+COUNTED = {
+    'lazy': lambda key: LazyHeap(key, counting=True),
+    'indexed': IndexedHeap,
+}
+
+
+# COMPARES THE LAZY HEAPQ FRONTIER WITH THE INDEXED DECREASE-KEY HEAP ON GENERATED MAZES
+# PER ENGINE AND FRONTIER: TIME, PUSHES, POPS, PEAK FRONTIER SIZE AND DECREASE-KEYS
+# (THE INADMISSIBLE HEURISTIC IS INCONSISTENT, SO A* REOPENS CELLS AND THE TWO SCHEMES DIVERGE MOST)
+def benchmark_frontiers(size: int = 301, num_seeds: int = 3,
+                        heuristics: Tuple[str, ...] = ("manhattan", "inadmissible"),
+                        kinds: Tuple[str, ...] = ("perfect", "rooms", "obstacles", "open")) -> Dict[str, str]:
+    metrics = {}
+    for kind in kinds:
+        stats: Dict[str, Dict[str, list]] = {}
+        mismatches = 0
+        for seed in range(num_seeds):
+            maze = Maze(np.stack(list(generate_maze_rows(kind, size, size, seed=seed))))
+            problem = MazeProblem(maze)
+            if problem.unreachable():
+                continue
+            maze.adjacency()
+
+            runs = {'Dijkstra': lambda frontier: dijkstra(problem, frontier=frontier)}
+            for heuristic in heuristics:
+                table = heuristic_table_for(problem, heuristic)
+                runs[f'A*-{heuristic.capitalize()}'] = (
+                    lambda frontier, table=table: a_star_table_search(problem, lambda n: n.g + n.h, table,
+                                                                      frontier=frontier))
+
+            for name, run in runs.items():
+                costs = []
+                for frontier in ('lazy', 'indexed'):
+                    began = time.perf_counter()
+                    goal_node, _ = run(frontier)
+                    elapsed = (time.perf_counter() - began) * 1000
+                    costs.append(goal_node.g)
+
+                    # SAME RUN AGAIN WITH A COUNTING FRONTIER, KEPT HERE TO READ ITS COUNTERS
+                    made = []
+
+                    def counted(key, frontier=frontier):
+                        made.append(COUNTED[frontier](key))
+                        return made[-1]
+
+                    run(counted)
+                    heap = made[0]
+                    row = stats.setdefault(f'{name} {frontier}', {'time': [], 'pushes': [], 'pops': [],
+                                                                  'peak': [], 'decreases': []})
+                    row['time'].append(elapsed)
+                    row['pushes'].append(heap.pushes)
+                    row['pops'].append(heap.pops)
+                    row['peak'].append(heap.peak)
+                    row['decreases'].append(heap.decreases)
+                if costs[0] != costs[1]:
+                    mismatches += 1
+
+        for label, row in stats.items():
+            n = max(len(row['time']), 1)
+            metrics[f'{kind} {label} avg time (ms)'] = f"{sum(row['time']) / n:.3f}"
+            for field in ('pushes', 'pops', 'peak', 'decreases'):
+                metrics[f'{kind} {label} avg {field}'] = f"{sum(row[field]) / n:.1f}"
+        metrics[f'{kind} frontier cost mismatches'] = f"{mismatches}"
+    return metrics
@@ -0,0 +1,115 @@
+# EXTERNAL IMPORTS
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.heuristics import HeuristicGrid, manhattan_grid, h_euclidean_distance, h_inadmissible
+from core.distance_field import distance_heuristic_table
+from core.landmarks import landmark_heuristic_table
+from core.maze_problem import MazeProblem
+from core.maze_representation import Maze
+from core.node import Node
+from core.problem import Problem
+
+# ACTION LABELS INDEXED BY (DR, DC), SAME NAMES USED BY MAZE.ACTIONS
+ACTION_BY_DELTA = {(-1, 0): 'N', (1, 0): 'S', (0, -1): 'O', (0, 1): 'L'}
+
+
+# RETURNS THE MAZE WHOSE CSR ADJACENCY CAN REPLACE ACTIONS()/RESULT() FOR THIS PROBLEM
+# SUBCLASSES MAY OVERRIDE ACTIONS OR COSTS, SO ONLY THE PLAIN UNIT-COST CLASSES QUALIFY
+def csr_maze(problem) -> Optional[Maze]:
+    if type(problem) is not MazeProblem:
+        return None
+    maze = problem.maze
+    # MAPPED MAZES STAY LAZY: A FULL CSR WOULD PAGE IN THE WHOLE FILE
+    if type(maze) is not Maze or maze.lazy:
+        return None
+    return maze
+
+
+# RETURNS CSR ARRAYS AS MEMORYVIEWS (INDEXING YIELDS PLAIN PYTHON INTS)
+def csr_views(maze: Maze):
+    indptr, indices = maze.adjacency()
+    return memoryview(indptr), memoryview(indices)
+
+
+# CONVERTS A HEURISTIC TABLE KEYED BY (R, C) INTO A FLAT LIST INDEXED BY CELL ID
+def table_by_id(maze: Maze, table: Dict[tuple, float], default: float = 0.0) -> List[float]:
+    H, W = maze.H, maze.W
+    # ARRAY-BACKED TABLES ARE ALREADY LAID OUT BY CELL ID
+    if isinstance(table, HeuristicGrid) and (table.H, table.W) == (H, W):
+        return table.flat_list()
+    flat = [default] * (H * W)
+    for (r, c), value in table.items():
+        if 0 <= r < H and 0 <= c < W:
+            flat[r * W + c] = value
+    return flat
+
+
+# HEURISTIC TABLE TOWARDS THE PROBLEM'S GOAL, BY NAME (SAME CHOICES AS THE A* MENU)
+# ALT LANDMARKS ARE CACHED ON DISK, EXACT FIELDS IN AN LRU; MANHATTAN IS AN ARRAY-BACKED GRID, SO NO
+# PYTHON ENTRY IS BUILT PER CELL (WHAT THE MEMORY-BOUNDED ENGINES RELY ON)
+def heuristic_table_for(problem: Problem, heuristic: str) -> Dict[tuple, float]:
+    if heuristic == "landmarks":
+        return landmark_heuristic_table(problem)
+    if heuristic == "exact":
+        return distance_heuristic_table(problem)
+    if heuristic == "manhattan":
+        return manhattan_grid(problem.maze.H, problem.maze.W, problem.goal)
+    function_h = h_euclidean_distance if heuristic == "euclidean" else h_inadmissible
+    return {
+        (r, c): problem.heuristic((r, c), problem.goal, function_h=function_h)
+        for r in range(problem.maze.H) for c in range(problem.maze.W)
+    }
+
+
+# STATE SPACE OF A SEARCH: CELL IDS OVER THE CSR ADJACENCY WHEN POSSIBLE (AND CSR IS TRUE), OTHERWISE THE
+# PROBLEM'S OWN STATES; RETURNS (MAZE OR NONE, START, GOAL, H, SUCCESSORS)
+# SUCCESSORS(S) RETURNS A LIST OF (STATE, ACTION, COST); THE ACTION IS NONE OVER CELL IDS
+def state_space(problem: Problem, heuristic_table: Dict[tuple, float], csr: bool = True
+                ) -> Tuple[Optional[Maze], Any, Any, Callable[[Any], float], Callable[[Any], list]]:
+    maze = csr_maze(problem) if csr else None
+    if maze is not None:
+        indptr, indices = csr_views(maze)
+
+        def successors(u):
+            return [(indices[k], None, 1.0) for k in range(indptr[u], indptr[u + 1])]
+
+        h = table_by_id(maze, heuristic_table).__getitem__
+        return maze, maze.cell_id(problem.initial), maze.cell_id(problem.goal), h, successors
+
+    def h(s):
+        return heuristic_table.get(s, 0.0)
+
+    def successors(s):
+        out = []
+        for action in problem.actions(s):
+            s2 = problem.result(s, action)
+            out.append((s2, action, problem.action_cost(s, action, s2)))
+        return out
+
+    return None, problem.initial, problem.goal, h, successors
+
+
+# WALKS A PARENT MAP BACK FROM A CELL ID AND RETURNS THE IDS FROM ROOT TO THAT CELL
+def ids_from_parents(parent: Dict[int, int], last: int) -> List[int]:
+    ids = []
+    i = last
+    while i != -1:
+        ids.append(i)
+        i = parent[i]
+    ids.reverse()
+    return ids
+
+
+# BUILDS THE NODE CHAIN OF A PATH GIVEN AS CELL IDS (UNIT STEPS, SO g = INDEX)
+def node_from_ids(maze: Maze, ids: List[int]) -> Node:
+    W = maze.W
+    node = None
+    prev = None
+    for k, i in enumerate(ids):
+        state = divmod(i, W)
+        action = None if prev is None else ACTION_BY_DELTA[(state[0] - prev[0], state[1] - prev[1])]
+        node = Node(state=state, parent=node, action=action, g=float(k))
+        prev = state
+    return node
@@ -0,0 +1,101 @@
+# EXTERNAL IMPORTS
+import random
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.maze_problem import MazeProblem
+from core.maze_representation import Maze
+from core.node import Node
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import node_from_ids
+
+# UNINFORMED SEARCH
+from uninformed.dijkstra import dijkstra
+
+Pos = Tuple[int, int]
+
+
+# ANSWERS MANY (START, GOAL) QUERIES ON ONE MAZE: THE CONTRACTION HIERARCHY IS BUILT ONCE (AND CACHED
+# ON THE MAZE), THEN EVERY QUERY IS A SHORT BIDIRECTIONAL UPWARD SEARCH; S AND G IN THE GRID ARE IGNORED
+class PathService:
+    def __init__(self, maze: Maze):
+        self.maze = maze
+        self.hierarchy = maze.contraction_hierarchy()
+
+    # SAME CONTRACT AS THE ENGINES: (GOAL NODE, NODES SETTLED) OR NONE WHEN THERE IS NO PATH
+    def query(self, start: Pos, goal: Pos) -> Optional[Tuple[Node, int]]:
+        if not self.maze.connected(start, goal):
+            return None
+        result = self.hierarchy.shortest_path(start, goal)
+        if result is None:
+            return None
+        _, cells, settled = result
+        return node_from_ids(self.maze, [self.maze.cell_id(p) for p in cells]), settled
+
+    # SHORTEST PATH COST ONLY (NO PATH UNPACKING), INF WHEN THERE IS NO PATH
+    def distance(self, start: Pos, goal: Pos) -> float:
+        if not self.maze.connected(start, goal):
+            return float('inf')
+        return self.hierarchy.distance(start, goal)
+
+    # ANSWERS A BATCH OF QUERIES LAZILY, IN ORDER
+    def query_many(self, pairs: Iterable[Tuple[Pos, Pos]]) -> Iterator[Optional[Tuple[Node, int]]]:
+        for start, goal in pairs:
+            yield self.query(start, goal)
+
+    # PROBLEM FOR THE SAME QUERY, TO RUN ANY OTHER ENGINE ON IT
+    def problem(self, start: Pos, goal: Pos) -> MazeProblem:
+        return MazeProblem(self.maze, start, goal)
+
+
+# RANDOM (START, GOAL) PAIRS OF OPEN CELLS IN THE SAME CONNECTED COMPONENT
+def random_queries(maze: Maze, num_queries: int, seed: Optional[int] = None) -> List[Tuple[Pos, Pos]]:
+    rng = random.Random(seed)
+    cells = list(maze.to_graph())
+    pairs = []
+    while cells and len(pairs) < num_queries:
+        start, goal = rng.choice(cells), rng.choice(cells)
+        if maze.connected(start, goal):
+            pairs.append((start, goal))
+    return pairs
+
+
+# BENCHMARKS THE PATH SERVICE AGAINST ONE DIJKSTRA PER QUERY ON THE SAME RANDOM PAIRS
+# EACH BATCH IS MEASURED AS A WHOLE; COSTS ARE CROSS-CHECKED QUERY BY QUERY
+# DIJKSTRA RUNS ON THE HEAP ENGINE, SO 'Dijkstra avg nodes' COUNTS QUEUE EXPANSIONS LIKE THE OTHER REPORTS
+def benchmark_path_service(maze: Maze, num_queries: int = 1000, seed: Optional[int] = None) -> Dict[str, str]:
+    pairs = random_queries(maze, num_queries, seed)
+
+    service, build_time, _, _, build_peak = measure_time_memory(PathService, maze)
+
+    def run_service():
+        return [service.query(s, g) for s, g in pairs]
+
+    def run_dijkstra():
+        return [dijkstra(MazeProblem(maze, s, g), engine='heap') for s, g in pairs]
+
+    ch_results, ch_time, _, _, ch_peak = measure_time_memory(run_service)
+    dij_results, dij_time, _, _, dij_peak = measure_time_memory(run_dijkstra)
+
+    mismatches = sum(
+        1 for a, b in zip(ch_results, dij_results)
+        if (a is None) != (b is None) or (a is not None and a[0].g != b[0].g)
+    )
+    n = max(len(pairs), 1)
+    return {
+        'queries': f"{len(pairs)}",
+        'CH build time (ms)': f"{build_time:.3f}",
+        'CH build peak (KB)': f"{build_peak / 1024:.3f}",
+        'CH shortcuts': f"{service.hierarchy.shortcuts}",
+        'CH avg query time (ms)': f"{ch_time / n:.3f}",
+        'CH avg nodes': f"{sum(r[1] for r in ch_results if r) / n:.1f}",
+        'CH peak (KB)': f"{ch_peak / 1024:.3f}",
+        'Dijkstra avg query time (ms)': f"{dij_time / n:.3f}",
+        'Dijkstra avg nodes': f"{sum(r[1] for r in dij_results if r) / n:.1f}",
+        'Dijkstra peak (KB)': f"{dij_peak / 1024:.3f}",
+        'cost mismatches': f"{mismatches}",
+        'break-even queries': f"{build_time / max(dij_time / n - ch_time / n, 1e-9):.0f}",
+    }
@@ -0,0 +1,80 @@
+# EXTERNAL IMPORTS
+import time
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.maze_generator import generate_maze_rows
+from core.maze_problem import MazeProblem
+from core.maze_representation import Maze
+from core.tie_breaking import TIE_BREAKS
+
+# SEARCH
+from search.integer_states import heuristic_table_for
+
+# INFORMED SEARCH
+from informed.a_star_search import a_star_table_search
+from informed.greedy_best_first_search import greedy_best_first_search
+from informed.jump_point_search import jump_point_table_search
+
+# UNINFORMED SEARCH
+from uninformed.best_first_search import best_first_search
+from uninformed.bidirectional_best_first_search import bidirectional_best_first_search
+
+
+# NODES EXPANDED AND TIME OF EACH BEST-FIRST ENGINE UNDER EVERY TIE-BREAKING POLICY, ON OPEN FIELDS
+# (WHERE MANY CELLS SHARE THE SAME f) AND ON MAZE-LIKE INPUTS; ALSO COUNTS RUNS WHOSE COST DIFFERS
+# FROM THE FIFO ONE (GREEDY MAY, IT IS NOT OPTIMAL; SO MAY BIDIRECTIONAL, WHICH STOPS AT ITS FIRST MEETING)
+# TIE_BREAK_SEED SEEDS THE 'random' POLICY, SO ITS ROWS ARE REPRODUCIBLE (NONE = A NEW ORDER EVERY CALL)
+def benchmark_tie_breaking(size: int = 201, num_seeds: int = 3, heuristic: str = "manhattan",
+                           kinds: Tuple[str, ...] = ("open", "obstacles", "rooms", "perfect"),
+                           tie_break_seed: Optional[int] = 0) -> Dict[str, str]:
+    metrics = {}
+    for kind in kinds:
+        nodes: Dict[str, list] = {}
+        times: Dict[str, list] = {}
+        cost_changes: Dict[str, int] = {}
+        for seed in range(num_seeds):
+            maze = Maze(np.stack(list(generate_maze_rows(kind, size, size, seed=seed))))
+            problem = MazeProblem(maze)
+            problem_B = MazeProblem(maze, maze.goal, maze.start)
+            if problem.unreachable():
+                continue
+            table = heuristic_table_for(problem, heuristic)
+            maze.adjacency()
+
+            runs = {
+                'Dijkstra': lambda tie_break: best_first_search(problem, lambda n: n.g, tie_break=tie_break,
+                                                                tie_break_seed=tie_break_seed),
+                'A*': lambda tie_break: a_star_table_search(problem, lambda n: n.g + n.h, table,
+                                                            tie_break=tie_break, tie_break_seed=tie_break_seed),
+                'Greedy': lambda tie_break: greedy_best_first_search(problem, lambda n: n.h, table,
+                                                                     tie_break=tie_break,
+                                                                     tie_break_seed=tie_break_seed),
+                'JPS': lambda tie_break: jump_point_table_search(problem, lambda n: n.g + n.h, table,
+                                                                 tie_break=tie_break, tie_break_seed=tie_break_seed),
+                'Bidirectional': lambda tie_break: bidirectional_best_first_search(
+                    problem, lambda n: n.g, problem_B, lambda n: n.g,
+                    tie_break=tie_break, tie_break_seed=tie_break_seed),
+            }
+            for name, run in runs.items():
+                costs = {}
+                for policy in TIE_BREAKS:
+                    began = time.perf_counter()
+                    goal_node, expanded = run(policy)
+                    elapsed = (time.perf_counter() - began) * 1000
+                    label = f'{name} {policy}'
+                    nodes.setdefault(label, []).append(expanded)
+                    times.setdefault(label, []).append(elapsed)
+                    costs[policy] = goal_node.g
+                cost_changes[name] = cost_changes.get(name, 0) + sum(
+                    cost != costs['fifo'] for cost in costs.values())
+
+        for label in nodes:
+            n = max(len(nodes[label]), 1)
+            metrics[f'{kind} {label} avg nodes'] = f"{sum(nodes[label]) / n:.1f}"
+            metrics[f'{kind} {label} avg time (ms)'] = f"{sum(times[label]) / n:.3f}"
+        for name, changes in cost_changes.items():
+            metrics[f'{kind} {name} cost changes vs fifo'] = f"{changes}"
+    return metrics
@@ -15,6 +15,7 @@ from core.maze_representation import Maze
 from core.maze_generator import read_matrix_from_file
 from core.maze_problem import MazeProblem
 from core.node import Node
+from core.search_events import SearchReplay, SearchTrace, search_event, PUSH, IMPROVE, POP
 
 # GLOBAL VARIABLES
 # FIXED PALETTE INDICES USED BY SNAPSHOT TO ARRAY AND GIF SAVER
@@ -32,34 +33,26 @@ PALETTE = [
     '#8c564b',  # SEARCH TREE
 ]
 
+# PALETTE INDEX OF EACH SEARCH LAYER (SEE SEARCHREPLAY.LAYER)
+LAYER_COLORS = {'reached_F': 4, 'reached_B': 5, 'frontier_F': 6, 'frontier_B': 7, 'current': 8}
+
 _LAST_ANIMATION: animation.FuncAnimation | None = None
 
-# FUNCTION TO YIELD SNAPSHOTS DURING BEST-FIRST SEARCH
+# FUNCTION TO YIELD THE SEARCH EVENTS (PUSH, IMPROVE, POP) OF A BEST-FIRST SEARCH, ONE CHANGED CELL EACH
 def best_first_search_steps(problem: MazeProblem, f: Callable[[Node], float]) -> Iterable[Dict[str, Any]]:
     # INITIALIZE START NODE AND FRONTIER
     start = Node(state=problem.initial, g=0.0, h=problem.heuristic(problem.initial))
-    frontier: List[Tuple[float, Node]] = []
-    heapq.heappush(frontier, (f(start), start))
+    frontier: List[Tuple[float, int, Node]] = []
+    seq = 0
+    heapq.heappush(frontier, (f(start), seq, start))
     reached: Dict[Any, Node] = {start.state: start}
     nodes_expanded = 0
 
-    # FUNCTION TO CREATE SNAPSHOT DICTIONARY
-    def make_snapshot(current: Node | None, event: str) -> Dict[str, Any]:
-        return {
-            'current': current.state if current else None,
-            'frontier': [(n.state, float(priority)) for priority, n in frontier],
-            'reached': {s: node.g for s, node in reached.items()},
-            'parents': {s: node.parent.state if node.parent else None for s, node in reached.items()},
-            'nodes_expanded': nodes_expanded,
-            'event': event,
-        }
-
     # MAIN LOOP OF BEST-FIRST SEARCH
     while frontier:
-        _, node = heapq.heappop(frontier)
-        yield make_snapshot(node, 'pop')
+        _, _, node = heapq.heappop(frontier)
+        yield search_event(POP, node.state, nodes_expanded)
         if problem.is_goal(node.state):
-            yield make_snapshot(node, 'goal')
             return
 
         nodes_expanded += 1
@@ -70,10 +63,9 @@ def best_first_search_steps(problem: MazeProblem, f: Callable[[Node], float]) ->
             existing = reached.get(child.state)
             if existing is None or child.g < existing.g:
                 reached[child.state] = child
-                heapq.heappush(frontier, (f(child), child))
-                yield make_snapshot(child, 'push')
-
-    yield make_snapshot(None, 'finished')
+                seq += 1
+                heapq.heappush(frontier, (f(child), seq, child))
+                yield search_event(PUSH if existing is None else IMPROVE, child.state, nodes_expanded)
 
 # FUNCTION TO CONVERT SNAPSHOT TO NUMPY ARRAY FOR VISUALIZATION
 def snapshot_to_array(snapshot: Dict[str, Any], base_grid: List[List[str]], allow_override_start_goal: bool = False) -> np.ndarray:
@@ -168,6 +160,32 @@ def snapshot_to_array(snapshot: Dict[str, Any], base_grid: List[List[str]], allo
 
     return arr
 
+# FUNCTION TO CONVERT A SEARCH EVENT STREAM TO FRAME ARRAYS: ONE RUNNING ARRAY IS REPAINTED ONLY AT THE
+# CELLS EACH EVENT TOUCHES AND COPIED EVERY `EVERY` EVENTS (PLUS THE LAST ONE); RETURNS THE FRAMES, THE
+# EVENT SHOWN BY EACH FRAME (FOR THE LABELS) AND EVERY CELL THE SEARCH REACHED
+def events_to_arrays(events: List[Dict[str, Any]], base_grid: List[List[str]], every: int = 1,
+                     allow_override_start_goal: bool = False) -> Tuple[list[np.ndarray], list[dict], set]:
+    if every < 1:
+        raise ValueError(f"every must be at least 1, got {every}")
+    base = snapshot_to_array({}, base_grid, allow_override_start_goal)
+    arr = base.copy()
+    height, width = arr.shape
+    replay = SearchReplay()
+    arrays: list[np.ndarray] = []
+    labels: list[dict] = []
+    last = len(events) - 1
+    for idx, event in enumerate(events):
+        for r, c in replay.apply(event):
+            if not (0 <= r < height and 0 <= c < width):
+                continue
+            if not allow_override_start_goal and base_grid[r][c] in ('S', 'G'):
+                continue
+            arr[r, c] = LAYER_COLORS.get(replay.layer((r, c)), base[r, c])
+        if (idx + 1) % every == 0 or idx == last:
+            arrays.append(arr.copy())
+            labels.append(event)
+    return arrays, labels, replay.reached_states()
+
 # FUNCTION TO APPLY FINAL OVERLAYS (FINAL PATH AND TREE)
 def _apply_final_overlays(arr: np.ndarray, base_grid: List[List[str]], tree_nodes: Iterable[Tuple[int, int]], final_path: Iterable[Tuple[int, int]] | None) -> np.ndarray:
     result = arr.copy()
@@ -315,6 +333,8 @@ def visualize(
     max_steps: int | None = None,
     precompute: bool = False,
     precomputed_snapshots: list[dict] | None = None,
+    precomputed_trace: SearchTrace | None = None,
+    frame_every: int = 1,
     final_path: Iterable[tuple[int, int]] | None = None,
     tree_nodes: Iterable[tuple[int, int]] | None = None,
     final_hold_ms: int = 5000,
@@ -345,22 +365,25 @@ def visualize(
         ])
     ]
 
-    should_precompute = precompute or (out_file is not None) or (precomputed_snapshots is not None)
+    should_precompute = (precompute or (out_file is not None) or (precomputed_snapshots is not None)
+                         or (precomputed_trace is not None))
     snapshots: list[dict] = precomputed_snapshots[:] if precomputed_snapshots else []
+    # SEARCH EVENTS (DELTAS) ARE PREFERRED OVER FULL SNAPSHOTS: FRAMES ARE REBUILT FROM THEM INCREMENTALLY
+    events: list[dict] = list(precomputed_trace.events) if precomputed_trace is not None else []
 
-    # PRECOMPUTE FRAMES IF NECESSARY
-    if should_precompute and not snapshots:
+    # RUN THE SEARCH WHEN NOTHING WAS GIVEN (ITS EVENTS ARE CHEAP, SO THEY ARE ALWAYS COLLECTED UP FRONT)
+    if not snapshots and not events:
         gen = best_first_search_steps(problem, f)
         steps = 0
         try:
             while True:
                 if max_steps is not None and steps >= max_steps:
                     break
-                snapshots.append(next(gen))
+                events.append(next(gen))
                 steps += 1
         except StopIteration:
             pass
-        if not snapshots:
+        if not events:
             print('No frames produced by the search.')
             return
 
@@ -400,8 +423,13 @@ def visualize(
     final_path_coords: list[tuple[int, int]] | None = [tuple(coord) for coord in final_path] if final_path else None
     tree_nodes_set: set[tuple[int, int]] | None = set(tuple(coord) for coord in tree_nodes) if tree_nodes else None
 
+    # CONVERT EVENTS TO ARRAYS; THE EVENT OF EACH FRAME DOUBLES AS ITS SNAPSHOT FOR THE LABELS
+    frame_arrays: list[np.ndarray] | None = None
+    computed_tree: set[tuple[int, int]] = set()
+    if events:
+        frame_arrays, snapshots, computed_tree = events_to_arrays(events, matrix, every=frame_every)
+
     if should_precompute:
-        computed_tree: set[tuple[int, int]] = set()
         for snap in snapshots:
             if snap.get('reached'):
                 computed_tree.update(snap['reached'])
@@ -415,9 +443,9 @@ def visualize(
     tree_nodes_set = tree_nodes_set or set()
 
     # CONVERT SNAPSHOTS TO ARRAYS
-    frame_arrays: list[np.ndarray] | None = None
     if should_precompute:
-        frame_arrays = [snapshot_to_array(s, matrix) for s in snapshots]
+        if frame_arrays is None:
+            frame_arrays = [snapshot_to_array(s, matrix) for s in snapshots]
         if frame_arrays:
             frame_arrays.append(_apply_final_overlays(frame_arrays[-1], matrix, tree_nodes_set, final_path_coords))
 
@@ -14,14 +14,20 @@ from core.maze_generator import read_matrix_from_file
 from core.maze_representation import Maze
 
 # UNINFORMED SEARCH
-from uninformed.dijkstra import compute_dijkstra
+from uninformed.dijkstra import compute_dijkstra, compute_corridor_dijkstra
 from uninformed.bidirectional_best_first_search import compute_bidirectional_best_first_search
+from uninformed.parallel_bidirectional_search import compute_parallel_bidirectional_search
 from uninformed.generate_gifs_uninformed import generate_gifs_uninformed
 import uninformed.uninformed_comparison as uc
 
 # INFORMED SEARCH 
 from informed.greedy_best_first_search import compute_greedy_best_first_search
 from informed.a_star_search import compute_a_star_search
+from informed.jump_point_search import compute_jump_point_search
+from informed.ara_star_search import compute_ara_star_search
+from informed.ida_star_search import compute_ida_star_search
+from informed.sma_star_search import SMA_NODE_CAP, compute_sma_star_search
+from informed.mm_search import compute_mm_search
 from informed.generate_gifs_informed import generate_gifs_informed  
 import informed.informed_comparison as ic
 
@@ -38,18 +44,25 @@ def show_uninformed_menu():
     print("Uninformed Search Options:")
     print("1. Dijkstra")
     print("2. Bidirectional Best-First Search")
-    print("3. Comparison of Both")
-    print("4. Visualize Uninformed Searches")
-    print("5. Back to Main Menu")
+    print("3. Parallel Bidirectional Search (one process per direction)")
+    print("4. Comparison of Dijkstra and Bidirectional Best-First Search")
+    print("5. Visualize Uninformed Searches")
+    print("6. Dijkstra on the Corridor Graph (degree-2 chains contracted)")
+    print("7. Back to Main Menu")
 
 # INFORMED SEARCH MENU FUNCTION
 def show_informed_menu():
     print("Informed Search Options:")
     print("1. A* Search")
     print("2. Greedy Best-First Search")
-    print("3. Comparison of A* and Greedy Best-First Search")
-    print("4. Visualize Informed Searches")
-    print("5. Back to Main Menu")
+    print("3. Jump Point Search (JPS)")
+    print("4. Anytime Repairing A* (ARA*) with a Time Budget")
+    print("5. Iterative-Deepening A* (IDA*, memory-bounded)")
+    print("6. Simplified Memory-Bounded A* (SMA*) with a Node Cap")
+    print("7. Bidirectional Heuristic Search (MM)")
+    print("8. Comparison of A*, Greedy Best-First Search, JPS and ARA*")
+    print("9. Visualize Informed Searches")
+    print("10. Back to Main Menu")
 
 # HEURISTIC MENU FUNCTION
 def show_heuristic_menu(algorithm: str):
@@ -57,7 +70,9 @@ def show_heuristic_menu(algorithm: str):
     print("1. Manhattan Distance")
     print("2. Euclidean Distance")
     print("3. Inadmissible Heuristic")
-    print("4. Back to Previous Menu")
+    print("4. ALT Landmarks (precomputed distance tables)")
+    print("5. Exact Distance Field (perfect heuristic)")
+    print("6. Back to Previous Menu")
 
 # GET OPTION FUNCTION
 def get_option(max_option: int = 5) -> int:
@@ -71,6 +86,34 @@ def get_option(max_option: int = 5) -> int:
         except ValueError:
             print("Invalid input. Please enter a number.")
 
+# GET TIME BUDGET FUNCTION (EMPTY INPUT = NO BUDGET)
+def get_time_budget() -> float | None:
+    while True:
+        text = input("Time budget in milliseconds (empty for none): ").strip()
+        if not text:
+            return None
+        try:
+            budget = float(text)
+            if budget > 0:
+                return budget
+            print("Invalid budget. Please enter a positive number.")
+        except ValueError:
+            print("Invalid input. Please enter a number.")
+
+# GET NODE CAP FUNCTION (EMPTY INPUT = DEFAULT CAP)
+def get_node_cap() -> int:
+    while True:
+        text = input(f"Maximum nodes in memory (empty for {SMA_NODE_CAP}): ").strip()
+        if not text:
+            return SMA_NODE_CAP
+        try:
+            cap = int(text)
+            if cap >= 2:
+                return cap
+            print("Invalid cap. Please enter a number of at least 2.")
+        except ValueError:
+            print("Invalid input. Please enter a number.")
+
 # DISPLAY COMPARISON TABLE FOR UNINFORMED SEARCH ALGORITHMS
 def show_comparison_uninformed(metrics):
     print("\n--- Comparação: Dijkstra vs Bidirectional ---")
@@ -137,48 +180,58 @@ def show_visualize_uninformed(problem, matrix):
 
 # DISPLAY COMPARISON TABLE FOR INFORMED SEARCH ALGORITHMS
 def show_comparison_informed(metrics):
-    print("\n--- Comparação: Algoritmos Informados (A* vs Greedy) ---")                    
+    print("\n--- Comparação: Algoritmos Informados (A* vs Greedy vs JPS vs ARA*) ---")                    
     col_metrica_width = 20 
     col_data_width = 12 
     headers = (
         "Métrica",
         "A*-Manhattan", "A*-Euclidean", "A*-Inadmissible",
-        "G-Manhattan", "G-Euclidean", "G-Inadmissible"
+        "G-Manhattan", "G-Euclidean", "G-Inadmissible",
+        "JPS-Manhattan", "JPS-Euclidean", "ARA*-Manhattan"
     )
     header_line = (
         f"{headers[0]:<{col_metrica_width}} | "
         f"{headers[1]:>{col_data_width}} | {headers[2]:>{col_data_width}} | {headers[3]:>{col_data_width}} | "
         f"{headers[4]:>{col_data_width}} | "
-        f"{headers[5]:>{col_data_width}} | {headers[6]:>{col_data_width}} | {headers[7]:>{col_data_width}} | {headers[8]:>{col_data_width}}"
+        f"{headers[5]:>{col_data_width}} | {headers[6]:>{col_data_width}} | {headers[7]:>{col_data_width}} | {headers[8]:>{col_data_width}} | "
+        f"{headers[9]:>{col_data_width}}"
     )
     print(header_line)
     separator = (
         f"{'-' * col_metrica_width} | "
         f"{'-' * col_data_width} | {'-' * col_data_width} | {'-' * col_data_width} | {'-' * col_data_width} | "
-        f"{'-' * col_data_width} | {'-' * col_data_width} | {'-' * col_data_width} | {'-' * col_data_width}"
+        f"{'-' * col_data_width} | {'-' * col_data_width} | {'-' * col_data_width} | {'-' * col_data_width} | "
+        f"{'-' * col_data_width}"
     )
     print(separator)
     print(f"{'Tempo médio (ms)':<{col_metrica_width}} | "
             f"{metrics['A*-Manhattan avg time (ms)']:>{col_data_width}} | {metrics['A*-Euclidean avg time (ms)']:>{col_data_width}} | {metrics['A*-Inadmissible avg time (ms)']:>{col_data_width}} | "
-            f"{metrics['Greedy-Manhattan avg time (ms)']:>{col_data_width}} | {metrics['Greedy-Euclidean avg time (ms)']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg time (ms)']:>{col_data_width}}")
+            f"{metrics['Greedy-Manhattan avg time (ms)']:>{col_data_width}} | {metrics['Greedy-Euclidean avg time (ms)']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg time (ms)']:>{col_data_width}} | "
+            f"{metrics['JPS-Manhattan avg time (ms)']:>{col_data_width}} | {metrics['JPS-Euclidean avg time (ms)']:>{col_data_width}} | {metrics['ARA*-Manhattan avg time (ms)']:>{col_data_width}}")
     print(f"{'Nós médios':<{col_metrica_width}} | "
             f"{metrics['A*-Manhattan avg nodes']:>{col_data_width}} | {metrics['A*-Euclidean avg nodes']:>{col_data_width}} | {metrics['A*-Inadmissible avg nodes']:>{col_data_width}} | "
-            f"{metrics['Greedy-Manhattan avg nodes']:>{col_data_width}} | {metrics['Greedy-Euclidean avg nodes']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg nodes']:>{col_data_width}}")
+            f"{metrics['Greedy-Manhattan avg nodes']:>{col_data_width}} | {metrics['Greedy-Euclidean avg nodes']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg nodes']:>{col_data_width}} | "
+            f"{metrics['JPS-Manhattan avg nodes']:>{col_data_width}} | {metrics['JPS-Euclidean avg nodes']:>{col_data_width}} | {metrics['ARA*-Manhattan avg nodes']:>{col_data_width}}")
     print(f"{'Custo médio':<{col_metrica_width}} | "
             f"{metrics['A*-Manhattan avg cost']:>{col_data_width}} | {metrics['A*-Euclidean avg cost']:>{col_data_width}} | {metrics['A*-Inadmissible avg cost']:>{col_data_width}} | "
-            f"{metrics['Greedy-Manhattan avg cost']:>{col_data_width}} | {metrics['Greedy-Euclidean avg cost']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg cost']:>{col_data_width}}")
+            f"{metrics['Greedy-Manhattan avg cost']:>{col_data_width}} | {metrics['Greedy-Euclidean avg cost']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg cost']:>{col_data_width}} | "
+            f"{metrics['JPS-Manhattan avg cost']:>{col_data_width}} | {metrics['JPS-Euclidean avg cost']:>{col_data_width}} | {metrics['ARA*-Manhattan avg cost']:>{col_data_width}}")
     print(f"{'Memória Peak (KB)':<{col_metrica_width}} | "
             f"{metrics['A*-Manhattan avg peak (KB)']:>{col_data_width}} | {metrics['A*-Euclidean avg peak (KB)']:>{col_data_width}} | {metrics['A*-Inadmissible avg peak (KB)']:>{col_data_width}} | "
-            f"{metrics['Greedy-Manhattan avg peak (KB)']:>{col_data_width}} | {metrics['Greedy-Euclidean avg peak (KB)']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg peak (KB)']:>{col_data_width}}")
+            f"{metrics['Greedy-Manhattan avg peak (KB)']:>{col_data_width}} | {metrics['Greedy-Euclidean avg peak (KB)']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg peak (KB)']:>{col_data_width}} | "
+            f"{metrics['JPS-Manhattan avg peak (KB)']:>{col_data_width}} | {metrics['JPS-Euclidean avg peak (KB)']:>{col_data_width}} | {metrics['ARA*-Manhattan avg peak (KB)']:>{col_data_width}}")
     print(f"{'Memória Current (KB)':<{col_metrica_width}} | "
             f"{metrics['A*-Manhattan avg current (KB)']:>{col_data_width}} | {metrics['A*-Euclidean avg current (KB)']:>{col_data_width}} | {metrics['A*-Inadmissible avg current (KB)']:>{col_data_width}} | "
-            f"{metrics['Greedy-Manhattan avg current (KB)']:>{col_data_width}} | {metrics['Greedy-Euclidean avg current (KB)']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg current (KB)']:>{col_data_width}}")
+            f"{metrics['Greedy-Manhattan avg current (KB)']:>{col_data_width}} | {metrics['Greedy-Euclidean avg current (KB)']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg current (KB)']:>{col_data_width}} | "
+            f"{metrics['JPS-Manhattan avg current (KB)']:>{col_data_width}} | {metrics['JPS-Euclidean avg current (KB)']:>{col_data_width}} | {metrics['ARA*-Manhattan avg current (KB)']:>{col_data_width}}")
     print(f"{'Memória RSS (B)':<{col_metrica_width}} | "
             f"{metrics['A*-Manhattan avg memory (B)']:>{col_data_width}} | {metrics['A*-Euclidean avg memory (B)']:>{col_data_width}} | {metrics['A*-Inadmissible avg memory (B)']:>{col_data_width}} | "
-            f"{metrics['Greedy-Manhattan avg memory (B)']:>{col_data_width}} | {metrics['Greedy-Euclidean avg memory (B)']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg memory (B)']:>{col_data_width}}")
+            f"{metrics['Greedy-Manhattan avg memory (B)']:>{col_data_width}} | {metrics['Greedy-Euclidean avg memory (B)']:>{col_data_width}} | {metrics['Greedy-Inadmissible avg memory (B)']:>{col_data_width}} | "
+            f"{metrics['JPS-Manhattan avg memory (B)']:>{col_data_width}} | {metrics['JPS-Euclidean avg memory (B)']:>{col_data_width}} | {metrics['ARA*-Manhattan avg memory (B)']:>{col_data_width}}")
     print(f"{'Encontrado':<{col_metrica_width}} | "
             f"{metrics['A*-Manhattan found count']:>{col_data_width}} | {metrics['A*-Euclidean found count']:>{col_data_width}} | {metrics['A*-Inadmissible found count']:>{col_data_width}} | "
-            f"{metrics['Greedy-Manhattan found count']:>{col_data_width}} | {metrics['Greedy-Euclidean found count']:>{col_data_width}} | {metrics['Greedy-Inadmissible found count']:>{col_data_width}}")
+            f"{metrics['Greedy-Manhattan found count']:>{col_data_width}} | {metrics['Greedy-Euclidean found count']:>{col_data_width}} | {metrics['Greedy-Inadmissible found count']:>{col_data_width}} | "
+            f"{metrics['JPS-Manhattan found count']:>{col_data_width}} | {metrics['JPS-Euclidean found count']:>{col_data_width}} | {metrics['ARA*-Manhattan found count']:>{col_data_width}}")
     print(separator)
     print()
 
@@ -251,7 +304,7 @@ def main():
         if option == 1:
             while True:
                 show_uninformed_menu()
-                sub_option = get_option(5)
+                sub_option = get_option(7)
                 if sub_option == 1:
                     print("Dijkstra selected.")
                     compute_dijkstra(problem)
@@ -261,25 +314,33 @@ def main():
                     compute_bidirectional_best_first_search(problem, matrix)
 
                 elif sub_option == 3:
+                    print("Parallel Bidirectional Search selected.")
+                    compute_parallel_bidirectional_search(problem)
+
+                elif sub_option == 4:
                     print("Comparison of Dijkstra and Bidirectional Best-First Search selected.")
                     metrics = uc.compare_uninformed_search_algorithms(matrix)
                     show_comparison_uninformed(metrics)
                     
-                elif sub_option == 4:
+                elif sub_option == 5:
                     print("Visualizing Uninformed Searches (Dijkstra and Bidirectional)...")
                     show_visualize_uninformed(problem, matrix)
 
-                elif sub_option == 5:
+                elif sub_option == 6:
+                    print("Dijkstra on the Corridor Graph selected.")
+                    compute_corridor_dijkstra(problem)
+
+                elif sub_option == 7:
                     break
             
         elif option == 2:
             while True:
                 show_informed_menu()
-                sub_option = get_option(5)
+                sub_option = get_option(10)
                 if sub_option == 1:
                     while True:
                         show_heuristic_menu("A* Search")
-                        heuristic_option = get_option(5)
+                        heuristic_option = get_option(6)
                         if heuristic_option == 1:
                             print("A* Search with Manhattan Distance selected.")
                             compute_a_star_search(problem, heuristic="manhattan")
@@ -293,6 +354,14 @@ def main():
                             compute_a_star_search(problem, heuristic="inadmissible")
                             break
                         elif heuristic_option == 4:
+                            print("A* Search with ALT Landmarks selected.")
+                            compute_a_star_search(problem, heuristic="landmarks")
+                            break
+                        elif heuristic_option == 5:
+                            print("A* Search with the Exact Distance Field selected.")
+                            compute_a_star_search(problem, heuristic="exact")
+                            break
+                        elif heuristic_option == 6:
                             break
                         else:
                             print("Invalid option. Please try again.")
@@ -301,7 +370,7 @@ def main():
                 elif sub_option == 2:
                     while True:
                         show_heuristic_menu("Greedy Best-First Search")
-                        heuristic_option = get_option(5)
+                        heuristic_option = get_option(6)
                         if heuristic_option == 1:
                             print("Greedy Best-First Search with Manhattan Distance selected.")
                             compute_greedy_best_first_search(problem, heuristic="manhattan")
@@ -315,21 +384,80 @@ def main():
                             compute_greedy_best_first_search(problem, heuristic="inadmissible")
                             break
                         elif heuristic_option == 4:
+                            print("Greedy Best-First Search with ALT Landmarks selected.")
+                            compute_greedy_best_first_search(problem, heuristic="landmarks")
+                            break
+                        elif heuristic_option == 5:
+                            print("Greedy Best-First Search with the Exact Distance Field selected.")
+                            compute_greedy_best_first_search(problem, heuristic="exact")
+                            break
+                        elif heuristic_option == 6:
                             break
                         else:
                             print("Invalid option. Please try again.")
                             continue
 
                 elif sub_option == 3:
-                    print("Comparison of A* and Greedy Best-First Search selected.")
+                    while True:
+                        show_heuristic_menu("Jump Point Search")
+                        heuristic_option = get_option(6)
+                        if heuristic_option == 1:
+                            print("JPS with Manhattan Distance selected.")
+                            compute_jump_point_search(problem, heuristic="manhattan")
+                            break
+                        elif heuristic_option == 2:
+                            print("JPS with Euclidean Distance selected.")
+                            compute_jump_point_search(problem, heuristic="euclidean")
+                            break
+                        elif heuristic_option == 3:
+                            print("JPS with Inadmissible Heuristic selected.")
+                            compute_jump_point_search(problem, heuristic="inadmissible")
+                            break
+                        elif heuristic_option == 4:
+                            print("JPS with ALT Landmarks selected.")
+                            compute_jump_point_search(problem, heuristic="landmarks")
+                            break
+                        elif heuristic_option == 5:
+                            print("JPS with the Exact Distance Field selected.")
+                            compute_jump_point_search(problem, heuristic="exact")
+                            break
+                        elif heuristic_option == 6:
+                            break
+                        else:
+                            print("Invalid option. Please try again.")
+                            continue
+
+                elif sub_option == 4:
+                    print("ARA* with Manhattan Distance selected.")
+                    compute_ara_star_search(problem, time_budget_ms=get_time_budget())
+
+                elif sub_option in (5, 6, 7):
+                    algorithm = {5: "IDA*", 6: "SMA*", 7: "MM"}[sub_option]
+                    while True:
+                        show_heuristic_menu(algorithm)
+                        heuristic_option = get_option(6)
+                        if heuristic_option == 6:
+                            break
+                        heuristic = ("manhattan", "euclidean", "inadmissible", "landmarks", "exact")[heuristic_option - 1]
+                        print(f"{algorithm} with the {heuristic} heuristic selected.")
+                        if sub_option == 5:
+                            compute_ida_star_search(problem, heuristic=heuristic)
+                        elif sub_option == 6:
+                            compute_sma_star_search(problem, heuristic=heuristic, node_cap=get_node_cap())
+                        else:
+                            compute_mm_search(problem, heuristic=heuristic)
+                        break
+
+                elif sub_option == 8:
+                    print("Comparison of A*, Greedy Best-First Search, JPS and ARA* selected.")
                     metrics = ic.compare_informed_search_algorithms(matrix, 15)
                     show_comparison_informed(metrics)
 
-                elif sub_option == 4: 
+                elif sub_option == 9: 
                     print("Visualizing Informed Searches (A*/Greedy x 4 Heuristics)...")
                     show_visualize_informed(problem, matrix)
                 
-                elif sub_option == 5:
+                elif sub_option == 10:
                     break
 
         elif option == 3:
@@ -22,6 +22,7 @@ from core.maze_generator import read_matrix_from_file
 from core.maze_representation import Maze
 from core.maze_problem import MazeProblem
 from core.heuristics import h_manhattan_distance, h_euclidean_distance, h_inadmissible
+from core.search_events import SearchReplay, SearchTrace
 
 # SEARCH
 from search.measure_time_memory import measure_time_memory
@@ -35,6 +36,7 @@ from uninformed.uninformed_comparison import compare_uninformed_search_algorithm
 
 # INFORMED SEARCH
 from informed.a_star_search import a_star_search
+from informed.jump_point_search import jump_point_search
 from informed.greedy_best_first_search import greedy_best_first_search
 from informed.generate_gifs_informed import generate_gifs_informed
 from informed.informed_comparison import compare_informed_search_algorithms
@@ -173,7 +175,8 @@ class App(tk.Tk):
         greedy_state = ' (missing)' if not self.has_greedy else ''
         ttk.Button(w, text=f"A* Search{a_star_state}", command=lambda: [w.destroy(), self.open_heuristic_window('A*')]).pack(fill=tk.X, padx=8, pady=4)
         ttk.Button(w, text=f"Greedy Best-First Search{greedy_state}", command=lambda: [w.destroy(), self.open_heuristic_window('Greedy')]).pack(fill=tk.X, padx=8, pady=4)
-        ttk.Button(w, text="Comparison of Both", command=lambda: [w.destroy(), self.run_comparison_informed()]).pack(fill=tk.X, padx=8, pady=4)
+        ttk.Button(w, text="Jump Point Search (JPS)", command=lambda: [w.destroy(), self.open_heuristic_window('JPS')]).pack(fill=tk.X, padx=8, pady=4)
+        ttk.Button(w, text="Comparison of All", command=lambda: [w.destroy(), self.run_comparison_informed()]).pack(fill=tk.X, padx=8, pady=4)
         ttk.Button(w, text="Visualize Informed Searches", command=lambda: [w.destroy(), self.save_all_informed_gifs_and_open_visualizer()]).pack(fill=tk.X, padx=8, pady=4)
         ttk.Button(w, text="Back", command=w.destroy).pack(fill=tk.X, padx=8, pady=6)
 
@@ -324,8 +327,8 @@ class App(tk.Tk):
         self.after(0, lambda: self.draw_maze(*args, **kwargs))
 
     # SCHEDULES AN ANIMATE_SNAPSHOTS CALL IN THE MAIN THREAD.
-    def safe_animate_snapshots(self, snapshots, interval_ms: int = 100, final_path=None):
-        self.after(0, lambda: self.animate_snapshots(snapshots, interval_ms, final_path=final_path))
+    def safe_animate_snapshots(self, trace, interval_ms: int = 100, final_path=None):
+        self.after(0, lambda: self.animate_snapshots(trace, interval_ms, final_path=final_path))
 
     # APPENDS TEXT TO THE OUTPUT LOG AND SCROLLS TO THE END.
     def write_output(self, text):
@@ -401,7 +404,7 @@ class App(tk.Tk):
             'visited': list(visited_set) if visited_set else None,
         }
 
-    # DRAWS A COLORED RECTANGLE OVER A SPECIFIC CELL (R, C) WITHOUT CLEARING THE CANVAS.
+    # DRAWS A COLORED RECTANGLE OVER A SPECIFIC CELL (R, C) WITHOUT CLEARING THE CANVAS; RETURNS ITS ITEM ID.
     def _draw_cell_overlay(self, r, c, fill='#add8e6'):
         if not self.matrix: return
         rows, cols = len(self.matrix), len(self.matrix[0])
@@ -413,11 +416,12 @@ class App(tk.Tk):
         size = min(cell_w, cell_h)
         x0, y0 = pad + c * size, pad + r * size
         x1, y1 = x0 + size, y0 + size
-        self.canvas.create_rectangle(x0, y0, x1, y1, fill=fill, outline='')
+        return self.canvas.create_rectangle(x0, y0, x1, y1, fill=fill, outline='')
 
-    # ANIMATES A LIST OF SEARCH SNAPSHOTS ON THE CANVAS.
-    def animate_snapshots(self, snapshots, interval_ms: int = 100, final_path=None):
-        if not snapshots:
+    # ANIMATES A RECORDED SEARCH (SEARCHTRACE) ON THE CANVAS, ONE EVENT PER FRAME.
+    # THE MAZE IS DRAWN ONCE; EACH FRAME ONLY RECOLORS THE CELLS ITS EVENT TOUCHES.
+    def animate_snapshots(self, trace, interval_ms: int = 100, final_path=None):
+        if not trace.events:
             self.safe_draw_maze(final_path=final_path)
             return
 
@@ -426,21 +430,12 @@ class App(tk.Tk):
             'reached_f': '#1f77b4', 'reached_b': '#ff00ff', 'frontier_f': '#ff7f0e',
             'frontier_b': '#17becf', 'current': '#ffe680', 'path': '#32cd32', 'tree': '#8c564b'
         }
-
-        # PREPARE FRAMES: NORMALIZE SNAPSHOT DATA INTO A CONSISTENT FORMAT
-        frames = []
-        for snap in snapshots:
-            frames.append({
-                'reached_F': {tuple(s) for s in snap.get('reached_F', [])},
-                'reached_B': {tuple(s) for s in snap.get('reached_B', [])},
-                'frontier_F': {tuple(s) for s in snap.get('frontier_F', [])},
-                'frontier_B': {tuple(s) for s in snap.get('frontier_B', [])},
-                'current': tuple(snap['current']) if snap.get('current') else None,
-                'tree': set()
-            })
-
-        # CALCULATE ALL VISITED NODES FOR THE FINAL DRAWING
-        visited_all = set().union(*(fr['reached_F'] for fr in frames), *(fr['reached_B'] for fr in frames))
+        LAYER_FILLS = {
+            'reached_F': PALETTE['reached_f'], 'reached_B': PALETTE['reached_b'],
+            'frontier_F': PALETTE['frontier_f'], 'frontier_B': PALETTE['frontier_b'],
+            'current': PALETTE['current'],
+        }
+        BASE_FILLS = {'#': 'black', 'S': 'green', 'G': 'red'}
 
         def draw_legend():
             legend_items = [
@@ -450,42 +445,47 @@ class App(tk.Tk):
                 ('Search Tree', PALETTE['tree'])
             ]
             x0, y0 = self.canvas.winfo_width() - 120, 10
+            first = None
             for i, (name, color) in enumerate(legend_items):
                 y = y0 + i * 20
-                self.canvas.create_rectangle(x0, y, x0 + 15, y + 15, fill=color)
+                item = self.canvas.create_rectangle(x0, y, x0 + 15, y + 15, fill=color)
                 self.canvas.create_text(x0 + 20, y + 7, anchor='w', text=name, font=('Arial', 10), fill='white')
+                first = first or item
+            return first
 
         # CANCEL PREVIOUS ANIMATION
         self.stop_animation()
         self._animating = True
 
+        # BASE MAZE AND LEGEND ARE DRAWN ONCE; OVERLAYS ARE ONE RECTANGLE PER CELL, RECOLORED IN PLACE
+        self.draw_maze()
+        legend = draw_legend()
+        replay = SearchReplay()
+        overlays = {}
+        events = trace.events
+
         # PLAYBACK LOOP
         def play(idx=0):
             if not self._animating:
                 return
 
-            if idx >= len(frames):
+            if idx >= len(events):
                 # DRAW THE FINAL STATE WITH THE PATH AND ALL VISITED NODES
-                self.draw_maze(final_path=final_path, visited=visited_all)
+                self.draw_maze(final_path=final_path, visited=replay.reached_states())
                 draw_legend()
                 self._animating = False
                 return
 
-            f = frames[idx]
-            # DRAW THE BASE MAZE WITHOUT OVERLAYS
-            self.draw_maze(tree_nodes=f.get('tree'))
-            
-            # DRAW OVERLAYS FOR THE CURRENT FRAME
-            for r, c in f['reached_F']: self._draw_cell_overlay(r, c, fill=PALETTE['reached_f'])
-            for r, c in f['reached_B']: self._draw_cell_overlay(r, c, fill=PALETTE['reached_b'])
-            for r, c in f['frontier_F']: self._draw_cell_overlay(r, c, fill=PALETTE['frontier_f'])
-            for r, c in f['frontier_B']: self._draw_cell_overlay(r, c, fill=PALETTE['frontier_b'])
-            if f['current']:
-                r, c = f['current']
-                self._draw_cell_overlay(r, c, fill=PALETTE['current'])
-
-            draw_legend()
-            
+            for cell in replay.apply(events[idx]):
+                r, c = cell
+                fill = LAYER_FILLS.get(replay.layer(cell)) or BASE_FILLS.get(self.matrix[r][c], 'white')
+                item = overlays.get(cell)
+                if item is None:
+                    item = overlays[cell] = self._draw_cell_overlay(r, c, fill=fill)
+                    self.canvas.tag_lower(item, legend)
+                else:
+                    self.canvas.itemconfigure(item, fill=fill)
+
             # SCHEDULE THE NEXT FRAME
             self._anim_after_id = self.after(max(1, interval_ms), lambda: play(idx + 1))
 
@@ -502,7 +502,7 @@ class App(tk.Tk):
             
             # 1. MEASURE PERFORMANCE: RUN WITHOUT CALLBACKS TO GET ACCURATE METRICS
             try:
-                result, elapsed_time, memory_used, _, _ = measure_time_memory(dijkstra, self.problem, None)
+                result, elapsed_time, memory_used, _, _ = measure_time_memory(dijkstra, self.problem, None, engine='heap')
                 if not result:
                     self.safe_write_output("No path found\n")
                     return
@@ -512,29 +512,22 @@ class App(tk.Tk):
                 self.safe_write_output(f"Error during Dijkstra measurement: {e}\n")
                 return
 
-            # 2. COLLECT SNAPSHOTS: RE-RUN THE ALGORITHM TO CAPTURE VISUALIZATION FRAMES
-            snapshots = []
-            def on_step_collect(snapshot):
-                snap_copy = {
-                    'reached_F': [tuple(n) for n in snapshot.get('reached', [])], 'reached_B': [],
-                    'frontier_F': [tuple(n) for n in snapshot.get('frontier', [])], 'frontier_B': [],
-                    'current': tuple(snapshot['current']) if 'current' in snapshot else None
-                }
-                snapshots.append(snap_copy)
+            # 2. RECORD THE SEARCH EVENTS: RE-RUN THE ALGORITHM TO CAPTURE VISUALIZATION FRAMES
+            trace = SearchTrace()
             try:
-                dijkstra(self.problem, on_step=on_step_collect)
+                dijkstra(self.problem, on_step=trace)
             except Exception: pass # CONTINUE EVEN IF SNAPSHOT COLLECTION FAILS
 
             # 3. ANIMATE AND DISPLAY RESULTS
             # CALCULATE ANIMATION INTERVAL BASED ON THE MEASURED TIME
-            frames = len(snapshots) or 1
+            frames = len(trace) or 1
             mult = self.default_playback_multiplier
             if self.default_visualize_use_runtime:
                 interval_ms = max(self.default_frame_interval_ms, int((elapsed_time / frames) * mult))
             else:
                 interval_ms = self.default_frame_interval_ms
             
-            self.safe_animate_snapshots(snapshots, interval_ms, final_path=path)
+            self.safe_animate_snapshots(trace, interval_ms, final_path=path)
             
             # DISPLAY MEASURED METRICS
             metrics = {
@@ -572,22 +565,21 @@ class App(tk.Tk):
                 self.safe_write_output(f"Error during Bidirectional measurement: {e}\n")
                 return
 
-            # 2. COLLECT SNAPSHOTS
-            snapshots = []
-            def on_step_collect(snapshot): snapshots.append(snapshot.copy())
+            # 2. RECORD THE SEARCH EVENTS
+            trace = SearchTrace()
             try:
-                bidirectional_best_first_search(self.problem, lambda n: n.g, problem_2, lambda n: n.g, on_step=on_step_collect)
+                bidirectional_best_first_search(self.problem, lambda n: n.g, problem_2, lambda n: n.g, on_step=trace)
             except Exception: pass
 
             # 3. ANIMATE AND DISPLAY RESULTS
-            frames = len(snapshots) or 1
+            frames = len(trace) or 1
             mult = self.default_playback_multiplier
             if self.default_visualize_use_runtime:
                 interval_ms = max(self.default_frame_interval_ms, int((elapsed_time / frames) * mult))
             else:
                 interval_ms = self.default_frame_interval_ms
             
-            self.safe_animate_snapshots(snapshots, interval_ms, final_path=path)
+            self.safe_animate_snapshots(trace, interval_ms, final_path=path)
 
             metrics = {
                 'Status': 'Path found' if solution else 'No path', 'Path length': len(path) if path else 0,
@@ -610,6 +602,8 @@ class App(tk.Tk):
             self.run_a_star(heuristic)
         elif algorithm == 'Greedy':
             self.run_greedy(heuristic)
+        elif algorithm == 'JPS':
+            self.run_jps(heuristic)
 
     # RUNS THE A* ALGORITHM WITH A GIVEN HEURISTIC.
     def run_a_star(self, heuristic: str = 'manhattan'):
@@ -631,23 +625,16 @@ class App(tk.Tk):
                 goal, nodes_expanded = result
                 path = reconstruct_path(goal) if goal else None
 
-                # 2. COLLECT SNAPSHOTS
-                snapshots = []
-                def on_step(snapshot):
-                    snap_copy = {
-                        'reached_F': [tuple(s) for s in snapshot.get('reached', [])], 'reached_B': [],
-                        'frontier_F': [tuple(s) for s in snapshot.get('frontier', [])], 'frontier_B': [],
-                        'current': tuple(snapshot['current']) if 'current' in snapshot else None
-                    }
-                    snapshots.append(snap_copy)
+                # 2. RECORD THE SEARCH EVENTS
+                trace = SearchTrace()
                 try:
-                    a_star_search(self.problem, h_fn, on_step=on_step)
+                    a_star_search(self.problem, h_fn, on_step=trace)
                 except Exception: pass
 
                 # 3. ANIMATE AND DISPLAY RESULTS
-                frames, mult = len(snapshots) or 1, self.default_playback_multiplier
+                frames, mult = len(trace) or 1, self.default_playback_multiplier
                 interval_ms = max(self.default_frame_interval_ms, int((elapsed_time / frames) * mult)) if self.default_visualize_use_runtime else self.default_frame_interval_ms
-                self.safe_animate_snapshots(snapshots, interval_ms, final_path=path)
+                self.safe_animate_snapshots(trace, interval_ms, final_path=path)
                 
                 metrics = {
                     'Status': 'Path found' if goal else 'No path', 'Path length': len(path) if path else 0,
@@ -662,6 +649,50 @@ class App(tk.Tk):
 
         self._run_in_thread(worker)
 
+    # RUNS JUMP POINT SEARCH WITH A GIVEN HEURISTIC.
+    def run_jps(self, heuristic: str = 'manhattan'):
+        if not self.problem:
+            messagebox.showwarning("No maze", "Load a maze first")
+            return
+
+        def worker():
+            try:
+                h_map = {'manhattan': h_manhattan_distance, 'euclidean': h_euclidean_distance, 'inadmissible': h_inadmissible}
+                h_fn = h_map.get(heuristic, h_manhattan_distance)
+
+                # 1. MEASURE PERFORMANCE
+                def run_call_measure(): return jump_point_search(self.problem, h_fn)
+                result, elapsed_time, memory_used, _, _ = measure_time_memory(run_call_measure)
+                if not result:
+                    self.after(0, lambda: self.show_result_summary(f"JPS Result", {'Status': 'No path found'}))
+                    return
+                goal, nodes_expanded = result
+                path = reconstruct_path(goal) if goal else None
+
+                # 2. RECORD THE SEARCH EVENTS (ONLY JUMP POINTS APPEAR IN THE FRONTIER)
+                trace = SearchTrace()
+                try:
+                    jump_point_search(self.problem, h_fn, on_step=trace)
+                except Exception: pass
+
+                # 3. ANIMATE AND DISPLAY RESULTS
+                frames, mult = len(trace) or 1, self.default_playback_multiplier
+                interval_ms = max(self.default_frame_interval_ms, int((elapsed_time / frames) * mult)) if self.default_visualize_use_runtime else self.default_frame_interval_ms
+                self.safe_animate_snapshots(trace, interval_ms, final_path=path)
+
+                metrics = {
+                    'Status': 'Path found' if goal else 'No path', 'Path length': len(path) if path else 0,
+                    'Cost': getattr(goal, 'g', 'N/A'), 'Nodes expanded': nodes_expanded,
+                    'Time (ms)': f"{elapsed_time:.3f}", 'Memory (B)': f"{memory_used:.3f}",
+                }
+                self.after(0, lambda: self.show_result_summary(f"JPS - {heuristic}", metrics))
+                self.safe_write_output(f"JPS ({heuristic}) complete. Time: {elapsed_time:.3f} ms, Memory: {memory_used:.3f} B\n")
+
+            except Exception as e:
+                self.safe_write_output(f"Error running JPS: {e}\n")
+
+        self._run_in_thread(worker)
+
     # RUNS THE GREEDY BEST-FIRST SEARCH ALGORITHM WITH A GIVEN HEURISTIC.
     def run_greedy(self, heuristic: str = 'manhattan'):
         if not self.problem:
@@ -688,23 +719,16 @@ class App(tk.Tk):
                 goal, nodes_expanded = result
                 path = reconstruct_path(goal) if goal else None
 
-                # 2. COLLECT SNAPSHOTS
-                snapshots = []
-                def on_step(snapshot):
-                    snap_copy = {
-                        'reached_F': [tuple(s) for s in snapshot.get('reached', [])], 'reached_B': [],
-                        'frontier_F': [tuple(s) for s in snapshot.get('frontier', [])], 'frontier_B': [],
-                        'current': tuple(snapshot['current']) if 'current' in snapshot else None
-                    }
-                    snapshots.append(snap_copy)
+                # 2. RECORD THE SEARCH EVENTS
+                trace = SearchTrace()
                 try:
-                    greedy_best_first_search(self.problem, lambda n: n.h, heuristic_table, on_step=on_step)
+                    greedy_best_first_search(self.problem, lambda n: n.h, heuristic_table, on_step=trace)
                 except Exception: pass
                 
                 # 3. ANIMATE AND DISPLAY RESULTS
-                frames, mult = len(snapshots) or 1, self.default_playback_multiplier
+                frames, mult = len(trace) or 1, self.default_playback_multiplier
                 interval_ms = max(self.default_frame_interval_ms, int((elapsed_time / frames) * mult)) if self.default_visualize_use_runtime else self.default_frame_interval_ms
-                self.safe_animate_snapshots(snapshots, interval_ms, final_path=path)
+                self.safe_animate_snapshots(trace, interval_ms, final_path=path)
                 
                 metrics = {
                     'Status': 'Path found' if goal else 'No path', 'Path length': len(path) if path else 0,
@@ -780,9 +804,10 @@ class App(tk.Tk):
             def show_table(title, metrics_data):
                 win = Toplevel(self)
                 win.title(title)
-                win.geometry("1050x380")
+                win.geometry("1420x380")
                 cols = ("Metric", "A*-Manhattan", "A*-Euclidean", "A*-Inadmissible",
-                        "Greedy-Manhattan", "Greedy-Euclidean", "Greedy-Inadmissible")
+                        "Greedy-Manhattan", "Greedy-Euclidean", "Greedy-Inadmissible",
+                        "JPS-Manhattan", "JPS-Euclidean", "ARA*-Manhattan")
                 tree = ttk.Treeview(win, columns=cols, show='headings')
                 for col in cols: tree.heading(col, text=col)
                 tree.column("Metric", width=140, anchor='w')
@@ -793,7 +818,8 @@ class App(tk.Tk):
                     ("Avg Peak Memory (KB)", "avg peak (KB)"), ("Avg Current Memory (KB)", "avg current (KB)"),
                     ("Avg RSS Memory (B)", "avg memory (B)"), ("Solutions Found", "found count")
                 ]
-                alg_keys = ["A*-Manhattan", "A*-Euclidean", "A*-Inadmissible", "Greedy-Manhattan", "Greedy-Euclidean", "Greedy-Inadmissible"]
+                alg_keys = ["A*-Manhattan", "A*-Euclidean", "A*-Inadmissible", "Greedy-Manhattan", "Greedy-Euclidean", "Greedy-Inadmissible",
+                            "JPS-Manhattan", "JPS-Euclidean", "ARA*-Manhattan"]
                 
                 for row_name, key_suffix in metric_keys:
                     values = [row_name] + [metrics_data[f'{alg_key} {key_suffix}'] for alg_key in alg_keys]
@@ -813,27 +839,19 @@ class App(tk.Tk):
 
         def worker():
             self.safe_write_output("Visualizing Dijkstra...\n")
-            snapshots = []
-
-            def on_step(snapshot):
-                snap_copy = {
-                    'reached_F': [tuple(n) for n in snapshot.get('reached', [])], 'reached_B': [],
-                    'frontier_F': [tuple(n) for n in snapshot.get('frontier', [])], 'frontier_B': [],
-                    'current': tuple(snapshot['current']) if 'current' in snapshot else None
-                }
-                snapshots.append(snap_copy)
+            trace = SearchTrace()
 
             try:
-                result, elapsed_time, _, _, _ = measure_time_memory(dijkstra, self.problem, on_step=on_step)
+                result, elapsed_time, _, _, _ = measure_time_memory(dijkstra, self.problem, on_step=trace)
                 if not result:
                     self.safe_write_output("No path found\n")
                     return
                 solution, _ = result
                 path = reconstruct_path(solution) if solution else None
                 
-                frames, mult = len(snapshots) or 1, self.default_playback_multiplier
+                frames, mult = len(trace) or 1, self.default_playback_multiplier
                 interval_ms = max(self.default_frame_interval_ms, int((elapsed_time / frames) * mult)) if self.default_visualize_use_runtime else self.default_frame_interval_ms
-                self.safe_animate_snapshots(snapshots, interval_ms, final_path=path)
+                self.safe_animate_snapshots(trace, interval_ms, final_path=path)
                 self.safe_write_output("Animation played in GUI.\n")
             except Exception as e:
                 self.safe_write_output(f"Error visualizing Dijkstra: {e}\n")
@@ -848,13 +866,12 @@ class App(tk.Tk):
 
         def worker():
             self.safe_write_output("Visualizing Bidirectional...\n")
-            snapshots = []
-            def on_step(snapshot): snapshots.append(snapshot.copy())
+            trace = SearchTrace()
 
             try:
                 problem_2 = self._create_swapped_problem()
                 def run_call():
-                    return bidirectional_best_first_search(self.problem, lambda n: n.g, problem_2, lambda n: n.g, on_step=on_step)
+                    return bidirectional_best_first_search(self.problem, lambda n: n.g, problem_2, lambda n: n.g, on_step=trace)
                 result, elapsed_time, _, _, _ = measure_time_memory(run_call)
                 if not result:
                     self.safe_write_output("No path found\n")
@@ -862,9 +879,9 @@ class App(tk.Tk):
                 solution, _ = result
                 path = reconstruct_path(solution) if solution else None
 
-                frames, mult = len(snapshots) or 1, self.default_playback_multiplier
+                frames, mult = len(trace) or 1, self.default_playback_multiplier
                 interval_ms = max(self.default_frame_interval_ms, int((elapsed_time / frames) * mult)) if self.default_visualize_use_runtime else self.default_frame_interval_ms
-                self.safe_animate_snapshots(snapshots, interval_ms, final_path=path)
+                self.safe_animate_snapshots(trace, interval_ms, final_path=path)
                 self.safe_write_output("Animation played in GUI.\n")
             except Exception as e:
                 self.safe_write_output(f"Error visualizing Bidirectional: {e}\n")
@@ -882,22 +899,14 @@ class App(tk.Tk):
 
         def worker():
             self.safe_write_output("Visualizing A*...\n")
-            snapshots = []
-
-            def on_step(snapshot):
-                snap_copy = {
-                    'reached_F': [tuple(s) for s in snapshot.get('reached', [])], 'reached_B': [],
-                    'frontier_F': [tuple(s) for s in snapshot.get('frontier', [])], 'frontier_B': [],
-                    'current': tuple(snapshot['current']) if 'current' in snapshot else None
-                }
-                snapshots.append(snap_copy)
+            trace = SearchTrace()
 
             try:
                 choice = self._viz_informed_heur_var.get()
                 h_map = {'manhattan': h_manhattan_distance, 'euclidean': h_euclidean_distance, 'inadmissible': h_inadmissible}
                 h_fn = h_map.get(choice, h_manhattan_distance)
                 
-                def run_call(): return a_star_search(self.problem, h_fn, on_step=on_step)
+                def run_call(): return a_star_search(self.problem, h_fn, on_step=trace)
                 result, elapsed_time, _, _, _ = measure_time_memory(run_call)
                 if not result:
                     self.safe_write_output("No path found\n")
@@ -905,9 +914,9 @@ class App(tk.Tk):
                 solution, _ = result
                 path = reconstruct_path(solution) if solution else None
 
-                frames, mult = len(snapshots) or 1, self.default_playback_multiplier
+                frames, mult = len(trace) or 1, self.default_playback_multiplier
                 interval_ms = max(self.default_frame_interval_ms, int((elapsed_time / frames) * mult)) if self.default_visualize_use_runtime else self.default_frame_interval_ms
-                self.safe_animate_snapshots(snapshots, interval_ms, final_path=path)
+                self.safe_animate_snapshots(trace, interval_ms, final_path=path)
                 self.safe_write_output("Animation played in GUI.\n")
             except Exception as e:
                 self.safe_write_output(f"Error visualizing A*: {e}\n")
@@ -925,15 +934,7 @@ class App(tk.Tk):
 
         def worker():
             self.safe_write_output("Visualizing Greedy Best-First Search...\n")
-            snapshots = []
-
-            def on_step(snapshot):
-                snap_copy = {
-                    'reached_F': [tuple(s) for s in snapshot.get('reached', [])], 'reached_B': [],
-                    'frontier_F': [tuple(s) for s in snapshot.get('frontier', [])], 'frontier_B': [],
-                    'current': tuple(snapshot['current']) if 'current' in snapshot else None
-                }
-                snapshots.append(snap_copy)
+            trace = SearchTrace()
 
             try:
                 choice = self._viz_informed_heur_var.get()
@@ -945,7 +946,7 @@ class App(tk.Tk):
                     for r in range(self.problem.maze.H) for c in range(self.problem.maze.W)
                 }
 
-                def run_call(): return greedy_best_first_search(self.problem, lambda n: n.h, heuristic_table, on_step=on_step)
+                def run_call(): return greedy_best_first_search(self.problem, lambda n: n.h, heuristic_table, on_step=trace)
                 result, elapsed_time, _, _, _ = measure_time_memory(run_call)
                 if not result:
                     self.safe_write_output("No path found\n")
@@ -953,9 +954,9 @@ class App(tk.Tk):
                 solution, _ = result
                 path = reconstruct_path(solution) if solution else None
 
-                frames, mult = len(snapshots) or 1, self.default_playback_multiplier
+                frames, mult = len(trace) or 1, self.default_playback_multiplier
                 interval_ms = max(self.default_frame_interval_ms, int((elapsed_time / frames) * mult)) if self.default_visualize_use_runtime else self.default_frame_interval_ms
-                self.safe_animate_snapshots(snapshots, interval_ms, final_path=path)
+                self.safe_animate_snapshots(trace, interval_ms, final_path=path)
                 self.safe_write_output("Animation played in GUI.\n")
             except Exception as e:
                 self.safe_write_output(f"Error visualizing Greedy: {e}\n")
@@ -1,56 +1,111 @@
 # EXTERNAL IMPORTS
-import heapq
 from typing import Callable, Optional, Tuple
 
 # INTERNAL PROJECT IMPORTS
 # CORE
 from core.problem import Problem
 from core.node import Node
+from core.node_pool import NodePool, NO_PARENT
+from core.frontier import make_frontier
+from core.tie_breaking import make_tie_break
+from core.search_events import search_event, PUSH, IMPROVE, POP
 
 # SEARCH
-# (NONE NEEDED FOR THIS FILE)
+from search.integer_states import csr_maze, csr_views, ids_from_parents, node_from_ids
 
-# FUNCTION TO PERFORM BEST-FIRST SEARCH WITH OPTIONAL SNAPSHOT CALLBACK
-def best_first_search(problem: Problem, f: Callable[[Node], float], on_step: Callable[[dict], None] | None = None) -> Optional[Tuple[Node, int]]:
-    start = Node(state=problem.initial, g=0.0, h=problem.heuristic(problem.initial, problem.goal))
-    frontier = []
-    heapq.heappush(frontier, (f(start), start))
-    reached = {start.state: start}
+# FUNCTION TO PERFORM BEST-FIRST SEARCH WITH AN OPTIONAL SEARCH EVENT CALLBACK (SEE CORE.SEARCH_EVENTS)
+# FRONTIER: 'lazy' (HEAPQ WITH DUPLICATES) OR 'indexed' (ONE ENTRY PER STATE, DECREASE-KEY), SEE CORE.FRONTIER
+# TIE_BREAK: ORDER AMONG EQUAL f, ONE OF CORE.TIE_BREAKING.TIE_BREAKS; TIE_BREAK_SEED SEEDS THE 'random' ONE
+def best_first_search(problem: Problem, f: Callable[[Node], float], on_step: Callable[[dict], None] | None = None,
+                      frontier='lazy', tie_break: str = 'fifo',
+                      tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+
+    # FAST PATH: INTEGER CELL IDS OVER THE MAZE CSR ADJACENCY
+    if on_step is None:
+        maze = csr_maze(problem)
+        if maze is not None:
+            return best_first_search_csr(problem, maze, f, frontier, tie_break, tie_break_seed)
+
+    # NODES LIVE IN A POOL OF ARRAYS; THE FRONTIER AND REACHED HOLD POOL INDICES
+    h0 = problem.heuristic(problem.initial, problem.goal)
+    pool = NodePool()
+    root = pool.add(problem.initial, NO_PARENT, None, 0.0, h0)
+    # F IS EVALUATED ON A SINGLE REUSED NODE INSTEAD OF ONE NODE PER CHILD
+    probe = Node(state=problem.initial, g=0.0, h=h0)
+    states, g_of = pool.states, pool.g
+    # AN INDEXED FRONTIER IS KEYED BY STATE: EACH IMPROVEMENT ADDS A POOL NODE BUT REPLACES THE QUEUED ENTRY
+    frontier = make_frontier(frontier, key=lambda entry: states[entry[2]])
+    tie = make_tie_break(tie_break, tie_break_seed)
+    frontier.push((f(probe), tie(0.0, h0), root))
+    reached = {problem.initial: root}
     nodes_expanded = 0
 
-    while frontier:
-        _, node = heapq.heappop(frontier)
-        if problem.is_goal(node.state):
+    while frontier.heap:
+        _, _, i = frontier.pop()
+        state = states[i]
+        if on_step:
+            on_step(search_event(POP, state, nodes_expanded))
+        if problem.is_goal(state):
             # RETURN GOAL NODE AND NUMBER OF NODES EXPANDED
-            return node, nodes_expanded
+            return pool.node(i), nodes_expanded
 
-        for child in expand(problem, node):
-            # EMIT SNAPSHOT BEFORE EXPANDING A NODE
-            if on_step:
-                snapshot = {
-                    'current': node.state,
-                    'frontier': [n.state for _, n in frontier],
-                    'reached': list(reached.keys()),
-                    'event': 'expand_node',
-                    'nodes_expanded': nodes_expanded,
-                }
-                on_step(snapshot)
-            existing = reached.get(child.state)
-            if existing is None or child.g < existing.g:
-                reached[child.state] = child
-                heapq.heappush(frontier, (f(child), child))
+        g = g_of[i]
+        for action in problem.actions(state):
+            s2 = problem.result(state, action)
+            g2 = g + problem.action_cost(state, action, s2)
+            existing = reached.get(s2)
+            if existing is None or g2 < g_of[existing]:
+                h2 = problem.heuristic(s2, problem.goal)
+                j = pool.add(s2, i, action, g2, h2)
+                reached[s2] = j
+                probe.state = s2
+                probe.g = g2
+                probe.h = h2
+                frontier.push((f(probe), tie(g2, h2), j))
                 nodes_expanded += 1
 
-                # EMIT SNAPSHOT WHEN PUSHING A CHILD
+                # EMIT A PUSH (OR IMPROVE) EVENT FOR THE CHILD
                 if on_step:
-                    snapshot = {
-                        'current': child.state,
-                        'frontier': [n.state for _, n in frontier],
-                        'reached': list(reached.keys()),
-                        'event': 'push_child',
-                        'nodes_expanded': nodes_expanded,
-                    }
-                    on_step(snapshot)
+                    on_step(search_event(PUSH if existing is None else IMPROVE, s2, nodes_expanded))
+    return None
+
+# BEST-FIRST SEARCH OVER INTEGER CELL IDS, SAME EXPANSION RULES AS BEST_FIRST_SEARCH
+def best_first_search_csr(problem: Problem, maze, f: Callable[[Node], float],
+                          frontier='lazy', tie_break: str = 'fifo',
+                          tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
+    indptr, indices = csr_views(maze)
+    start = maze.cell_id(problem.initial)
+    goal = maze.cell_id(problem.goal)
+
+    # F IS EVALUATED ON A SINGLE REUSED NODE INSTEAD OF ONE NODE PER CHILD
+    probe = Node(state=start, g=0.0, h=0.0)
+    frontier = make_frontier(frontier)
+    heap, push, pop = frontier.heap, frontier.push, frontier.pop
+    tie = make_tie_break(tie_break, tie_break_seed)
+    push((f(probe), tie(0.0, 0.0), start, 0.0))
+    reached = {start: 0.0}
+    parent = {start: -1}
+    nodes_expanded = 0
+
+    while heap:
+        _, _, u, g = pop()
+        if u == goal:
+            return node_from_ids(maze, ids_from_parents(parent, u)), nodes_expanded
+
+        g2 = g + 1.0
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            existing = reached.get(v)
+            if existing is None or g2 < existing:
+                reached[v] = g2
+                parent[v] = u
+                probe.state = v
+                probe.g = g2
+                push((f(probe), tie(g2, 0.0), v, g2))
+                nodes_expanded += 1
     return None
 
 # FUNCTION TO GENERATE CHILD NODES FROM CURRENT NODE
@@ -66,5 +121,9 @@ def reconstruct_path(node: Node):
     path = []
     while node:
         path.append(node.state)
+        # CONTRACTED CORRIDOR: THE ACTION CARRIES THE CELLS WALKED TO REACH THIS NODE
+        cells = getattr(node.action, 'cells', None)
+        if cells:
+            path.extend(reversed(cells))
         node = node.parent
     return list(reversed(path))
@@ -5,18 +5,30 @@ import heapq
 # INTERNAL PROJECT IMPORTS
 # CORE
 from core.problem import Problem
+from core.corridor_problem import CorridorProblem
 from core.node import Node
 from core.maze_problem import MazeProblem
 from core.maze_representation import Maze
+from core.search_events import search_event, PUSH, IMPROVE, POP, MEET, FORWARD, BACKWARD
+from core.tie_breaking import make_tie_break
 
 # SEARCH
 from search.measure_time_memory import measure_time_memory
+from search.integer_states import csr_maze, csr_views, ids_from_parents, node_from_ids
 
 # UNINFORMED SEARCH
 from uninformed.best_first_search import expand, reconstruct_path
 
+# OPPOSITE OF EACH MAZE MOVE
+OPPOSITE_ACTION = {'N': 'S', 'S': 'N', 'O': 'L', 'L': 'O'}
+
 # BIDIRECTIONAL BEST-FIRST SEARCH COMPUTATION FUNCTION
 def compute_bidirectional_best_first_search(problem: Problem, matrix):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
     # FUNCTION TO RUN BIDIRECTIONAL BEST-FIRST SEARCH WITH MATRIX REVERSAL
     def bid_bfs():
         # COPY MATRIX TO AVOID MODIFYING ORIGINAL
@@ -56,6 +68,13 @@ def compute_bidirectional_best_first_search(problem: Problem, matrix):
         print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
 
 
+# OPPOSITE MOVE OF A STEP TAKEN BY THE BACKWARD SEARCH (CORRIDORS ARE WALKED IN REVERSE)
+def reverse_action(action):
+    if hasattr(action, 'reversed'):
+        return action.reversed()
+    return OPPOSITE_ACTION.get(action, action)
+
+
 # FUNCTION TO JOIN NODES FROM FORWARD AND BACKWARD SEARCH
 def join_nodes(direction: str, meeting_child: Node, reached_other: Dict) -> Node:
     # RECONSTRUCT SOLUTION NODE COMBINING FORWARD AND BACKWARD PATHS
@@ -69,15 +88,15 @@ def join_nodes(direction: str, meeting_child: Node, reached_other: Dict) -> Node
         # SWAP NODES IF DIRECTION IS BACKWARD
         forward_node, backward_node = backward_node, forward_node
 
-    # ATTACH BACKWARD PATH TO FORWARD NODE
+    # ATTACH BACKWARD PATH TO FORWARD NODE, TURNING EACH BACKWARD STEP AROUND
     while backward_node.parent is not None:
-        forward_node.action = backward_node.parent
+        step = reverse_action(backward_node.action)
         backward_node = backward_node.parent
         forward_node = Node(
             state=backward_node.state, 
             parent=forward_node, 
-            action=backward_node.action, 
-            g=forward_node.g + 1
+            action=step, 
+            g=forward_node.g + getattr(step, 'cost', 1)
         )
 
     forward_node.g = total_g
@@ -94,40 +113,19 @@ def proceed(
     f_func: Callable[[Node], float],
     expanded_nodes: int,
     on_step: Callable[[dict], None] | None = None,
+    tie: Callable[[float, float], object] | None = None,
 ) -> Optional[Node]:
     # RETURN NONE IF FRONTIER IS EMPTY
     if not frontier:
         return None
 
     # POP NODE FROM HEAP FRONTIER
-    _, node = heapq.heappop(frontier)
+    _, _, node = heapq.heappop(frontier)
 
-    # EMIT SNAPSHOT BEFORE EXPANSION IF CALLBACK EXISTS
+    # THE EVENTS OF EACH SIDE CARRY ITS DIRECTION, SO A REPLAY KEEPS THE TWO SEARCHES APART
+    dir_label = FORWARD if direction == 'F' else BACKWARD
     if on_step:
-        dir_label = 'Forward' if direction == 'F' else 'Backward'
-        if direction == 'F':
-            snapshot = {
-                'current': node.state,
-                'frontier_F': [n.state for _, n in frontier],
-                'frontier_B': [],
-                'reached_F': list(reached.keys()),
-                'reached_B': list(reached_other.keys()),
-                'event': 'pop',
-                'direction': dir_label,
-                'nodes_expanded': expanded_nodes,
-            }
-        else:
-            snapshot = {
-                'current': node.state,
-                'frontier_F': [],
-                'frontier_B': [n.state for _, n in frontier],
-                'reached_F': list(reached_other.keys()),
-                'reached_B': list(reached.keys()),
-                'event': 'pop',
-                'direction': dir_label,
-                'nodes_expanded': expanded_nodes,
-            }
-        on_step(snapshot)
+        on_step(search_event(POP, node.state, expanded_nodes, dir_label))
 
     # EXPAND CHILDREN
     for child in expand(problem, node):
@@ -136,38 +134,17 @@ def proceed(
         if existing is None or child.g < existing.g:
             # ADD CHILD TO REACHED AND FRONTIER
             reached[s] = child
-            heapq.heappush(frontier, (f_func(child), child))
+            heapq.heappush(frontier, (f_func(child), tie(child.g, child.h), child))
             expanded_nodes += 1
 
-            # EMIT SNAPSHOT AFTER PUSHING CHILD
+            # EMIT A PUSH (OR IMPROVE) EVENT FOR THE CHILD
             if on_step:
-                dir_label = 'Forward' if direction == 'F' else 'Backward'
-                if direction == 'F':
-                    snapshot = {
-                        'current': child.state,
-                        'frontier_F': [n.state for _, n in frontier],
-                        'frontier_B': [],
-                        'reached_F': list(reached.keys()),
-                        'reached_B': list(reached_other.keys()),
-                        'event': 'push_child',
-                        'direction': dir_label,
-                        'nodes_expanded': expanded_nodes,
-                    }
-                else:
-                    snapshot = {
-                        'current': child.state,
-                        'frontier_F': [],
-                        'frontier_B': [n.state for _, n in frontier],
-                        'reached_F': list(reached_other.keys()),
-                        'reached_B': list(reached.keys()),
-                        'event': 'push_child',
-                        'direction': dir_label,
-                        'nodes_expanded': expanded_nodes,
-                    }
-                on_step(snapshot)
+                on_step(search_event(PUSH if existing is None else IMPROVE, s, expanded_nodes, dir_label))
 
             # CHECK IF MEETING POINT FOUND
             if s in reached_other:
+                if on_step:
+                    on_step(search_event(MEET, s, expanded_nodes, dir_label))
                 solution = join_nodes(direction, child, reached_other)
                 return solution, expanded_nodes
 
@@ -180,17 +157,37 @@ def bidirectional_best_first_search(
     f_F: Callable[[Node], float], 
     problem_B: Problem, 
     f_B: Callable[[Node], float], 
-    on_step: Callable[[dict], None] | None = None
+    on_step: Callable[[dict], None] | None = None,
+    tie_break: str = 'fifo',
+    tie_break_seed: Optional[int] = None
 ) -> Optional[Tuple[Node, int]]:
+    # THE FIRST MEETING IS ONLY A SHORTEST PATH WITH UNIT STEPS; CORRIDOR STEPS ARE WEIGHTED
+    if isinstance(problem_F, CorridorProblem) or isinstance(problem_B, CorridorProblem):
+        raise ValueError("Bidirectional best-first search is not optimal on weighted corridor steps; "
+                         "use a one-directional engine or MM on a CorridorProblem")
+
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem_F.unreachable():
+        return None
+
+    # FAST PATH: INTEGER CELL IDS OVER THE MAZE CSR ADJACENCY
+    if on_step is None:
+        maze_F = csr_maze(problem_F)
+        maze_B = csr_maze(problem_B)
+        if maze_F is not None and maze_B is not None and (maze_F.H, maze_F.W) == (maze_B.H, maze_B.W):
+            return bidirectional_best_first_search_csr(problem_F, maze_F, f_F, problem_B, maze_B, f_B,
+                                                       tie_break, tie_break_seed)
+
     # INITIALIZE START NODES
     node_F = Node(state=problem_F.initial, g=0.0)
     node_B = Node(state=problem_B.initial, g=0.0)
 
-    # INITIALIZE FRONTIERS
+    # INITIALIZE FRONTIERS; EQUAL f IS SETTLED BY THE TIE-BREAKING POLICY, SHARED BY BOTH SIDES
+    tie = make_tie_break(tie_break, tie_break_seed)
     frontier_F = []
     frontier_B = []
-    heapq.heappush(frontier_F, (f_F(node_F), node_F))
-    heapq.heappush(frontier_B, (f_B(node_B), node_B))
+    heapq.heappush(frontier_F, (f_F(node_F), tie(0.0, node_F.h), node_F))
+    heapq.heappush(frontier_B, (f_B(node_B), tie(0.0, node_B.h), node_B))
 
     # INITIALIZE REACHED SETS
     reached_F = {node_F.state: node_F}
@@ -207,15 +204,72 @@ def bidirectional_best_first_search(
         if topF < topB:
             # EXPAND FORWARD FRONTIER
             solution, expanded_nodes = proceed(
-                'F', problem_F, frontier_F, reached_F, reached_B, f_F, expanded_nodes, on_step=on_step
+                'F', problem_F, frontier_F, reached_F, reached_B, f_F, expanded_nodes, on_step=on_step, tie=tie
             )
         else:
             # EXPAND BACKWARD FRONTIER
             solution, expanded_nodes = proceed(
-                'B', problem_B, frontier_B, reached_B, reached_F, f_B, expanded_nodes, on_step=on_step
+                'B', problem_B, frontier_B, reached_B, reached_F, f_B, expanded_nodes, on_step=on_step, tie=tie
             )
 
         if solution is not None:
             return solution, expanded_nodes
 
     return None
+
+
+# BIDIRECTIONAL BEST-FIRST SEARCH OVER INTEGER CELL IDS, SAME ALTERNATION AND MEETING RULES
+def bidirectional_best_first_search_csr(
+    problem_F: Problem,
+    maze_F: Maze,
+    f_F: Callable[[Node], float],
+    problem_B: Problem,
+    maze_B: Maze,
+    f_B: Callable[[Node], float],
+    tie_break: str = 'fifo',
+    tie_break_seed: Optional[int] = None,
+) -> Optional[Tuple[Node, int]]:
+    start_F = maze_F.cell_id(problem_F.initial)
+    start_B = maze_B.cell_id(problem_B.initial)
+
+    # F IS EVALUATED ON A SINGLE REUSED NODE INSTEAD OF ONE NODE PER CHILD
+    tie = make_tie_break(tie_break, tie_break_seed)
+    probe = Node(state=start_F, g=0.0)
+    frontier_F = [(f_F(probe), tie(0.0, 0.0), start_F, 0.0)]
+    probe.state = start_B
+    frontier_B = [(f_B(probe), tie(0.0, 0.0), start_B, 0.0)]
+    reached_F = {start_F: 0.0}
+    reached_B = {start_B: 0.0}
+    parent_F = {start_F: -1}
+    parent_B = {start_B: -1}
+    sides = {
+        'F': (csr_views(maze_F), frontier_F, reached_F, parent_F, reached_B, f_F),
+        'B': (csr_views(maze_B), frontier_B, reached_B, parent_B, reached_F, f_B),
+    }
+    expanded_nodes = 0
+
+    while frontier_F and frontier_B:
+        direction = 'F' if frontier_F[0][0] < frontier_B[0][0] else 'B'
+        (indptr, indices), frontier, reached, parent, reached_other, f_func = sides[direction]
+
+        _, _, u, g = heapq.heappop(frontier)
+        g2 = g + 1.0
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            existing = reached.get(v)
+            if existing is None or g2 < existing:
+                reached[v] = g2
+                parent[v] = u
+                probe.state = v
+                probe.g = g2
+                heapq.heappush(frontier, (f_func(probe), tie(g2, 0.0), v, g2))
+                expanded_nodes += 1
+
+                # CHECK IF MEETING POINT FOUND
+                if v in reached_other:
+                    forward = ids_from_parents(parent_F, v)
+                    backward = ids_from_parents(parent_B, v)
+                    backward.reverse()
+                    return node_from_ids(maze_F, forward + backward[1:]), expanded_nodes
+
+    return None
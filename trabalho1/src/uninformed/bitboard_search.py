@@ -0,0 +1,71 @@
+# EXTERNAL IMPORTS
+from typing import Optional, Tuple
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.problem import Problem
+from core.node import Node
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import csr_maze, node_from_ids
+
+# UNINFORMED SEARCH
+from uninformed.best_first_search import reconstruct_path
+from uninformed.dial_search import dial_search
+
+
+# COMPUTES THE BIT-PARALLEL (BITBOARD) BFS
+def compute_bitboard_search(problem: Problem):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    result, elapsed_time, memory_used, current, peak = measure_time_memory(bitboard_search, problem)
+
+    if result is None:
+        print("No path found")
+        return
+
+    goal_node, nodes_expanded = result
+
+    if goal_node:
+        print("Path:", reconstruct_path(goal_node))
+        print("Number of nodes expanded:", nodes_expanded)
+        print("Cost of path:", goal_node.g)
+        print(f"Time taken: {elapsed_time:.3f} milliseconds")
+        print(f"Memory used: {memory_used:.12f} B")
+        print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
+
+
+# UNIT-COST SHORTEST PATH WITH THE WHOLE MAZE AS ONE BIG INT: EACH BFS LEVEL IS A HANDFUL OF SHIFTS,
+# ANDS AND ORS (MAZEBITBOARD.LAYERS) UNTIL THE LEVEL THAT REACHES G; THE PATH WALKS THE DISTANCE FIELD
+# BACK FROM G. NODES EXPANDED COUNTS THE CELLS REACHED (AS IN WAVEFRONT_SEARCH)
+# PROBLEMS WITHOUT A PLAIN IN-MEMORY MAZE GO TO DIAL_SEARCH
+def bitboard_search(problem: Problem) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+
+    maze = csr_maze(problem)
+    if maze is None:
+        return dial_search(problem)
+
+    dist, reached = maze.bitboard().distances(problem.initial, problem.goal)
+    r, c = problem.goal
+    d = int(dist[r, c])
+    if d < 0:
+        return None
+
+    # FROM G, ALWAYS STEP TO A NEIGHBOR ONE LEVEL CLOSER TO S (N, S, O, L ORDER)
+    cells = [(r, c)]
+    while d > 0:
+        d -= 1
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < maze.H and 0 <= nc < maze.W and dist[nr, nc] == d:
+                r, c = nr, nc
+                break
+        cells.append((r, c))
+    cells.reverse()
+    return node_from_ids(maze, [maze.cell_id(p) for p in cells]), reached - 1
@@ -0,0 +1,137 @@
+# EXTERNAL IMPORTS
+from collections import deque
+from typing import Callable, Optional, Tuple
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.problem import Problem
+from core.node import Node
+from core.node_pool import NodePool, NO_PARENT
+from core.search_events import search_event, PUSH, IMPROVE, POP
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import csr_maze, csr_views, ids_from_parents, node_from_ids
+
+# UNINFORMED SEARCH
+from uninformed.best_first_search import reconstruct_path
+
+
+# COMPUTES DIAL'S BUCKET-QUEUE SEARCH (BFS ON UNIT-COST MAZES)
+def compute_dial_search(problem: Problem):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    result, elapsed_time, memory_used, current, peak = measure_time_memory(dial_search, problem)
+
+    if result is None:
+        print("No path found")
+        return
+
+    goal_node, nodes_expanded = result
+
+    if goal_node:
+        print("Path:", reconstruct_path(goal_node))
+        print("Number of nodes expanded:", nodes_expanded)
+        print("Cost of path:", goal_node.g)
+        print(f"Time taken: {elapsed_time:.3f} milliseconds")
+        print(f"Memory used: {memory_used:.12f} B")
+        print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
+
+
+# DIJKSTRA WITH A BUCKET QUEUE (DIAL) FOR INTEGER STEP COSTS 0..C: A QUEUED g IS NEVER MORE THAN C ABOVE
+# THE ONE BEING POPPED, SO C + 1 FIFO BUCKETS INDEXED BY g MOD (C + 1) HOLD THE WHOLE FRONTIER AND PUSH
+# AND POP ARE O(1); EACH BUCKET IS FIFO, SO THE EXPANSION ORDER IS THAT OF THE HEAP WITH (g, SEQ) ENTRIES
+# AND THE PATH AND NODE COUNT MATCH BEST_FIRST_SEARCH WITH f = g; UNIT COSTS OVER THE CSR ARE PLAIN BFS
+def dial_search(problem: Problem, on_step: Callable[[dict], None] | None = None) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+
+    max_cost = problem.max_step_cost()
+    if max_cost is None:
+        raise ValueError("Dial's algorithm needs a problem with integer step costs")
+
+    # FAST PATH: BREADTH-FIRST SEARCH OVER INTEGER CELL IDS
+    if on_step is None:
+        maze = csr_maze(problem)
+        if maze is not None:
+            return breadth_first_search_csr(problem, maze)
+
+    pool = NodePool()
+    root = pool.add(problem.initial, NO_PARENT, None, 0.0)
+    states, g_of = pool.states, pool.g
+    # BUCKETS ARE CREATED ON FIRST USE (LONG CORRIDORS MAKE C LARGE, MOST BUCKETS STAY EMPTY)
+    num_buckets = max_cost + 1
+    buckets = [None] * num_buckets
+    buckets[0] = deque([root])
+    queued = 1
+    reached = {problem.initial: root}
+    nodes_expanded = 0
+    g = 0
+
+    while queued:
+        bucket = buckets[g % num_buckets]
+        if not bucket:
+            g += 1
+            continue
+        i = bucket.popleft()
+        queued -= 1
+        state = states[i]
+        # STALE ENTRY: THE STATE WAS QUEUED AGAIN WITH A SMALLER g
+        if reached[state] != i:
+            continue
+        if on_step:
+            on_step(search_event(POP, state, nodes_expanded))
+        if problem.is_goal(state):
+            return pool.node(i), nodes_expanded
+
+        for action in problem.actions(state):
+            s2 = problem.result(state, action)
+            cost = problem.action_cost(state, action, s2)
+            if not 0 <= cost <= max_cost or cost != int(cost):
+                raise ValueError(f"Step cost {cost} is not an integer in [0, {max_cost}]")
+            g2 = g + int(cost)
+            existing = reached.get(s2)
+            if existing is None or g2 < g_of[existing]:
+                j = pool.add(s2, i, action, float(g2))
+                reached[s2] = j
+                slot = g2 % num_buckets
+                if buckets[slot] is None:
+                    buckets[slot] = deque()
+                buckets[slot].append(j)
+                queued += 1
+                nodes_expanded += 1
+
+                # EMIT A PUSH (OR IMPROVE) EVENT FOR THE CHILD
+                if on_step:
+                    on_step(search_event(PUSH if existing is None else IMPROVE, s2, nodes_expanded))
+    return None
+
+
+# BREADTH-FIRST SEARCH OVER INTEGER CELL IDS: DIAL WITH UNIT COSTS IS A SINGLE FIFO QUEUE
+# THE GOAL IS TESTED WHEN POPPED, SO THE NODE COUNT MATCHES BEST_FIRST_SEARCH WITH f = g
+def breadth_first_search_csr(problem: Problem, maze) -> Optional[Tuple[Node, int]]:
+    indptr, indices = csr_views(maze)
+    start = maze.cell_id(problem.initial)
+    goal = maze.cell_id(problem.goal)
+
+    queue = deque([start])
+    popleft, append = queue.popleft, queue.append
+    parent = {start: -1}
+    nodes_expanded = 0
+
+    while queue:
+        u = popleft()
+        if u == goal:
+            return node_from_ids(maze, ids_from_parents(parent, u)), nodes_expanded
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if v not in parent:
+                parent[v] = u
+                append(v)
+                nodes_expanded += 1
+    return None
@@ -3,19 +3,31 @@ from typing import Optional, Tuple, Callable
 
 # INTERNAL PROJECT IMPORTS
 # CORE
+from core.bitboard import BITBOARD_MAX_CELLS
+from core.corridor_problem import CorridorProblem
+from core.maze_problem import MazeProblem
 from core.problem import Problem
 from core.node import Node
 
 # SEARCH
 from search.measure_time_memory import measure_time_memory
+from search.integer_states import csr_maze
 
 # UNINFORMED SEARCH
 from uninformed.best_first_search import best_first_search, reconstruct_path
+from uninformed.bitboard_search import bitboard_search
+from uninformed.dial_search import dial_search
+from uninformed.wavefront_search import wavefront_search
 
 # DIJKSTRA SEARCH COMPUTATION FUNCTION
 def compute_dijkstra(problem: Problem):
-    # MEASURE TIME AND MEMORY FOR DIJKSTRA SEARCH
-    result, elapsed_time, memory_used, current, peak = measure_time_memory(dijkstra, problem)
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    # MEASURE TIME AND MEMORY FOR DIJKSTRA SEARCH (HEAP ENGINE: ITS NODES EXPANDED MATCH THE OTHER MENUS)
+    result, elapsed_time, memory_used, current, peak = measure_time_memory(dijkstra, problem, engine='heap')
 
     # CHECK IF SEARCH RETURNED NONE
     if result is None:
@@ -35,7 +47,62 @@ def compute_dijkstra(problem: Problem):
         print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
 
 
+# DIJKSTRA ON THE CORRIDOR-CONTRACTED GRAPH: EVERY CHAIN OF DEGREE-2 CELLS IS ONE WEIGHTED EDGE, SO ONLY
+# JUNCTIONS ARE EXPANDED; THE PATH PRINTED IS UNPACKED BACK TO CELLS
+def compute_corridor_dijkstra(problem: MazeProblem):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    corridor_problem = CorridorProblem(problem.maze, problem.start, problem.goal)
+    graph = corridor_problem.graph
+    print(f"Junctions: {len(graph)} ({graph.contracted_cells} corridor cells contracted, "
+          f"{graph.pruned_cells} dead-end cells pruned)")
+    compute_dijkstra(corridor_problem)
+
+
+# ENGINES DIJKSTRA CAN RUN ON: 'heap' IS THE PLAIN BEST-FIRST SEARCH WITH f = g, THE ONE WHOSE NODES
+# EXPANDED COMPARE WITH THE OTHER BEST-FIRST ENGINES; 'auto' PICKS THE FASTEST FOR THE PROBLEM
+DIJKSTRA_ENGINES = ('auto', 'heap', 'dial', 'wavefront', 'bitboard')
+
+
+# ENGINE 'auto' RESOLVES TO: A PLAIN UNIT-COST MAZE GOES TO THE BITBOARD BFS WHEN SMALL AND TO THE NUMPY
+# WAVEFRONT OTHERWISE (NO SEARCH EVENTS IN EITHER), OTHER INTEGER STEP COSTS TO THE BUCKET QUEUE
+# THE FAST ENGINES COUNT NODES EXPANDED THEIR OWN WAY (CELLS REACHED, BUCKET POPS), SO A REPORT SHOULD
+# NAME THE ENGINE IT MEASURED
+def dijkstra_engine(problem: Problem, on_step: Callable[[dict], None] | None = None) -> str:
+    maze = csr_maze(problem) if on_step is None else None
+    if maze is not None:
+        return 'bitboard' if maze.H * maze.W <= BITBOARD_MAX_CELLS else 'wavefront'
+    if problem.max_step_cost() is not None:
+        return 'dial'
+    return 'heap'
+
+
 # DIJKSTRA SEARCH CORE FUNCTION
-def dijkstra(problem: Problem, on_step: Callable[[dict], None] | None = None) -> Optional[Tuple[Node, int]]:
+# AN EXPLICIT FRONTIER ('lazy' OR 'indexed') ALWAYS RUNS THE HEAP ENGINE
+# SO DOES AN EXPLICIT TIE_BREAK: ONLY ITS PRIORITY QUEUE HAS TIES TO BREAK (DEFAULT THERE IS 'fifo')
+def dijkstra(problem: Problem, on_step: Callable[[dict], None] | None = None,
+             frontier=None, engine: str = 'auto', tie_break: Optional[str] = None,
+             tie_break_seed: Optional[int] = None) -> Optional[Tuple[Node, int]]:
+    if engine not in DIJKSTRA_ENGINES:
+        raise ValueError(f"Unknown Dijkstra engine '{engine}', expected one of {list(DIJKSTRA_ENGINES)}")
+    if engine == 'auto':
+        engine = 'heap' if frontier is not None or tie_break is not None else dijkstra_engine(problem, on_step)
+    elif frontier is not None and engine != 'heap':
+        raise ValueError(f"A frontier only applies to the heap engine, not '{engine}'")
+    elif tie_break is not None and engine != 'heap':
+        raise ValueError(f"A tie-breaking policy only applies to the heap engine, not '{engine}'")
+    if on_step is not None and engine in ('wavefront', 'bitboard'):
+        raise ValueError(f"The {engine} engine emits no search events")
+
+    if engine == 'bitboard':
+        return bitboard_search(problem)
+    if engine == 'wavefront':
+        return wavefront_search(problem)
+    if engine == 'dial':
+        return dial_search(problem, on_step=on_step)
     # CALL BEST-FIRST SEARCH WITH f(n) = g(n) (COST SO FAR)
-    return best_first_search(problem, f=lambda n: n.g, on_step=on_step)
+    return best_first_search(problem, f=lambda n: n.g, on_step=on_step, frontier=frontier or 'lazy',
+                             tie_break=tie_break or 'fifo', tie_break_seed=tie_break_seed)
@@ -9,6 +9,7 @@ import tempfile
 from core.maze_representation import Maze
 from core.maze_problem import MazeProblem
 from core.problem import Problem
+from core.search_events import SearchTrace
 
 # UNINFORMED SEARCH
 from uninformed.bidirectional_best_first_search import bidirectional_best_first_search
@@ -19,18 +20,6 @@ from uninformed.best_first_search import reconstruct_path
 from search import visualize_matrix
 
 
-# COLLECT ALL NODES FROM SNAPSHOTS FOR VISUALIZATION
-def _collect_tree_nodes(snapshots):
-    nodes = set()
-    for snap in snapshots:
-        if snap.get('reached'):
-            nodes.update(tuple(state) for state in snap['reached'])
-        for key in ('reached_F', 'reached_B'):
-            if key in snap:
-                nodes.update(tuple(state) for state in snap[key])
-    return nodes
-
-
 # GENERATE GIF FOR UNINFORMED SEARCH ALGORITHMS (DIJKSTRA OR BIDIRECTIONAL)
 def generate_gifs_uninformed(
     problem: Problem,
@@ -39,16 +28,13 @@ def generate_gifs_uninformed(
     interval_ms: int = 100,
     out_file: str | Path | None = None
 ) -> str | None:
-    # COLLECT SNAPSHOTS DURING SEARCH
-    snapshots = []
-
-    def on_step(snapshot):
-        snapshots.append(snapshot.copy())
+    # RECORD THE SEARCH EVENTS (THE TRACE IS THE ON_STEP CALLBACK)
+    trace = SearchTrace()
 
     result = None
     if algorithm.lower() == 'dijkstra':
         # RUN DIJKSTRA AND RECORD SNAPSHOTS
-        result = dijkstra(problem, on_step=on_step)
+        result = dijkstra(problem, on_step=trace)
 
     elif algorithm.lower() == 'bidirectional':
         # PREPARE REVERSED MAZE FOR BIDIRECTIONAL SEARCH
@@ -66,7 +52,7 @@ def generate_gifs_uninformed(
             f_F=lambda n: n.g,
             problem_B=problem_2,
             f_B=lambda n: n.g,
-            on_step=on_step
+            on_step=trace
         )
     else:
         print(f"Algoritmo desconhecido: {algorithm}")
@@ -79,8 +65,8 @@ def generate_gifs_uninformed(
         
     solution, _ = result
 
-    # CHECK IF ANY SNAPSHOTS WERE PRODUCED
-    if not snapshots:
+    # CHECK IF ANY EVENTS WERE RECORDED
+    if not trace.events:
         print(f'{algorithm.capitalize()}: Nenhum snapshot produzido para visualização.')
         return None
 
@@ -98,9 +84,9 @@ def generate_gifs_uninformed(
             f=lambda n: n.g,
             interval=interval_ms,
             precompute=True,
-            precomputed_snapshots=snapshots,
+            precomputed_trace=trace,
             final_path=reconstruct_path(solution) if solution else None,
-            tree_nodes=_collect_tree_nodes(snapshots),
+            tree_nodes=trace.tree_nodes(),
             final_hold_ms=5000,
             out_file=str(out_file),
         )
@@ -0,0 +1,179 @@
+# EXTERNAL IMPORTS
+import multiprocessing as mp
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+import numpy as np
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.problem import Problem
+from core.node import Node
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import csr_maze, node_from_ids
+
+# UNINFORMED SEARCH
+from uninformed.best_first_search import reconstruct_path
+from uninformed.bidirectional_best_first_search import bidirectional_best_first_search
+
+# g OF A CELL NOT REACHED YET (THE g ARRAYS ARE INT32: THE GRID IS UNIT-COST)
+UNSET = -1
+
+# "NO VALUE YET" IN THE CONTROL BLOCK (TOPS OF FINISHED SIDES, PATH COSTS NOT FOUND)
+NONE_FOUND = 1 << 62
+
+# CONTROL BLOCK SLOTS (INT64): CURRENT LEVEL OF EACH SIDE, BEST MEETING SEEN BY EACH SIDE,
+# STOP FLAG, NODES PUSHED BY EACH SIDE
+TOP_F, TOP_B, BEST_F, BEST_B, STOP, PUSHES_F, PUSHES_B = range(7)
+
+
+# COMPUTES PARALLEL BIDIRECTIONAL SEARCH (ONE PROCESS PER DIRECTION)
+def compute_parallel_bidirectional_search(problem: Problem):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    result, elapsed_time, memory_used, current, peak = measure_time_memory(parallel_bidirectional_search, problem)
+
+    if result is None:
+        print("No path found")
+        return
+
+    solution, nodes_expanded = result
+
+    if solution:
+        print("Path:", reconstruct_path(solution))
+        print("Number of nodes expanded:", nodes_expanded)
+        print("Cost of path:", solution.g)
+        print(f"Time taken: {elapsed_time:.3f} milliseconds")
+        print(f"Memory used: {memory_used:.12f} B")
+        print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
+
+
+# ONE DIRECTION, RUN IN ITS OWN PROCESS: BREADTH-FIRST LEVELS FROM START (SIDE 0 = FORWARD, 1 = BACKWARD)
+# g AND PARENT GO STRAIGHT INTO THE SHARED ARRAYS; EVERY NEWLY REACHED CELL IS CHECKED AGAINST THE OTHER
+# SIDE'S g, AND BEFORE EACH LEVEL THE SIDE STOPS (FOR BOTH) ONCE LEVEL_F + LEVEL_B >= THE BEST MEETING
+def _search_side(names: List[str], start: int, side: int):
+    blocks = [SharedMemory(name=name) for name in names]
+    try:
+        indptr, indices, g_F, g_B, parent_F, parent_B = (memoryview(b.buf).cast('i') for b in blocks[:6])
+        control = memoryview(blocks[6].buf).cast('q')
+        g_own, g_other, parent = (g_F, g_B, parent_F) if side == 0 else (g_B, g_F, parent_B)
+        top, top_other = (TOP_F, TOP_B) if side == 0 else (TOP_B, TOP_F)
+        best_own, best_other = (BEST_F, BEST_B) if side == 0 else (BEST_B, BEST_F)
+
+        g_own[start] = 0
+        parent[start] = -1
+        level = [start]
+        depth = 0
+        best = NONE_FOUND
+        pushes = 0
+        while level and not control[STOP]:
+            # PUBLISHED LEVELS ONLY GROW, SO A STALE READ OF THE OTHER ONE ONLY DELAYS THE STOP
+            control[top] = depth
+            if depth + control[top_other] >= min(best, control[best_other]):
+                control[STOP] = 1
+                break
+            depth += 1
+            next_level = []
+            for u in level:
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    if g_own[v] == UNSET:
+                        g_own[v] = depth
+                        parent[v] = u
+                        next_level.append(v)
+                        pushes += 1
+                        other = g_other[v]
+                        if other != UNSET and depth + other < best:
+                            best = depth + other
+                            control[best_own] = best
+            level = next_level
+        # A FINISHED SIDE NO LONGER BOUNDS THE OTHER ONE
+        if not level:
+            control[top] = NONE_FOUND
+        control[PUSHES_F if side == 0 else PUSHES_B] = pushes
+        for view in (indptr, indices, g_F, g_B, parent_F, parent_B, control):
+            view.release()
+    finally:
+        for b in blocks:
+            b.close()
+
+
+# BIDIRECTIONAL UNIFORM-COST SEARCH WITH THE FORWARD AND BACKWARD HALVES IN TWO PROCESSES
+# BOTH SIDES SHARE THE CSR ADJACENCY, THEIR g AND PARENT ARRAYS AND A SMALL CONTROL BLOCK (SHARED MEMORY)
+# THE PATH GOES THROUGH THE CELL WITH THE SMALLEST g_F + g_B ONCE BOTH ARE DONE, WHICH IS OPTIMAL EVEN
+# IF A MEETING WAS MISSED WHILE THE TWO SIDES WROTE THE SAME CELL AT THE SAME TIME
+# PROBLEMS WITHOUT A CSR MAZE FALL BACK TO THE SEQUENTIAL BIDIRECTIONAL_BEST_FIRST_SEARCH
+def parallel_bidirectional_search(problem: Problem) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+
+    maze = csr_maze(problem)
+    if maze is None:
+        problem_B = type(problem)(problem.maze, problem.goal, problem.initial)
+        return bidirectional_best_first_search(problem, lambda n: n.g, problem_B, lambda n: n.g)
+
+    start = maze.cell_id(problem.initial)
+    goal = maze.cell_id(problem.goal)
+    if start == goal:
+        return node_from_ids(maze, [start]), 0
+
+    indptr, indices = maze.adjacency()
+    sizes = [indptr.nbytes, max(indices.nbytes, 4)] + [maze.H * maze.W * 4] * 4 + [8 * 7]
+    blocks = [SharedMemory(create=True, size=size) for size in sizes]
+    try:
+        return _run(maze, blocks, sizes, start, goal)
+    finally:
+        for b in blocks:
+            b.unlink()
+            b.close()
+
+
+# FILLS THE SHARED BLOCKS, RUNS BOTH SIDES AND JOINS THEIR HALVES OF THE PATH
+# (THE NUMPY VIEWS LIVE ONLY IN THIS FRAME, SO THE BLOCKS CAN BE CLOSED AFTERWARDS)
+def _run(maze, blocks: List[SharedMemory], sizes: List[int], start: int, goal: int) -> Optional[Tuple[Node, int]]:
+    indptr, indices = maze.adjacency()
+    arrays = [np.ndarray(size // 4, dtype=np.int32, buffer=b.buf) for b, size in zip(blocks[:6], sizes)]
+    arrays[0][:] = indptr
+    arrays[1][:indices.size] = indices
+    for a in arrays[2:]:
+        a.fill(UNSET)
+    control = np.ndarray(7, dtype=np.int64, buffer=blocks[6].buf)
+    control[:] = [0, 0, NONE_FOUND, NONE_FOUND, 0, 0, 0]
+
+    names = [b.name for b in blocks]
+    workers = [mp.Process(target=_search_side, args=(names, s, side))
+               for side, s in enumerate((start, goal))]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    if any(w.exitcode != 0 for w in workers):
+        raise RuntimeError("A search process failed")
+
+    g_F, g_B, parent_F, parent_B = arrays[2:]
+    both = (g_F != UNSET) & (g_B != UNSET)
+    if not both.any():
+        return None
+    total = np.where(both, g_F.astype(np.int64) + g_B, NONE_FOUND)
+    meet = int(np.argmin(total))
+
+    forward = _walk(parent_F, meet)
+    forward.reverse()
+    backward = _walk(parent_B, meet)
+    nodes_expanded = int(control[PUSHES_F] + control[PUSHES_B])
+    return node_from_ids(maze, forward + backward[1:]), nodes_expanded
+
+
+# CELL IDS FROM A CELL BACK TO THE ROOT OF ITS SEARCH, FOLLOWING A SHARED PARENT ARRAY
+def _walk(parent: np.ndarray, i: int) -> List[int]:
+    ids = []
+    while i != -1:
+        ids.append(i)
+        i = int(parent[i])
+    return ids
+
@@ -11,6 +11,7 @@ from uninformed.dijkstra import dijkstra
 # CORE
 from core.maze_problem import MazeProblem
 from core.maze_representation import Maze
+from core.maze_generator import iter_mazes_from_file
 
 # SEARCH
 from search.measure_time_memory import measure_time_memory
@@ -21,8 +22,8 @@ from comparisons.uninformed_plots import plot_uninformed_metrics
 # UNINFORMED SEARCH
 from uninformed.best_first_search import best_first_search
 
-# COMPARE DIJKSTRA AND BIDIRECTIONAL BEST-FIRST SEARCH
-def compare_uninformed_search_algorithms(matrix):
+# COMPARE DIJKSTRA AND BIDIRECTIONAL BEST-FIRST SEARCH (SAVE=FALSE SKIPS THE JSON AND PLOTS)
+def compare_uninformed_search_algorithms(matrix, save: bool = True):
     # PREPARE MAZE AND PROBLEM
     mz = Maze(matrix)
     problem = MazeProblem(mz)
@@ -66,8 +67,9 @@ def compare_uninformed_search_algorithms(matrix):
 
     # LOOP TO COLLECT METRICS (15 TIMES)
     for _ in range(15):
-        # --- DIJKSTRA ---
-        result_dij, elapsed_time_dij, memory_used_dij, current_dij, peak_dij = measure_time_memory(dijkstra, problem)
+        # --- DIJKSTRA (HEAP ENGINE, SO ITS NODES EXPANDED COUNT LIKE THE BIDIRECTIONAL ONES) ---
+        result_dij, elapsed_time_dij, memory_used_dij, current_dij, peak_dij = measure_time_memory(
+            dijkstra, problem, engine='heap')
         if result_dij is not None:
             solution, nodes_expanded_dij = result_dij
             dijkstra_total_path_found += 1
@@ -124,6 +126,9 @@ def compare_uninformed_search_algorithms(matrix):
         'Bidirectional avg cost': f"{avg_bid_bfs_costs:.3f}",
     }
 
+    if not save:
+        return metrics
+
     output_filename = '././data/output/metrics/metrics_uninformed.json'
 
     with open(output_filename, 'w', encoding='utf-8') as f:
@@ -141,3 +146,12 @@ def compare_uninformed_search_algorithms(matrix):
         print("EXAMPLE METRICS JSON NOT FOUND:", example_path)
 
     return metrics
+
+
+# COMPARES THE ALGORITHMS ON EVERY MAZE OF A COLLECTION FILE, STREAMING ONE MAZE AT A TIME
+# MAZES WHOSE G IS NOT CONNECTED TO S ARE SKIPPED (THEIR INDEX K IS NOT YIELDED)
+def compare_uninformed_search_collection(file_path: str):
+    for k, maze in enumerate(iter_mazes_from_file(file_path)):
+        if not maze.connected(maze.start, maze.goal):
+            continue
+        yield k, compare_uninformed_search_algorithms(maze.grid, save=False)
@@ -0,0 +1,62 @@
+# EXTERNAL IMPORTS
+from typing import Optional, Tuple
+
+# INTERNAL PROJECT IMPORTS
+# CORE
+from core.distance_field import wavefront_fields, wavefront_path
+from core.problem import Problem
+from core.node import Node
+
+# SEARCH
+from search.measure_time_memory import measure_time_memory
+from search.integer_states import csr_maze, node_from_ids
+
+# UNINFORMED SEARCH
+from uninformed.best_first_search import reconstruct_path
+from uninformed.dial_search import dial_search
+
+
+# COMPUTES THE NUMPY WAVEFRONT SEARCH
+def compute_wavefront_search(problem: Problem):
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: NOTHING TO MEASURE
+    if problem.unreachable():
+        print("No path found")
+        return
+
+    result, elapsed_time, memory_used, current, peak = measure_time_memory(wavefront_search, problem)
+
+    if result is None:
+        print("No path found")
+        return
+
+    goal_node, nodes_expanded = result
+
+    if goal_node:
+        print("Path:", reconstruct_path(goal_node))
+        print("Number of nodes expanded:", nodes_expanded)
+        print("Cost of path:", goal_node.g)
+        print(f"Time taken: {elapsed_time:.3f} milliseconds")
+        print(f"Memory used: {memory_used:.12f} B")
+        print(f"Current memory usage: {current / 1024:.3f} KB; Peak: {peak / 1024:.3f} KB")
+
+
+# UNIT-COST SHORTEST PATH AS A NUMPY BFS WAVEFRONT FROM S THAT STOPS AT THE LEVEL REACHING G; THE PATH
+# IS READ BACK FROM THE PARENT-DIRECTION FIELD. NODES EXPANDED COUNTS THE CELLS REACHED (THE WHOLE LAST
+# LEVEL INCLUDED); EQUAL-COST PATHS MAY BREAK TIES DIFFERENTLY FROM THE QUEUE-BASED ENGINES
+# PROBLEMS WITHOUT A PLAIN IN-MEMORY MAZE GO TO DIAL_SEARCH
+def wavefront_search(problem: Problem) -> Optional[Tuple[Node, int]]:
+    # S AND G IN DIFFERENT CONNECTED COMPONENTS: ANSWER WITHOUT SEARCHING
+    if problem.unreachable():
+        return None
+
+    maze = csr_maze(problem)
+    if maze is None:
+        return dial_search(problem)
+
+    start = maze.cell_id(problem.initial)
+    goal = maze.cell_id(problem.goal)
+    dist, parent_dir = wavefront_fields(maze, [start], target=goal)
+    if dist[goal] < 0:
+        return None
+    nodes_expanded = int((dist > 0).sum())
+    return node_from_ids(maze, wavefront_path(maze, parent_dir, goal)), nodes_expanded